@@ -11,6 +11,7 @@ import time
 from typing import Any, cast
 
 import jwt
+from lru import LRU
 
 from homeassistant import data_entry_flow
 from homeassistant.core import (
@@ -34,6 +35,9 @@ EVENT_USER_ADDED = "user_added"
 EVENT_USER_UPDATED = "user_updated"
 EVENT_USER_REMOVED = "user_removed"
 
+ACCESS_TOKEN_LEEWAY = 10
+VALIDATED_ACCESS_TOKEN_CACHE_SIZE = 256
+
 type _MfaModuleDict = dict[str, MultiFactorAuthModule]
 type _ProviderKey = tuple[str, str | None]
 type _ProviderDict = dict[_ProviderKey, AuthProvider]
@@ -184,6 +188,10 @@ class AuthManager:
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
         self._revoke_callbacks: dict[str, set[CALLBACK_TYPE]] = {}
+        # access token -> refresh token and the time the access token expires
+        self._validated_access_tokens: LRU[str, tuple[models.RefreshToken, float]] = (
+            LRU(VALIDATED_ACCESS_TOKEN_CACHE_SIZE)
+        )
         self._expire_callback: CALLBACK_TYPE | None = None
         self._remove_expired_job = HassJob(
             self._async_remove_expired_refresh_tokens, job_type=HassJobType.Callback
@@ -647,6 +655,18 @@ class AuthManager:
     @callback
     def async_validate_access_token(self, token: str) -> models.RefreshToken | None:
         """Return refresh token if an access token is valid."""
+        if (validated := self._validated_access_tokens.get(token)) is not None:
+            refresh_token, valid_until = validated
+            # The refresh token must still be stored, a revoked one is gone
+            if (
+                time.time() < valid_until
+                and self._store.async_get_refresh_token(refresh_token.id)
+                is refresh_token
+                and refresh_token.user.is_active
+            ):
+                return refresh_token
+            del self._validated_access_tokens[token]
+
         try:
             unverif_claims = jwt_wrapper.unverified_hs256_token_decode(token)
         except jwt.InvalidTokenError:
@@ -664,8 +684,12 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt_wrapper.verify_and_decode(
-                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            claims = jwt_wrapper.verify_and_decode(
+                token,
+                jwt_key,
+                leeway=ACCESS_TOKEN_LEEWAY,
+                issuer=issuer,
+                algorithms=["HS256"],
             )
         except jwt.InvalidTokenError:
             return None
@@ -673,6 +697,10 @@ class AuthManager:
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        self._validated_access_tokens[token] = (
+            refresh_token,
+            claims["exp"] + ACCESS_TOKEN_LEEWAY,
+        )
         return refresh_token
 
     @callback
@@ -97,6 +97,7 @@ async def async_pipeline_from_audio_stream(
     device_id: str | None = None,
     start_stage: PipelineStage = PipelineStage.STT,
     end_stage: PipelineStage = PipelineStage.TTS,
+    measure_latency: bool = False,
 ) -> None:
     """Create an audio pipeline from an audio stream.
 
@@ -118,6 +119,7 @@ async def async_pipeline_from_audio_stream(
             tts_audio_output=tts_audio_output,
             wake_word_settings=wake_word_settings,
             audio_settings=audio_settings or AudioSettings(),
+            measure_latency=measure_latency,
         ),
     )
     await pipeline_input.validate()
@@ -6,8 +6,9 @@ import array
 import asyncio
 from collections import defaultdict, deque
 from collections.abc import AsyncGenerator, AsyncIterable, Callable
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, replace
 from enum import StrEnum
+from functools import lru_cache
 import logging
 from pathlib import Path
 from queue import Empty, Queue
@@ -381,6 +382,15 @@ class PipelineEvent:
 
 type PipelineEventCallback = Callable[[PipelineEvent], None]
 
+# Maps events which end a stage to the event which started it
+_STAGE_START_EVENTS: Final = {
+    PipelineEventType.RUN_END: PipelineEventType.RUN_START,
+    PipelineEventType.WAKE_WORD_END: PipelineEventType.WAKE_WORD_START,
+    PipelineEventType.STT_END: PipelineEventType.STT_START,
+    PipelineEventType.INTENT_END: PipelineEventType.INTENT_START,
+    PipelineEventType.TTS_END: PipelineEventType.TTS_START,
+}
+
 
 @dataclass(frozen=True)
 class Pipeline:
@@ -557,6 +567,8 @@ class PipelineRun:
     tts_audio_output: str | None = None
     wake_word_settings: WakeWordSettings | None = None
     audio_settings: AudioSettings = field(default_factory=AudioSettings)
+    measure_latency: bool = False
+    """Add the processing time in seconds to events which end a stage"""
 
     id: str = field(default_factory=ulid_util.ulid_now)
     stt_provider: stt.SpeechToTextEntity | stt.Provider = field(init=False, repr=False)
@@ -582,6 +594,11 @@ class PipelineRun:
     _device_id: str | None = None
     """Optional device id set during run start."""
 
+    _event_times: dict[PipelineEventType, float] = field(
+        init=False, default_factory=dict, repr=False
+    )
+    """Monotonic time of events which start a stage."""
+
     def __post_init__(self) -> None:
         """Set language for pipeline."""
         self.language = self.pipeline.language or self.hass.config.language
@@ -624,6 +641,8 @@ class PipelineRun:
     @callback
     def process_event(self, event: PipelineEvent) -> None:
         """Log an event and call listener."""
+        if self.measure_latency:
+            event = self._add_processing_time(event)
         self.event_callback(event)
         pipeline_data: PipelineData = self.hass.data[DOMAIN]
         if self.id not in pipeline_data.pipeline_debug[self.pipeline.id]:
@@ -631,6 +650,19 @@ class PipelineRun:
             return
         pipeline_data.pipeline_debug[self.pipeline.id][self.id].events.append(event)
 
+    def _add_processing_time(self, event: PipelineEvent) -> PipelineEvent:
+        """Add the time since the start of the stage to an event ending it."""
+        now = time.monotonic()
+        if (start_type := _STAGE_START_EVENTS.get(event.type)) is None:
+            self._event_times[event.type] = now
+            return event
+        if (started := self._event_times.get(start_type)) is None:
+            return event
+        return replace(
+            event,
+            data={**(event.data or {}), "processing_time": round(now - started, 3)},
+        )
+
     def start(self, device_id: str | None) -> None:
         """Emit run start event."""
         self._device_id = device_id
@@ -1286,16 +1318,27 @@ class PipelineRun:
                 timestamp_ms += ms_per_chunk
 
 
-def _multiply_volume(chunk: bytes, volume_multiplier: float) -> bytes:
-    """Multiplies 16-bit PCM samples by a constant."""
+@lru_cache(maxsize=8)
+def _volume_table(volume_multiplier: float) -> array.array[int]:
+    """Return the multiplied and clamped samples indexed by the unsigned sample."""
+    return array.array(
+        "h",
+        [
+            max(-32768, min(32767, int(value * volume_multiplier)))
+            for value in (*range(32768), *range(-32768, 0))
+        ],
+    )
 
-    def _clamp(val: float) -> float:
-        """Clamp to signed 16-bit."""
-        return max(-32768, min(32767, val))
 
+def _multiply_volume(chunk: bytes, volume_multiplier: float) -> bytes:
+    """Multiplies 16-bit PCM samples by a constant, clamping to signed 16-bit.
+
+    The samples are read through a memoryview of the chunk and looked up in
+    a table of the multiplied samples, without a Python call per sample.
+    """
     return array.array(
         "h",
-        (int(_clamp(value * volume_multiplier)) for value in array.array("h", chunk)),
+        map(_volume_table(volume_multiplier).__getitem__, memoryview(chunk).cast("H")),
     ).tobytes()
 
 
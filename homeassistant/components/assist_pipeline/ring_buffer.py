@@ -28,8 +28,10 @@ class RingBuffer:
         """Return the length of data stored in the buffer."""
         return self._length
 
-    def put(self, data: bytes) -> None:
+    def put(self, data: bytes | memoryview) -> None:
         """Put a chunk of data into the buffer, possibly wrapping around."""
+        # Slice through a memoryview so the data is only copied once
+        data = memoryview(data)
         data_len = len(data)
         new_pos = self._pos + data_len
         if new_pos >= self._maxlen:
@@ -51,7 +53,8 @@ class RingBuffer:
         """Get bytes written to the buffer."""
         if (self._pos + self._length) <= self._maxlen:
             # Single chunk
-            return bytes(self._buffer[: self._length])
+            return bytes(memoryview(self._buffer)[: self._length])
 
         # Two chunks
-        return bytes(self._buffer[self._pos :] + self._buffer[: self._pos])
+        with memoryview(self._buffer) as buffer:
+            return b"".join((buffer[self._pos :], buffer[: self._pos]))
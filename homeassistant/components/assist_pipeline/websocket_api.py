@@ -73,6 +73,7 @@ def async_register_websocket_api(hass: HomeAssistant) -> None:
                 vol.Optional("conversation_id"): vol.Any(str, None),
                 vol.Optional("device_id"): vol.Any(str, None),
                 vol.Optional("timeout"): vol.Any(float, int),
+                vol.Optional("measure_latency"): bool,
             },
         ),
         cv.key_value_schemas(
@@ -228,6 +229,7 @@ async def websocket_run(
         },
         wake_word_settings=wake_word_settings,
         audio_settings=audio_settings or AudioSettings(),
+        measure_latency=msg.get("measure_latency", False),
     )
 
     pipeline_input = PipelineInput(**input_args)
@@ -14,6 +14,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.trace import async_remove_trace_sampler
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -55,7 +56,7 @@ from homeassistant.exceptions import (
     ServiceNotFound,
     TemplateError,
 )
-from homeassistant.helpers import condition
+from homeassistant.helpers import condition, reference_graph
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.deprecation import (
     DeprecatedConstant,
@@ -70,6 +71,7 @@ from homeassistant.helpers.issue_registry import (
     async_create_issue,
     async_delete_issue,
 )
+from homeassistant.helpers.reference_graph import ReferenceType
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -89,6 +91,7 @@ from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_set,
     trace_append_element,
+    trace_disabled_cv,
     trace_get,
     trace_path,
 )
@@ -165,19 +168,12 @@ def is_on(hass: HomeAssistant, entity_id: str) -> bool:
 
 
 def _automations_with_x(
-    hass: HomeAssistant, referenced_id: str, property_name: str
+    hass: HomeAssistant, referenced_id: str, reference_type: ReferenceType
 ) -> list[str]:
     """Return all automations that reference the x."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component: EntityComponent[BaseAutomationEntity] = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if referenced_id in getattr(automation_entity, property_name)
-    ]
+    return reference_graph.async_get(hass).async_get_referencing(
+        DOMAIN, reference_type, referenced_id
+    )
 
 
 def _x_in_automation(
@@ -198,7 +194,7 @@ def _x_in_automation(
 @callback
 def automations_with_entity(hass: HomeAssistant, entity_id: str) -> list[str]:
     """Return all automations that reference the entity."""
-    return _automations_with_x(hass, entity_id, "referenced_entities")
+    return _automations_with_x(hass, entity_id, ReferenceType.ENTITY)
 
 
 @callback
@@ -210,7 +206,7 @@ def entities_in_automation(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def automations_with_device(hass: HomeAssistant, device_id: str) -> list[str]:
     """Return all automations that reference the device."""
-    return _automations_with_x(hass, device_id, "referenced_devices")
+    return _automations_with_x(hass, device_id, ReferenceType.DEVICE)
 
 
 @callback
@@ -222,7 +218,7 @@ def devices_in_automation(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def automations_with_area(hass: HomeAssistant, area_id: str) -> list[str]:
     """Return all automations that reference the area."""
-    return _automations_with_x(hass, area_id, "referenced_areas")
+    return _automations_with_x(hass, area_id, ReferenceType.AREA)
 
 
 @callback
@@ -234,7 +230,7 @@ def areas_in_automation(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def automations_with_floor(hass: HomeAssistant, floor_id: str) -> list[str]:
     """Return all automations that reference the floor."""
-    return _automations_with_x(hass, floor_id, "referenced_floors")
+    return _automations_with_x(hass, floor_id, ReferenceType.FLOOR)
 
 
 @callback
@@ -246,7 +242,7 @@ def floors_in_automation(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def automations_with_label(hass: HomeAssistant, label_id: str) -> list[str]:
     """Return all automations that reference the label."""
-    return _automations_with_x(hass, label_id, "referenced_labels")
+    return _automations_with_x(hass, label_id, ReferenceType.LABEL)
 
 
 @callback
@@ -258,16 +254,7 @@ def labels_in_automation(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def automations_with_blueprint(hass: HomeAssistant, blueprint_path: str) -> list[str]:
     """Return all automations that reference the blueprint."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component: EntityComponent[BaseAutomationEntity] = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if automation_entity.referenced_blueprint == blueprint_path
-    ]
+    return _automations_with_x(hass, blueprint_path, ReferenceType.BLUEPRINT)
 
 
 @callback
@@ -406,6 +393,27 @@ class BaseAutomationEntity(ToggleEntity, ABC):
     def referenced_entities(self) -> set[str]:
         """Return a set of referenced entities."""
 
+    async def async_internal_added_to_hass(self) -> None:
+        """Register the references of the automation."""
+        await super().async_internal_added_to_hass()
+        blueprint = self.referenced_blueprint
+        reference_graph.async_get(self.hass).async_set_references(
+            self.entity_id,
+            {
+                ReferenceType.AREA: self.referenced_areas,
+                ReferenceType.BLUEPRINT: (blueprint,) if blueprint else (),
+                ReferenceType.DEVICE: self.referenced_devices,
+                ReferenceType.ENTITY: self.referenced_entities,
+                ReferenceType.FLOOR: self.referenced_floors,
+                ReferenceType.LABEL: self.referenced_labels,
+            },
+        )
+
+    async def async_internal_will_remove_from_hass(self) -> None:
+        """Remove the references of the automation."""
+        await super().async_internal_will_remove_from_hass()
+        reference_graph.async_get(self.hass).async_remove_references(self.entity_id)
+
     @abstractmethod
     async def async_trigger(
         self,
@@ -699,23 +707,26 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
                     variables = self._variables.async_render(self.hass, variables)
                 except TemplateError as err:
                     self._logger.error("Error rendering variables: %s", err)
-                    automation_trace.set_error(err)
+                    if automation_trace is not None:
+                        automation_trace.set_error(err)
                     return None
 
-            # Prepare tracing the automation
-            automation_trace.set_trace(trace_get())
+            # The trace policy may skip tracing this run
+            if automation_trace is not None:
+                # Prepare tracing the automation
+                automation_trace.set_trace(trace_get())
 
-            # Set trigger reason
-            trigger_description = variables.get("trigger", {}).get("description")
-            automation_trace.set_trigger_description(trigger_description)
+                # Set trigger reason
+                trigger_description = variables.get("trigger", {}).get("description")
+                automation_trace.set_trigger_description(trigger_description)
 
-            # Add initial variables as the trigger step
-            if "trigger" in variables and "idx" in variables["trigger"]:
-                trigger_path = f"trigger/{variables['trigger']['idx']}"
-            else:
-                trigger_path = "trigger"
-            trace_element = TraceElement(variables, trigger_path)
-            trace_append_element(trace_element)
+                # Add initial variables as the trigger step
+                if "trigger" in variables and "idx" in variables["trigger"]:
+                    trigger_path = f"trigger/{variables['trigger']['idx']}"
+                else:
+                    trigger_path = "trigger"
+                trace_element = TraceElement(variables, trigger_path)
+                trace_append_element(trace_element)
 
             if (
                 not skip_condition
@@ -771,17 +782,20 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
                         "edit": f"/config/automation/edit/{self.unique_id}",
                     },
                 )
-                automation_trace.set_error(err)
+                if automation_trace is not None:
+                    automation_trace.set_error(err)
             except (vol.Invalid, HomeAssistantError) as err:
                 self._logger.error(
                     "Error while executing automation %s: %s",
                     self.entity_id,
                     err,
                 )
-                automation_trace.set_error(err)
+                if automation_trace is not None:
+                    automation_trace.set_error(err)
             except Exception as err:
                 self._logger.exception("While executing automation %s", self.entity_id)
-                automation_trace.set_error(err)
+                if automation_trace is not None:
+                    automation_trace.set_error(err)
 
             return None
 
@@ -789,6 +803,7 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
         """Remove listeners when removing automation from Home Assistant."""
         await super().async_will_remove_from_hass()
         await self._async_disable()
+        async_remove_trace_sampler(self.hass, f"{DOMAIN}.{self.unique_id}")
 
     async def _async_enable_automation(self, event: Event) -> None:
         """Start automation on startup."""
@@ -1154,10 +1169,15 @@ async def _async_process_if(
             LOGGER.warning("Invalid condition: %s", ex)
             return None
 
+    ordered_checks = condition.cost_ordered_checks(checks)
+
     def if_action(variables: Mapping[str, Any] | None = None) -> bool:
         """AND all conditions."""
         errors: list[ConditionErrorIndex] = []
-        for index, check in enumerate(checks):
+        # Traces list the conditions in the order they are configured
+        for index, check in (
+            ordered_checks if trace_disabled_cv.get() else enumerate(checks)
+        ):
             try:
                 with trace_path(["condition", str(index)]):
                     if check(hass, variables) is False:
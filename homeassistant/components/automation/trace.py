@@ -9,9 +9,12 @@ from typing import Any
 from homeassistant.components.trace import (
     CONF_STORED_TRACES,
     ActionTrace,
+    TracePolicy,
+    async_get_trace_sampler,
     async_store_trace,
 )
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.trace import trace_disable
 from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN
@@ -55,10 +58,22 @@ def trace_automation(
     blueprint_inputs: ConfigType | None,
     context: Context,
     trace_config: ConfigType,
-) -> Generator[AutomationTrace]:
+) -> Generator[AutomationTrace | None]:
     """Trace action execution of automation with automation_id."""
+    sampler = async_get_trace_sampler(hass, f"{DOMAIN}.{automation_id}", trace_config)
+    if not sampler.start_run():
+        # Don't record anything for runs which are not going to be stored
+        trace_disable()
+        yield None
+        return
+
     trace = AutomationTrace(automation_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    stored_traces = trace_config[CONF_STORED_TRACES]
+    # With the errors policy the trace is only stored when the run failed
+    store_on_error = sampler.policy is TracePolicy.ERRORS
+    if not store_on_error:
+        async_store_trace(hass, trace, stored_traces)
+        sampler.traced_runs += 1
 
     try:
         yield trace
@@ -69,3 +84,6 @@ def trace_automation(
     finally:
         if automation_id:
             trace.finished()
+        if store_on_error and trace.failed:
+            async_store_trace(hass, trace, stored_traces)
+            sampler.traced_runs += 1
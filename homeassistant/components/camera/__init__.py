@@ -6,7 +6,6 @@ import asyncio
 import collections
 from collections.abc import Awaitable, Callable, Iterable
 from contextlib import suppress
-from dataclasses import asdict
 from datetime import datetime, timedelta
 from enum import IntFlag
 from functools import cached_property, partial
@@ -75,11 +74,13 @@ from .const import (  # noqa: F401
     DOMAIN,
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
+    PREF_SNAPSHOT_MAX_AGE,
     SERVICE_RECORD,
     StreamType,
 )
 from .img_util import scale_jpeg_camera_image
 from .prefs import CameraPreferences, DynamicStreamSettings  # noqa: F401
+from .snapshot import SnapshotCache
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -177,32 +178,46 @@ async def _async_get_image(
     """
     with suppress(asyncio.CancelledError, TimeoutError):
         async with asyncio.timeout(timeout):
-            image_bytes = (
-                await _async_get_stream_image(
-                    camera, width=width, height=height, wait_for_next_keyframe=False
-                )
-                if camera.use_stream_for_stills
-                else await camera.async_camera_image(width=width, height=height)
-            )
-            if image_bytes:
-                content_type = camera.content_type
-                image = Image(content_type, image_bytes)
-                if (
-                    width is not None
-                    and height is not None
-                    and ("jpeg" in content_type or "jpg" in content_type)
-                ):
-                    assert width is not None
-                    assert height is not None
-                    return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
-                    )
-
+            if image := await camera.snapshot_cache.async_get(
+                (width, height),
+                partial(_async_fetch_image, camera),
+                _scale_image,
+                camera.snapshot_max_age,
+                timeout,
+            ):
                 return image
 
     raise HomeAssistantError("Unable to get image")
 
 
+async def _async_fetch_image(
+    camera: Camera, width: int | None, height: int | None
+) -> Image | None:
+    """Fetch a snapshot image from a camera and scale it if possible."""
+    image_bytes = (
+        await _async_get_stream_image(
+            camera, width=width, height=height, wait_for_next_keyframe=False
+        )
+        if camera.use_stream_for_stills
+        else await camera.async_camera_image(width=width, height=height)
+    )
+    if not image_bytes:
+        return None
+    return _scale_image(Image(camera.content_type, image_bytes), width, height)
+
+
+def _scale_image(image: Image, width: int | None, height: int | None) -> Image:
+    """Scale a snapshot image if a size is passed and it is a jpeg."""
+    content_type = image.content_type
+    if (
+        width is not None
+        and height is not None
+        and ("jpeg" in content_type or "jpg" in content_type)
+    ):
+        return Image(content_type, scale_jpeg_camera_image(image, width, height))
+    return image
+
+
 @bind_hass
 async def async_get_image(
     hass: HomeAssistant,
@@ -495,6 +510,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     _attr_model: str | None = None
     _attr_motion_detection_enabled: bool = False
     _attr_should_poll: bool = False  # No need to poll cameras
+    _attr_snapshot_max_age: float = 0
     _attr_state: None = None  # State is determined by is_on
     _attr_supported_features: CameraEntityFeature = CameraEntityFeature(0)
 
@@ -569,6 +585,24 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         """Return the interval between frames of the mjpeg stream."""
         return self._attr_frame_interval
 
+    @cached_property
+    def snapshot_cache(self) -> SnapshotCache:
+        """Return the cache of snapshots of the camera."""
+        return SnapshotCache()
+
+    @property
+    def snapshot_max_age(self) -> float:
+        """Return how many seconds a snapshot may be reused for.
+
+        Concurrent requests always share a single fetch, cameras which are
+        slow or rate limited can allow reusing snapshots for a while longer.
+        The snapshot_max_age preference overrides the camera default.
+        """
+        prefs: CameraPreferences = self.hass.data[DATA_CAMERA_PREFS]
+        if (max_age := prefs.get_snapshot_max_age(self.entity_id)) is not None:
+            return max_age
+        return self._attr_snapshot_max_age
+
     @property
     def frontend_stream_type(self) -> StreamType | None:
         """Return the type of stream supported by this camera.
@@ -954,8 +988,7 @@ async def websocket_get_prefs(
 ) -> None:
     """Handle request for account info."""
     prefs: CameraPreferences = hass.data[DATA_CAMERA_PREFS]
-    stream_prefs = await prefs.get_dynamic_stream_settings(msg["entity_id"])
-    connection.send_result(msg["id"], asdict(stream_prefs))
+    connection.send_result(msg["id"], await prefs.async_get_prefs(msg["entity_id"]))
 
 
 @websocket_api.websocket_command(
@@ -964,6 +997,9 @@ async def websocket_get_prefs(
         vol.Required("entity_id"): cv.entity_id,
         vol.Optional(PREF_PRELOAD_STREAM): bool,
         vol.Optional(PREF_ORIENTATION): vol.Coerce(Orientation),
+        vol.Optional(PREF_SNAPSHOT_MAX_AGE): vol.Any(
+            None, vol.All(vol.Coerce(float), vol.Range(min=0))
+        ),
     }
 )
 @websocket_api.async_response
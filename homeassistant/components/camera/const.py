@@ -18,6 +18,7 @@ DATA_RTSP_TO_WEB_RTC: Final = "rtsp_to_web_rtc"
 
 PREF_PRELOAD_STREAM: Final = "preload_stream"
 PREF_ORIENTATION: Final = "orientation"
+PREF_SNAPSHOT_MAX_AGE: Final = "snapshot_max_age"
 
 SERVICE_RECORD: Final = "record"
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from dataclasses import asdict, dataclass
-from typing import Final, cast
+from typing import Any, Final, cast
 
 from homeassistant.components.stream import Orientation
 from homeassistant.core import HomeAssistant
@@ -13,7 +13,7 @@ from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 
-from .const import DOMAIN, PREF_ORIENTATION, PREF_PRELOAD_STREAM
+from .const import DOMAIN, PREF_ORIENTATION, PREF_PRELOAD_STREAM, PREF_SNAPSHOT_MAX_AGE
 
 STORAGE_KEY: Final = DOMAIN
 STORAGE_VERSION: Final = 1
@@ -30,14 +30,14 @@ class DynamicStreamSettings:
 class CameraPreferences:
     """Handle camera preferences."""
 
-    _preload_prefs: dict[str, dict[str, bool | Orientation]]
+    _preload_prefs: dict[str, dict[str, bool | float]]
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize camera prefs."""
         self._hass = hass
         # The orientation prefs are stored in in the entity registry options
-        # The preload_stream prefs are stored in this Store
-        self._store = Store[dict[str, dict[str, bool | Orientation]]](
+        # The preload_stream and snapshot_max_age prefs are stored in this Store
+        self._store = Store[dict[str, dict[str, bool | float]]](
             hass, STORAGE_VERSION, STORAGE_KEY
         )
         self._dynamic_stream_settings_by_entity_id: dict[
@@ -54,12 +54,14 @@ class CameraPreferences:
         *,
         preload_stream: bool | UndefinedType = UNDEFINED,
         orientation: Orientation | UndefinedType = UNDEFINED,
-    ) -> dict[str, bool | Orientation]:
+        snapshot_max_age: float | None | UndefinedType = UNDEFINED,
+    ) -> dict[str, Any]:
         """Update camera preferences.
 
         Also update the DynamicStreamSettings if they exist.
-        preload_stream is stored in a Store
+        preload_stream and snapshot_max_age are stored in a Store
         orientation is stored in the Entity Registry
+        A snapshot_max_age of None restores the default of the camera
 
         Returns a dict with the preferences on success.
         Raises HomeAssistantError on failure.
@@ -70,7 +72,17 @@ class CameraPreferences:
         if preload_stream is not UNDEFINED:
             if dynamic_stream_settings:
                 dynamic_stream_settings.preload_stream = preload_stream
-            self._preload_prefs[entity_id] = {PREF_PRELOAD_STREAM: preload_stream}
+            self._preload_prefs.setdefault(entity_id, {})[PREF_PRELOAD_STREAM] = (
+                preload_stream
+            )
+            await self._store.async_save(self._preload_prefs)
+
+        if snapshot_max_age is not UNDEFINED:
+            entity_prefs = self._preload_prefs.setdefault(entity_id, {})
+            if snapshot_max_age is None:
+                entity_prefs.pop(PREF_SNAPSHOT_MAX_AGE, None)
+            else:
+                entity_prefs[PREF_SNAPSHOT_MAX_AGE] = snapshot_max_age
             await self._store.async_save(self._preload_prefs)
 
         if orientation is not UNDEFINED:
@@ -85,7 +97,18 @@ class CameraPreferences:
                 )
             if dynamic_stream_settings:
                 dynamic_stream_settings.orientation = orientation
-        return asdict(await self.get_dynamic_stream_settings(entity_id))
+        return await self.async_get_prefs(entity_id)
+
+    async def async_get_prefs(self, entity_id: str) -> dict[str, Any]:
+        """Get the camera preferences of the entity."""
+        return {
+            **asdict(await self.get_dynamic_stream_settings(entity_id)),
+            PREF_SNAPSHOT_MAX_AGE: self.get_snapshot_max_age(entity_id),
+        }
+
+    def get_snapshot_max_age(self, entity_id: str) -> float | None:
+        """Get the snapshot max age preference of the entity, if it is set."""
+        return self._preload_prefs.get(entity_id, {}).get(PREF_SNAPSHOT_MAX_AGE)
 
     async def get_dynamic_stream_settings(
         self, entity_id: str
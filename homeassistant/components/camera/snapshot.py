@@ -0,0 +1,151 @@
+"""Snapshot cache for cameras."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import partial
+import time
+from typing import TYPE_CHECKING, Any, Final
+
+from lru import LRU
+
+from homeassistant.core import callback
+from homeassistant.util.async_ import create_eager_task
+
+if TYPE_CHECKING:
+    from . import Image
+
+# Number of requested sizes to keep scaled snapshots for
+SNAPSHOT_CACHE_SIZE = 16
+
+type SnapshotKey = tuple[int | None, int | None]
+
+# The size of the snapshot as the camera provides it
+SOURCE_SIZE: Final[SnapshotKey] = (None, None)
+
+
+@dataclass(slots=True)
+class SnapshotCacheStats:
+    """Statistics of a snapshot cache."""
+
+    requests: int = 0
+    hits: int = 0
+    shared_fetches: int = 0
+    fetches: int = 0
+    scales: int = 0
+
+    @callback
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the statistics."""
+        return {
+            "requests": self.requests,
+            "hits": self.hits,
+            "shared_fetches": self.shared_fetches,
+            "fetches": self.fetches,
+            "scales": self.scales,
+            "hit_rate": (
+                (self.hits + self.shared_fetches) / self.requests
+                if self.requests
+                else None
+            ),
+        }
+
+
+class SnapshotCache:
+    """Cache of the snapshots of a camera.
+
+    Concurrent requests share a single fetch. When snapshots may be reused,
+    the source snapshot is fetched once per max age and the requested sizes
+    are scaled from it, the scaled snapshots are kept until the next fetch.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the snapshot cache."""
+        self.stats = SnapshotCacheStats()
+        self._source: Image | None = None
+        self._source_time = 0.0
+        self._scaled: LRU[SnapshotKey, Image] = LRU(SNAPSHOT_CACHE_SIZE)
+        self._fetches: dict[SnapshotKey, asyncio.Task[Image | None]] = {}
+
+    async def async_get(
+        self,
+        size: SnapshotKey,
+        fetch: Callable[[int | None, int | None], Awaitable[Image | None]],
+        scale: Callable[[Image, int | None, int | None], Image],
+        max_age: float,
+        timeout: float,
+    ) -> Image | None:
+        """Return a snapshot of a size, fetching it unless it can be reused.
+
+        fetch returns a snapshot of a size from the camera, scaled if the
+        camera did not scale it, scale scales the source snapshot to a size.
+        """
+        self.stats.requests += 1
+        if not max_age:
+            # The camera may provide the size itself
+            return await self._async_shared_fetch(size, fetch, timeout)
+
+        if (source := self._source) is not None and (
+            time.monotonic() - self._source_time < max_age
+        ):
+            self.stats.hits += 1
+        elif (
+            source := await self._async_shared_fetch(SOURCE_SIZE, fetch, timeout)
+        ) is None:
+            return None
+
+        if size == SOURCE_SIZE:
+            return source
+        if source is not self._source or (image := self._scaled.get(size)) is None:
+            self.stats.scales += 1
+            image = scale(source, *size)
+            # A newer source may have been fetched meanwhile
+            if source is self._source:
+                self._scaled[size] = image
+        return image
+
+    async def _async_shared_fetch(
+        self,
+        size: SnapshotKey,
+        fetch: Callable[[int | None, int | None], Awaitable[Image | None]],
+        timeout: float,
+    ) -> Image | None:
+        """Fetch a snapshot of a size, sharing the fetch with other requests."""
+        if (task := self._fetches.get(size)) is not None:
+            self.stats.shared_fetches += 1
+        else:
+            self.stats.fetches += 1
+            task = self._fetches[size] = create_eager_task(
+                self._async_fetch(fetch, size, timeout)
+            )
+            task.add_done_callback(partial(self._async_fetch_done, size))
+        # A request which times out must not cancel the fetch of the others
+        return await asyncio.shield(task)
+
+    async def _async_fetch(
+        self,
+        fetch: Callable[[int | None, int | None], Awaitable[Image | None]],
+        size: SnapshotKey,
+        timeout: float,
+    ) -> Image | None:
+        """Fetch a snapshot and store it if it is the source snapshot."""
+        async with asyncio.timeout(timeout):
+            image = await fetch(*size)
+        if size == SOURCE_SIZE and image is not None:
+            self._source = image
+            self._source_time = time.monotonic()
+            self._scaled.clear()
+        return image
+
+    @callback
+    def _async_fetch_done(
+        self, size: SnapshotKey, task: asyncio.Task[Image | None]
+    ) -> None:
+        """Remove the finished fetch."""
+        if self._fetches.get(size) is task:
+            del self._fetches[size]
+        # Retrieve the exception even if all requests have timed out
+        if not task.cancelled():
+            task.exception()
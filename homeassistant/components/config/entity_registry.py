@@ -62,7 +62,10 @@ _ENTITY_CATEGORIES_JSON = json_dumps(er.ENTITY_CATEGORY_INDEX_TO_VALUE)
 
 
 @websocket_api.websocket_command(
-    {vol.Required("type"): "config/entity_registry/list_for_display"}
+    {
+        vol.Required("type"): "config/entity_registry/list_for_display",
+        vol.Optional("version"): str,
+    }
 )
 @callback
 def websocket_list_entities_for_display(
@@ -70,21 +73,23 @@ def websocket_list_entities_for_display(
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """Handle list registry entries command."""
+    """Handle list registry entries command.
+
+    If the client passes the version of the list it already has and the list
+    has not changed since, only the version is sent back.
+    """
     registry = er.async_get(hass)
+    version, inner = registry.entities.get_display_json()
+    if msg.get("version") == version:
+        connection.send_result(msg["id"], {"version": version, "not_modified": True})
+        return
     # Build start of response message
     msg_json_prefix = (
         f'{{"id":{msg["id"]},"type":"{websocket_api.TYPE_RESULT}","success":true,'
-        f'"result":{{"entity_categories":{_ENTITY_CATEGORIES_JSON},"entities":['
+        f'"result":{{"version":"{version}",'
+        f'"entity_categories":{_ENTITY_CATEGORIES_JSON},"entities":['
     ).encode()
-    # Concatenate cached entity registry item JSON serializations
-    inner = b",".join(
-        [
-            entry.display_json_repr
-            for entry in registry.entities.values()
-            if entry.disabled_by is None and entry.display_json_repr is not None
-        ]
-    )
+    # Concatenate with the cached entity registry display list
     msg_json = b"".join((msg_json_prefix, inner, b"]}}"))
     connection.send_message(msg_json)
 
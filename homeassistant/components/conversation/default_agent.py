@@ -13,7 +13,13 @@ import time
 from typing import IO, Any, cast
 
 from hassil.expression import Expression, ListReference, Sequence
-from hassil.intents import Intents, SlotList, TextSlotList, WildcardSlotList
+from hassil.intents import (
+    Intents,
+    SlotList,
+    TextSlotList,
+    TextSlotValue,
+    WildcardSlotList,
+)
 from hassil.recognize import (
     MISSING_ENTITY,
     RecognizeResult,
@@ -161,6 +167,12 @@ class DefaultAgent(ConversationEntity):
         self._config_intents: dict[str, Any] = config_intents
         self._slot_lists: dict[str, SlotList] | None = None
 
+        # Parts of the slot lists which are updated incrementally
+        self._entity_names: dict[str, list[TextSlotValue]] | None = None
+        self._changed_entity_ids: set[str] = set()
+        self._area_names: list[tuple[str, str]] | None = None
+        self._floor_names: list[tuple[str, str]] | None = None
+
         # Sentences that will trigger a callback (skipping intent recognition)
         self._trigger_sentences: list[TriggerData] = []
         self._trigger_intents: Intents | None = None
@@ -194,20 +206,20 @@ class DefaultAgent(ConversationEntity):
         self._unsub_clear_slot_list = [
             self.hass.bus.async_listen(
                 ar.EVENT_AREA_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_clear_area_names,
             ),
             self.hass.bus.async_listen(
                 fr.EVENT_FLOOR_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_clear_floor_names,
             ),
             self.hass.bus.async_listen(
                 er.EVENT_ENTITY_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_clear_entity_names,
                 event_filter=self._filter_entity_registry_changes,
             ),
             self.hass.bus.async_listen(
                 EVENT_STATE_CHANGED,
-                self._async_clear_slot_list,
+                self._async_clear_entity_names,
                 event_filter=self._filter_state_changes,
             ),
             async_listen_entity_updates(self.hass, DOMAIN, self._async_clear_slot_list),
@@ -799,10 +811,36 @@ class DefaultAgent(ConversationEntity):
         if self._unsub_clear_slot_list is None:
             return
         self._slot_lists = None
+        self._entity_names = None
+        self._changed_entity_ids.clear()
+        self._area_names = None
+        self._floor_names = None
         for unsub in self._unsub_clear_slot_list:
             unsub()
         self._unsub_clear_slot_list = None
 
+    @core.callback
+    def _async_clear_entity_names(
+        self,
+        event: core.Event[er.EventEntityRegistryUpdatedData]
+        | core.Event[core.EventStateChangedData],
+    ) -> None:
+        """Mark the names of an entity for update when it has changed."""
+        self._slot_lists = None
+        self._changed_entity_ids.add(event.data["entity_id"])
+
+    @core.callback
+    def _async_clear_area_names(self, event: core.Event[Any]) -> None:
+        """Clear area names when the area registry has changed."""
+        self._slot_lists = None
+        self._area_names = None
+
+    @core.callback
+    def _async_clear_floor_names(self, event: core.Event[Any]) -> None:
+        """Clear floor names when the floor registry has changed."""
+        self._slot_lists = None
+        self._floor_names = None
+
     @core.callback
     def _make_slot_lists(self) -> dict[str, SlotList]:
         """Create slot lists with areas and entity names/aliases."""
@@ -812,85 +850,78 @@ class DefaultAgent(ConversationEntity):
         start = time.monotonic()
 
         entity_registry = er.async_get(self.hass)
-        states = [
-            state
-            for state in self.hass.states.async_all()
-            if async_should_expose(self.hass, DOMAIN, state.entity_id)
-        ]
-
-        # Gather exposed entity names.
-        #
-        # NOTE: We do not pass entity ids in here because multiple entities may
-        # have the same name. The intent matcher doesn't gather all matching
-        # values for a list, just the first. So we will need to match by name no
-        # matter what.
-        entity_names = []
-        for state in states:
-            # Checked against "requires_context" and "excludes_context" in hassil
-            context = {"domain": state.domain}
-            if state.attributes:
-                # Include some attributes
-                for attr in DEFAULT_EXPOSED_ATTRIBUTES:
-                    if attr not in state.attributes:
-                        continue
-                    context[attr] = state.attributes[attr]
-
-            entity = entity_registry.async_get(state.entity_id)
-
-            if not entity:
-                # Default name
-                entity_names.append((state.name, state.name, context))
-                continue
-
-            if entity.aliases:
-                for alias in entity.aliases:
-                    if not alias.strip():
-                        continue
-
-                    entity_names.append((alias, alias, context))
-
-            # Default name
-            entity_names.append((state.name, state.name, context))
+        if self._entity_names is None:
+            # Gather exposed entity names.
+            #
+            # NOTE: We do not pass entity ids in here because multiple entities
+            # may have the same name. The intent matcher doesn't gather all
+            # matching values for a list, just the first. So we will need to
+            # match by name no matter what.
+            self._entity_names = {
+                state.entity_id: self._make_entity_names(state, entity_registry)
+                for state in self.hass.states.async_all()
+                if async_should_expose(self.hass, DOMAIN, state.entity_id)
+            }
+        else:
+            # Only update the names of entities which have changed
+            for entity_id in self._changed_entity_ids:
+                if (state := self.hass.states.get(entity_id)) is None or (
+                    not async_should_expose(self.hass, DOMAIN, entity_id)
+                ):
+                    self._entity_names.pop(entity_id, None)
+                    continue
+                self._entity_names[entity_id] = self._make_entity_names(
+                    state, entity_registry
+                )
+        self._changed_entity_ids.clear()
 
+        entity_names = [
+            name_value
+            for name_values in self._entity_names.values()
+            for name_value in name_values
+        ]
         _LOGGER.debug("Exposed entities: %s", entity_names)
 
-        # Expose all areas.
-        areas = ar.async_get(self.hass)
-        area_names = []
-        for area in areas.async_list_areas():
-            area_names.append((area.name, area.name))
-            if not area.aliases:
-                continue
-
-            for alias in area.aliases:
-                alias = alias.strip()
-                if not alias:
+        if self._area_names is None:
+            # Expose all areas.
+            areas = ar.async_get(self.hass)
+            self._area_names = area_names = []
+            for area in areas.async_list_areas():
+                area_names.append((area.name, area.name))
+                if not area.aliases:
                     continue
 
-                area_names.append((alias, alias))
+                for alias in area.aliases:
+                    alias = alias.strip()
+                    if not alias:
+                        continue
 
-        # Expose all floors.
-        floors = fr.async_get(self.hass)
-        floor_names = []
-        for floor in floors.async_list_floors():
-            floor_names.append((floor.name, floor.name))
-            if not floor.aliases:
-                continue
+                    area_names.append((alias, alias))
 
-            for alias in floor.aliases:
-                alias = alias.strip()
-                if not alias:
+        if self._floor_names is None:
+            # Expose all floors.
+            floors = fr.async_get(self.hass)
+            self._floor_names = floor_names = []
+            for floor in floors.async_list_floors():
+                floor_names.append((floor.name, floor.name))
+                if not floor.aliases:
                     continue
 
-                floor_names.append((alias, floor.name))
+                for alias in floor.aliases:
+                    alias = alias.strip()
+                    if not alias:
+                        continue
+
+                    floor_names.append((alias, floor.name))
 
         self._slot_lists = {
-            "area": TextSlotList.from_tuples(area_names, allow_template=False),
-            "name": TextSlotList.from_tuples(entity_names, allow_template=False),
-            "floor": TextSlotList.from_tuples(floor_names, allow_template=False),
+            "area": TextSlotList.from_tuples(self._area_names, allow_template=False),
+            "name": TextSlotList(name=None, values=entity_names),
+            "floor": TextSlotList.from_tuples(self._floor_names, allow_template=False),
         }
 
-        self._listen_clear_slot_list()
+        if self._unsub_clear_slot_list is None:
+            self._listen_clear_slot_list()
 
         _LOGGER.debug(
             "Created slot lists in %.2f seconds",
@@ -899,6 +930,41 @@ class DefaultAgent(ConversationEntity):
 
         return self._slot_lists
 
+    @core.callback
+    def _make_entity_names(
+        self, state: core.State, entity_registry: er.EntityRegistry
+    ) -> list[TextSlotValue]:
+        """Return the slot values of the names and aliases of an exposed entity."""
+        # Checked against "requires_context" and "excludes_context" in hassil
+        context = {"domain": state.domain}
+        if state.attributes:
+            # Include some attributes
+            for attr in DEFAULT_EXPOSED_ATTRIBUTES:
+                if attr not in state.attributes:
+                    continue
+                context[attr] = state.attributes[attr]
+
+        entity_names: list[TextSlotValue] = []
+        entity = entity_registry.async_get(state.entity_id)
+        if entity and entity.aliases:
+            for alias in entity.aliases:
+                if not alias.strip():
+                    continue
+
+                entity_names.append(
+                    TextSlotValue.from_tuple(
+                        (alias, alias, context), allow_template=False
+                    )
+                )
+
+        # Default name
+        entity_names.append(
+            TextSlotValue.from_tuple(
+                (state.name, state.name, context), allow_template=False
+            )
+        )
+        return entity_names
+
     def _make_intent_context(
         self, user_input: ConversationInput
     ) -> dict[str, Any] | None:
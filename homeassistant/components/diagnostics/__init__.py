@@ -21,6 +21,7 @@ from homeassistant.helpers import (
     integration_platform,
 )
 from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.helpers.entity_platform import async_get_polling_report
 from homeassistant.helpers.json import (
     ExtendedJSONEncoder,
     find_paths_unserializable_data,
@@ -209,6 +210,7 @@ async def _async_get_json_file_response(
         "custom_components": custom_components,
         "integration_manifest": async_format_manifest(integration.manifest),
         "setup_times": async_get_domain_setup_times(hass, domain),
+        "polling": async_get_polling_report(hass, domain, d_id),
         "data": data,
     }
     try:
@@ -21,12 +21,17 @@ from homeassistant.const import (
     Platform,
 )
 from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers import (
+    config_validation as cv,
+    entity_registry as er,
+    reference_graph,
+)
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.group import (
     expand_entity_ids as _expand_entity_ids,
     get_entity_ids as _get_entity_ids,
 )
+from homeassistant.helpers.reference_graph import ReferenceType
 from homeassistant.helpers.reload import async_reload_integration_platforms
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
@@ -127,14 +132,9 @@ def groups_with_entity(hass: HomeAssistant, entity_id: str) -> list[str]:
 
     Async friendly.
     """
-    if DOMAIN not in hass.data:
-        return []
-
-    return [
-        group.entity_id
-        for group in hass.data[DOMAIN].entities
-        if entity_id in group.tracking
-    ]
+    return reference_graph.async_get(hass).async_get_referencing(
+        DOMAIN, ReferenceType.ENTITY, entity_id
+    )
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
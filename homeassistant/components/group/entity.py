@@ -17,10 +17,11 @@ from homeassistant.core import (
     callback,
     split_entity_id,
 )
-from homeassistant.helpers import start
+from homeassistant.helpers import reference_graph, start
 from homeassistant.helpers.entity import Entity, async_generate_entity_id
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.reference_graph import ReferenceType
 
 from .const import ATTR_AUTO, ATTR_ORDER, DOMAIN, GROUP_ORDER, REG_KEY
 from .registry import GroupIntegrationRegistry, SingleStateType
@@ -284,6 +285,7 @@ class Group(Entity):
             self.tracking = ()
             self.trackable = ()
             self.single_state_type_key = None
+            reference_graph.async_get(self.hass).async_remove_references(self.entity_id)
             return
 
         registry = self._registry
@@ -318,6 +320,9 @@ class Group(Entity):
 
         self.trackable = tuple(trackable)
         self.tracking = tuple(tracking)
+        reference_graph.async_get(self.hass).async_set_references(
+            self.entity_id, {ReferenceType.ENTITY: self.tracking}
+        )
 
     @callback
     def _async_deregister(self) -> None:
@@ -325,6 +330,7 @@ class Group(Entity):
         registry = self._registry
         if self.entity_id in registry.state_group_mapping:
             registry.state_group_mapping.pop(self.entity_id)
+        reference_graph.async_get(self.hass).async_remove_references(self.entity_id)
 
     @callback
     def _async_start(self, _: HomeAssistant | None = None) -> None:
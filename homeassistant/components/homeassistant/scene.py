@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, ValuesView
+from collections.abc import Mapping
 import logging
 from typing import Any, NamedTuple, cast
 
@@ -31,8 +31,13 @@ from homeassistant.core import (
     callback,
 )
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
-from homeassistant.helpers import config_validation as cv, entity_platform
+from homeassistant.helpers import (
+    config_validation as cv,
+    entity_platform,
+    reference_graph,
+)
 from homeassistant.helpers.entity_platform import AddEntitiesCallback, EntityPlatform
+from homeassistant.helpers.reference_graph import ReferenceType
 from homeassistant.helpers.service import (
     async_extract_entity_ids,
     async_register_admin_service,
@@ -142,17 +147,9 @@ class SceneConfig(NamedTuple):
 @callback
 def scenes_with_entity(hass: HomeAssistant, entity_id: str) -> list[str]:
     """Return all scenes that reference the entity."""
-    if DATA_PLATFORM not in hass.data:
-        return []
-
-    platform: EntityPlatform = hass.data[DATA_PLATFORM]
-
-    scene_entities = cast(ValuesView[HomeAssistantScene], platform.entities.values())
-    return [
-        scene_entity.entity_id
-        for scene_entity in scene_entities
-        if entity_id in scene_entity.scene_config.states
-    ]
+    return reference_graph.async_get(hass).async_get_referencing(
+        SCENE_DOMAIN, ReferenceType.ENTITY, entity_id
+    )
 
 
 @callback
@@ -365,6 +362,18 @@ class HomeAssistantScene(Scene):
             attributes[CONF_ID] = unique_id
         return attributes
 
+    async def async_internal_added_to_hass(self) -> None:
+        """Register the entities referenced by the scene."""
+        await super().async_internal_added_to_hass()
+        reference_graph.async_get(self.hass).async_set_references(
+            self.entity_id, {ReferenceType.ENTITY: self.scene_config.states}
+        )
+
+    async def async_internal_will_remove_from_hass(self) -> None:
+        """Remove the references of the scene."""
+        await super().async_internal_will_remove_from_hass()
+        reference_graph.async_get(self.hass).async_remove_references(self.entity_id)
+
     async def async_activate(self, **kwargs: Any) -> None:
         """Activate scene. Try to get entities into requested state."""
         await async_reproduce_state(
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from datetime import timedelta
 import logging
+from typing import Any
 
 import voluptuous as vol
 
@@ -29,8 +30,10 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
     process_state_match,
 )
+from homeassistant.helpers.singleton import singleton
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.hass_dict import HassKey
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,6 +43,15 @@ CONF_TO = "to"
 CONF_NOT_FROM = "not_from"
 CONF_NOT_TO = "not_to"
 
+DATA_STATE_TRIGGER_MULTIPLEXER: HassKey[StateTriggerMultiplexer] = HassKey(
+    "state_trigger_multiplexer"
+)
+
+_PATTERN_KEYS = (CONF_ATTRIBUTE, CONF_FROM, CONF_NOT_FROM, CONF_TO, CONF_NOT_TO)
+_NOT_SET = object()
+
+type StatePatternListenerType = Callable[[Event[EventStateChangedData], Any, Any], None]
+
 BASE_SCHEMA = cv.TRIGGER_BASE_SCHEMA.extend(
     {
         vol.Required(CONF_PLATFORM): "state",
@@ -69,6 +81,212 @@ TRIGGER_ATTRIBUTE_SCHEMA = BASE_SCHEMA.extend(
 )
 
 
+class _StatePattern:
+    """A from/to/attribute pattern shared by all state triggers using it."""
+
+    __slots__ = ("attribute", "match_from_state", "match_to_state", "match_all")
+
+    def __init__(self, config: ConfigType) -> None:
+        """Initialize the pattern."""
+        if (from_state := config.get(CONF_FROM)) is not None:
+            self.match_from_state = process_state_match(from_state)
+        elif (not_from_state := config.get(CONF_NOT_FROM)) is not None:
+            self.match_from_state = process_state_match(not_from_state, invert=True)
+        else:
+            self.match_from_state = process_state_match(MATCH_ALL)
+
+        if (to_state := config.get(CONF_TO)) is not None:
+            self.match_to_state = process_state_match(to_state)
+        elif (not_to_state := config.get(CONF_NOT_TO)) is not None:
+            self.match_to_state = process_state_match(not_to_state, invert=True)
+        else:
+            self.match_to_state = process_state_match(MATCH_ALL)
+
+        self.attribute = config.get(CONF_ATTRIBUTE)
+        # If neither CONF_FROM or CONF_TO are specified,
+        # fire on all changes to the state or an attribute
+        self.match_all = all(
+            item not in config
+            for item in (CONF_FROM, CONF_NOT_FROM, CONF_NOT_TO, CONF_TO)
+        )
+
+    @callback
+    def async_match(
+        self, event: Event[EventStateChangedData]
+    ) -> tuple[Any, Any] | None:
+        """Return the old and new value if the state change matches."""
+        attribute = self.attribute
+        from_s = event.data["old_state"]
+        to_s = event.data["new_state"]
+
+        if from_s is None:
+            old_value = None
+        elif attribute is None:
+            old_value = from_s.state
+        else:
+            old_value = from_s.attributes.get(attribute)
+
+        if to_s is None:
+            new_value = None
+        elif attribute is None:
+            new_value = to_s.state
+        else:
+            new_value = to_s.attributes.get(attribute)
+
+        # When we listen for state changes with `match_all`, we
+        # will trigger even if just an attribute changes. When
+        # we listen to just an attribute, we should ignore all
+        # other attribute changes.
+        if attribute is not None and old_value == new_value:
+            return None
+
+        if (
+            not self.match_from_state(old_value)
+            or not self.match_to_state(new_value)
+            or (not self.match_all and old_value == new_value)
+        ):
+            return None
+
+        return old_value, new_value
+
+
+def _freeze(value: Any) -> Any:
+    """Convert a config value to a hashable value."""
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+@callback
+def _async_pattern_key(config: ConfigType) -> Hashable:
+    """Return a key identifying the from/to/attribute pattern of a trigger.
+
+    Triggers which can't be keyed, for example because they match on an
+    unhashable attribute value, get a unique key and are not shared.
+    """
+    key = tuple(_freeze(config.get(item, _NOT_SET)) for item in _PATTERN_KEYS)
+    try:
+        hash(key)
+    except TypeError:
+        return object()
+    return key
+
+
+class _EntityStateTriggers:
+    """Decision table of the state triggers of a single entity."""
+
+    __slots__ = ("patterns", "pattern_users", "listeners", "unsub")
+
+    def __init__(self) -> None:
+        """Initialize the decision table."""
+        self.patterns: dict[Hashable, _StatePattern] = {}
+        self.pattern_users: dict[Hashable, int] = {}
+        self.listeners: list[tuple[_StatePattern, StatePatternListenerType]] = []
+        self.unsub: CALLBACK_TYPE | None = None
+
+
+class StateTriggerMultiplexer:
+    """Evaluate the state triggers of all automations in one pass per entity.
+
+    Triggers are grouped by entity and by their from/to/attribute pattern.
+    Each state change is dispatched once to the multiplexer which evaluates
+    every pattern used for the entity once and calls the listeners of the
+    matching patterns in the order they were added.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the multiplexer."""
+        self.hass = hass
+        self._entities: dict[str, _EntityStateTriggers] = {}
+
+    @callback
+    def async_add_listener(
+        self,
+        entity_ids: list[str],
+        config: ConfigType,
+        listener: StatePatternListenerType,
+    ) -> CALLBACK_TYPE:
+        """Add a listener for state changes of entities matching a pattern."""
+        key = _async_pattern_key(config)
+        pattern: _StatePattern | None = None
+        added: list[tuple[str, tuple[_StatePattern, StatePatternListenerType]]] = []
+        for entity_id in entity_ids:
+            entity_id = entity_id.lower()
+            if (entity_triggers := self._entities.get(entity_id)) is None:
+                entity_triggers = self._entities[entity_id] = _EntityStateTriggers()
+                entity_triggers.unsub = async_track_state_change_event(
+                    self.hass, entity_id, self._async_state_changed
+                )
+            if (entity_pattern := entity_triggers.patterns.get(key)) is None:
+                if pattern is None:
+                    pattern = _StatePattern(config)
+                entity_pattern = entity_triggers.patterns[key] = pattern
+                entity_triggers.pattern_users[key] = 0
+            entity_triggers.pattern_users[key] += 1
+            entry = (entity_pattern, listener)
+            entity_triggers.listeners.append(entry)
+            added.append((entity_id, entry))
+
+        @callback
+        def async_remove() -> None:
+            """Remove the listener."""
+            for entity_id, entry in added:
+                self._async_remove_entry(entity_id, key, entry)
+            added.clear()
+
+        return async_remove
+
+    @callback
+    def _async_remove_entry(
+        self,
+        entity_id: str,
+        key: Hashable,
+        entry: tuple[_StatePattern, StatePatternListenerType],
+    ) -> None:
+        """Remove a listener from the decision table of an entity."""
+        entity_triggers = self._entities[entity_id]
+        entity_triggers.listeners.remove(entry)
+        entity_triggers.pattern_users[key] -= 1
+        if not entity_triggers.pattern_users[key]:
+            del entity_triggers.pattern_users[key]
+            del entity_triggers.patterns[key]
+        if entity_triggers.listeners:
+            return
+        if entity_triggers.unsub is not None:
+            entity_triggers.unsub()
+        del self._entities[entity_id]
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Evaluate the patterns of an entity and call matching listeners."""
+        entity_id = event.data["entity_id"]
+        if (entity_triggers := self._entities.get(entity_id)) is None:
+            return
+        results: dict[_StatePattern, tuple[Any, Any] | None] = {}
+        for pattern, listener in entity_triggers.listeners.copy():
+            if pattern in results:
+                result = results[pattern]
+            else:
+                result = results[pattern] = pattern.async_match(event)
+            if result is None:
+                continue
+            try:
+                listener(event, *result)
+            except Exception:
+                _LOGGER.exception(
+                    "Error while dispatching state trigger for %s to %s",
+                    entity_id,
+                    listener,
+                )
+
+
+@callback
+@singleton(DATA_STATE_TRIGGER_MULTIPLEXER)
+def async_get_multiplexer(hass: HomeAssistant) -> StateTriggerMultiplexer:
+    """Return the state trigger multiplexer."""
+    return StateTriggerMultiplexer(hass)
+
+
 async def async_validate_trigger_config(
     hass: HomeAssistant, config: ConfigType
 ) -> ConfigType:
@@ -102,27 +320,8 @@ async def async_attach_trigger(
     """Listen for state changes based on configuration."""
     entity_ids = config[CONF_ENTITY_ID]
 
-    if (from_state := config.get(CONF_FROM)) is not None:
-        match_from_state = process_state_match(from_state)
-    elif (not_from_state := config.get(CONF_NOT_FROM)) is not None:
-        match_from_state = process_state_match(not_from_state, invert=True)
-    else:
-        match_from_state = process_state_match(MATCH_ALL)
-
-    if (to_state := config.get(CONF_TO)) is not None:
-        match_to_state = process_state_match(to_state)
-    elif (not_to_state := config.get(CONF_NOT_TO)) is not None:
-        match_to_state = process_state_match(not_to_state, invert=True)
-    else:
-        match_to_state = process_state_match(MATCH_ALL)
-
     time_delta = config.get(CONF_FOR)
     template.attach(hass, time_delta)
-    # If neither CONF_FROM or CONF_TO are specified,
-    # fire on all changes to the state or an attribute
-    match_all = all(
-        item not in config for item in (CONF_FROM, CONF_NOT_FROM, CONF_NOT_TO, CONF_TO)
-    )
     unsub_track_same: dict[str, Callable[[], None]] = {}
     period: dict[str, timedelta] = {}
     attribute = config.get(CONF_ATTRIBUTE)
@@ -132,40 +331,14 @@ async def async_attach_trigger(
     _variables = trigger_info["variables"] or {}
 
     @callback
-    def state_automation_listener(event: Event[EventStateChangedData]) -> None:
-        """Listen for state changes and calls action."""
+    def state_automation_listener(
+        event: Event[EventStateChangedData], old_value: Any, new_value: Any
+    ) -> None:
+        """Listen for matching state changes and calls action."""
         entity = event.data["entity_id"]
         from_s = event.data["old_state"]
         to_s = event.data["new_state"]
 
-        if from_s is None:
-            old_value = None
-        elif attribute is None:
-            old_value = from_s.state
-        else:
-            old_value = from_s.attributes.get(attribute)
-
-        if to_s is None:
-            new_value = None
-        elif attribute is None:
-            new_value = to_s.state
-        else:
-            new_value = to_s.attributes.get(attribute)
-
-        # When we listen for state changes with `match_all`, we
-        # will trigger even if just an attribute changes. When
-        # we listen to just an attribute, we should ignore all
-        # other attribute changes.
-        if attribute is not None and old_value == new_value:
-            return
-
-        if (
-            not match_from_state(old_value)
-            or not match_to_state(new_value)
-            or (not match_all and old_value == new_value)
-        ):
-            return
-
         @callback
         def call_action() -> None:
             """Call action with right context."""
@@ -233,7 +406,9 @@ async def async_attach_trigger(
             entity_ids=entity,
         )
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    unsub = async_get_multiplexer(hass).async_add_listener(
+        entity_ids, config, state_automation_listener
+    )
 
     @callback
     def async_remove() -> None:
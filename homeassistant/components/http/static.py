@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from contextlib import suppress
+from functools import lru_cache
 import mimetypes
+import os
 from pathlib import Path
 from typing import Final
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse, Request, StreamResponse
-from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
+from aiohttp.helpers import ETAG_ANY
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
+from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound, HTTPNotModified
 from aiohttp.web_urldispatcher import StaticResource
 from lru import LRU
 
@@ -19,6 +23,13 @@ CACHE_TIME: Final = 31 * 86400  # = 1 month
 CACHE_HEADER = f"public, max-age={CACHE_TIME}"
 CACHE_HEADERS: Mapping[str, str] = {hdrs.CACHE_CONTROL: CACHE_HEADER}
 PATH_CACHE: LRU[tuple[str, Path], tuple[Path | None, str | None]] = LRU(512)
+# Pre-compressed siblings in order of preference
+ENCODING_SUFFIXES: Final = (("br", ".br"), ("gzip", ".gz"))
+
+type _FileVariants = tuple[tuple[str | None, Path, str], ...]
+
+# Keyed on the path, modification time and size of the file
+FILE_CACHE: LRU[tuple[Path, int, int], _FileVariants] = LRU(512)
 
 
 def _get_file_path(rel_url: str, directory: Path) -> Path | None:
@@ -39,6 +50,59 @@ def _get_file_path(rel_url: str, directory: Path) -> Path | None:
     raise FileNotFoundError
 
 
+def _get_file_variants(filepath: Path) -> _FileVariants:
+    """Return the encodings, paths and ETags a file can be served as.
+
+    Pre-compressed siblings come first in order of preference, the file
+    itself is last. The siblings are only looked up again when the file
+    has changed.
+    """
+    st = filepath.stat()
+    key = (filepath, st.st_mtime_ns, st.st_size)
+    if (variants := FILE_CACHE.get(key)) is not None:
+        return variants
+    found: list[tuple[str | None, Path, str]] = []
+    for encoding, suffix in ENCODING_SUFFIXES:
+        sibling = filepath.with_name(filepath.name + suffix)
+        with suppress(OSError):
+            found.append((encoding, sibling, _etag(sibling.stat())))
+    found.append((None, filepath, _etag(st)))
+    variants = FILE_CACHE[key] = tuple(found)
+    return variants
+
+
+@lru_cache(maxsize=64)
+def _accepted_encodings(accept_encoding: str) -> frozenset[str]:
+    """Return the encodings of pre-compressed siblings a client accepts.
+
+    Encodings with a quality value of 0 are refused, encodings which are
+    not listed are accepted if the wildcard is.
+    """
+    qvalues: dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, *params = item.split(";")
+        qvalue = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    qvalue = float(value)
+                except ValueError:
+                    qvalue = 0.0
+        qvalues[coding.strip()] = qvalue
+    wildcard = qvalues.get("*", 0.0)
+    return frozenset(
+        encoding
+        for encoding, _ in ENCODING_SUFFIXES
+        if qvalues.get(encoding, wildcard) > 0
+    )
+
+
+def _etag(st: os.stat_result) -> str:
+    """Return the ETag value aiohttp uses for a file."""
+    return f"{st.st_mtime_ns:x}-{st.st_size:x}"
+
+
 class CachingStaticResource(StaticResource):
     """Static Resource handler that will add cache headers."""
 
@@ -70,14 +134,36 @@ class CachingStaticResource(StaticResource):
         else:
             filepath, content_type = filepath_content_type
 
-        if filepath and content_type:
-            return FileResponse(
-                filepath,
-                chunk_size=self._chunk_size,
-                headers={
-                    hdrs.CACHE_CONTROL: CACHE_HEADER,
-                    hdrs.CONTENT_TYPE: content_type,
-                },
-            )
-
-        raise HTTPForbidden if filepath is None else HTTPNotFound
+        if not filepath or not content_type:
+            raise HTTPForbidden if filepath is None else HTTPNotFound
+
+        hass = request.app[KEY_HASS]
+        try:
+            variants = await hass.async_add_executor_job(_get_file_variants, filepath)
+        except OSError as error:
+            raise HTTPNotFound from error
+
+        accepted = _accepted_encodings(request.headers.get(hdrs.ACCEPT_ENCODING, ""))
+        encoding, path, etag = next(
+            variant
+            for variant in variants
+            if variant[0] is None or variant[0] in accepted
+        )
+
+        headers = {
+            hdrs.CACHE_CONTROL: CACHE_HEADER,
+            hdrs.CONTENT_TYPE: content_type,
+        }
+        if len(variants) > 1:
+            headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+        if encoding:
+            headers[hdrs.CONTENT_ENCODING] = encoding
+
+        if (if_none_match := request.if_none_match) and any(
+            tag.value in (etag, ETAG_ANY) for tag in if_none_match
+        ):
+            headers[hdrs.ETAG] = f'"{etag}"'
+            return Response(status=HTTPNotModified.status_code, headers=headers)
+
+        # FileResponse uses sendfile when the transport supports it
+        return FileResponse(path, chunk_size=self._chunk_size, headers=headers)
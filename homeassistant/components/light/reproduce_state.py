@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from collections.abc import Iterable, Mapping
 import logging
 from typing import Any, NamedTuple, cast
@@ -14,7 +13,8 @@ from homeassistant.const import (
     STATE_OFF,
     STATE_ON,
 )
-from homeassistant.core import Context, HomeAssistant, State
+from homeassistant.core import Context, HomeAssistant, State, callback
+from homeassistant.helpers.state import ReproduceStateBatch
 
 from . import (
     ATTR_BRIGHTNESS,
@@ -77,14 +77,15 @@ def _color_mode_same(cur_state: State, state: State) -> bool:
     return cast(bool, cur_color_mode == saved_color_mode)
 
 
-async def _async_reproduce_state(
+@callback
+def _async_reproduce_state(
     hass: HomeAssistant,
+    batch: ReproduceStateBatch,
     state: State,
     *,
-    context: Context | None = None,
     reproduce_options: dict[str, Any] | None = None,
 ) -> None:
-    """Reproduce a single state."""
+    """Add the service call needed to reproduce a single state to the batch."""
     if (cur_state := hass.states.get(state.entity_id)) is None:
         _LOGGER.warning("Unable to find entity %s", state.entity_id)
         return
@@ -143,9 +144,7 @@ async def _async_reproduce_state(
     elif state.state == STATE_OFF:
         service = SERVICE_TURN_OFF
 
-    await hass.services.async_call(
-        DOMAIN, service, service_data, context=context, blocking=True
-    )
+    batch.async_add(DOMAIN, service, service_data)
 
 
 async def async_reproduce_states(
@@ -156,14 +155,10 @@ async def async_reproduce_states(
     reproduce_options: dict[str, Any] | None = None,
 ) -> None:
     """Reproduce Light states."""
-    await asyncio.gather(
-        *(
-            _async_reproduce_state(
-                hass, state, context=context, reproduce_options=reproduce_options
-            )
-            for state in states
-        )
-    )
+    batch = ReproduceStateBatch(hass, context)
+    for state in states:
+        _async_reproduce_state(hass, batch, state, reproduce_options=reproduce_options)
+    await batch.async_call()
 
 
 def check_attr_equal(attr1: Mapping, attr2: Mapping, attr_str: str) -> bool:
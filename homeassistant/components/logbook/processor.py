@@ -4,13 +4,16 @@ from __future__ import annotations
 
 from collections.abc import Callable, Generator, Sequence
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime as dt
 import logging
 from typing import Any
 
+from lru import LRU
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -37,6 +40,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, split_entity_id
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util.collection import chunked_or_all
 import homeassistant.util.dt as dt_util
 from homeassistant.util.event_type import EventType
 
@@ -65,10 +69,17 @@ from .const import (
 from .helpers import is_sensor_continuous
 from .models import EventAsRow, LazyEventPartialState, LogbookConfig, async_event_to_row
 from .queries import statement_for_request
-from .queries.common import PSEUDO_EVENT_STATE_CHANGED
+from .queries.common import PSEUDO_EVENT_STATE_CHANGED, LogbookCursor
+from .queries.contexts import context_origins_stmt
 
 _LOGGER = logging.getLogger(__name__)
 
+_MISSING = object()
+
+# Number of context summaries kept by a logbook run, event streams can run for
+# a long time
+CONTEXT_SUMMARY_CACHE_SIZE = 2048
+
 
 @dataclass(slots=True)
 class LogbookRun:
@@ -84,6 +95,9 @@ class LogbookRun:
     include_entity_name: bool
     format_time: Callable[[Row | EventAsRow], Any]
     memoize_new_contexts: bool = True
+    context_summaries: LRU[bytes | None, dict[str, Any] | None] = field(
+        default_factory=lambda: LRU(CONTEXT_SUMMARY_CACHE_SIZE)
+    )
 
 
 class EventProcessor:
@@ -145,33 +159,102 @@ class EventProcessor:
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
-            metadata_ids: list[int] | None = None
-            instance = get_instance(self.hass)
-            if self.entity_ids:
-                metadata_ids = extract_metadata_ids(
-                    instance.states_meta_manager.get_many(
-                        self.entity_ids, session, False
-                    )
-                )
-            event_type_ids = tuple(
-                extract_event_type_ids(
-                    instance.event_type_manager.get_many(self.event_types, session)
-                )
-            )
-            stmt = statement_for_request(
-                start_day,
-                end_day,
-                event_type_ids,
-                self.entity_ids,
-                metadata_ids,
-                self.device_ids,
-                self.filters,
-                self.context_id,
-            )
+            stmt = self._statement_for_request(session, start_day, end_day)
             return self.humanify(
                 execute_stmt_lambda_element(session, stmt, orm_rows=False)
             )
 
+    def get_events_page(
+        self,
+        start_day: dt,
+        end_day: dt,
+        limit: int,
+        cursor: LogbookCursor | None = None,
+    ) -> tuple[list[dict[str, Any]], LogbookCursor | None]:
+        """Get the newest events for a period of time, reading at most limit rows.
+
+        Returns the events and the cursor to request the next page of older
+        events with, or None if there are no older events.
+        """
+        with session_scope(hass=self.hass, read_only=True) as session:
+            stmt = self._statement_for_request(
+                session, start_day, end_day, limit, cursor
+            )
+            rows = list(execute_stmt_lambda_element(session, stmt, orm_rows=False))
+            self._add_context_origins(session, rows)
+
+        next_cursor: LogbookCursor | None = None
+        if len(rows) == limit:
+            oldest = rows[-1]
+            next_cursor = LogbookCursor(
+                oldest.time_fired_ts, oldest.row_kind, oldest.row_id
+            )
+        # Rows are selected newest first, context rows must be seen first
+        rows.reverse()
+        return self.humanify(rows), next_cursor
+
+    def _add_context_origins(self, session: Session, rows: Sequence[Row]) -> None:
+        """Look up the origins of the contexts of a page of rows.
+
+        The origin of a context is its oldest row, which may be on an older
+        page or before the requested period, for example when an automation
+        was triggered just before it. The same applies to the parent context
+        of a row which starts a context. A page does not select the context
+        only rows of the full request, so the origins of the contexts of its
+        rows are fetched with a single query on the context indexes instead.
+        """
+        context_lookup = self.logbook_run.context_lookup
+        missing = {
+            context_id_bin
+            for row in rows
+            for context_id_bin in (row.context_id_bin, row.context_parent_id_bin)
+            if context_id_bin
+        }
+        missing.difference_update(context_lookup)
+        if not missing:
+            return
+        # Both selects of the union bind all ids
+        max_ids = get_instance(self.hass).max_bind_vars // 2
+        for context_ids_bin in chunked_or_all(list(missing), max_ids):
+            for row in execute_stmt_lambda_element(
+                session, context_origins_stmt(context_ids_bin), orm_rows=False
+            ):
+                if row.context_id_bin not in context_lookup:
+                    context_lookup[row.context_id_bin] = row
+
+    def _statement_for_request(
+        self,
+        session: Session,
+        start_day: dt,
+        end_day: dt,
+        limit: int | None = None,
+        cursor: LogbookCursor | None = None,
+    ) -> StatementLambdaElement:
+        """Generate the statement for a period of time."""
+        metadata_ids: list[int] | None = None
+        instance = get_instance(self.hass)
+        if self.entity_ids:
+            metadata_ids = extract_metadata_ids(
+                instance.states_meta_manager.get_many(self.entity_ids, session, False)
+            )
+        event_type_ids = tuple(
+            extract_event_type_ids(
+                instance.event_type_manager.get_many(self.event_types, session)
+            )
+        )
+        return statement_for_request(
+            start_day,
+            end_day,
+            event_type_ids,
+            self.entity_ids,
+            metadata_ids,
+            self.device_ids,
+            self.filters,
+            self.context_id,
+            limit,
+            cursor,
+        )
+
     def humanify(
         self, rows: Generator[EventAsRow] | Sequence[Row] | Result
     ) -> list[dict[str, str]]:
@@ -276,11 +359,17 @@ def _humanify(
 
 
 class ContextAugmenter:
-    """Augment data with context trace."""
+    """Augment data with context trace.
+
+    The context data derived from a context row is summarized once per run and
+    cached by its context id, which maps to the same context row for the whole
+    run. Rows sharing a context only need a dictionary lookup.
+    """
 
     def __init__(self, logbook_run: LogbookRun) -> None:
         """Init the augmenter."""
         self.context_lookup = logbook_run.context_lookup
+        self.context_summaries = logbook_run.context_summaries
         self.entity_name_cache = logbook_run.entity_name_cache
         self.external_events = logbook_run.external_events
         self.event_cache = logbook_run.event_cache
@@ -328,50 +417,66 @@ class ContextAugmenter:
             # this log entry.
             if _rows_match(row, context_row):
                 return
+
+        if type(context_row) is EventAsRow:  # - this is never subclassed
+            # Live rows carry their data as a mapping and are only seen once
+            summary = self._summarize(context_row)
+        else:
+            key = context_row.context_id_bin
+            if (summary := self.context_summaries.get(key, _MISSING)) is _MISSING:
+                summary = self.context_summaries[key] = self._summarize(context_row)
+        if not summary:
+            return
+        data.update(summary)
+        if self.include_entity_name and (
+            context_entity_id := summary.get(CONTEXT_ENTITY_ID)
+        ):
+            data[CONTEXT_ENTITY_ID_NAME] = self.entity_name_cache.get(context_entity_id)
+
+    def _summarize(self, context_row: Row | EventAsRow) -> dict[str, Any] | None:
+        """Return the context data of a context row."""
         event_type = context_row.event_type
         # State change
         if context_entity_id := context_row.entity_id:
-            data[CONTEXT_STATE] = context_row.state
-            data[CONTEXT_ENTITY_ID] = context_entity_id
-            if self.include_entity_name:
-                data[CONTEXT_ENTITY_ID_NAME] = self.entity_name_cache.get(
-                    context_entity_id
-                )
-            return
+            return {
+                CONTEXT_STATE: context_row.state,
+                CONTEXT_ENTITY_ID: context_entity_id,
+            }
 
         # Call service
         if event_type == EVENT_CALL_SERVICE:
             event = self.event_cache.get(context_row)
             event_data = event.data
-            data[CONTEXT_DOMAIN] = event_data.get(ATTR_DOMAIN)
-            data[CONTEXT_SERVICE] = event_data.get(ATTR_SERVICE)
-            data[CONTEXT_EVENT_TYPE] = event_type
-            return
+            return {
+                CONTEXT_DOMAIN: event_data.get(ATTR_DOMAIN),
+                CONTEXT_SERVICE: event_data.get(ATTR_SERVICE),
+                CONTEXT_EVENT_TYPE: event_type,
+            }
 
         if event_type not in self.external_events:
-            return
+            return None
 
         domain, describe_event = self.external_events[event_type]
-        data[CONTEXT_EVENT_TYPE] = event_type
-        data[CONTEXT_DOMAIN] = domain
+        summary: dict[str, Any] = {
+            CONTEXT_EVENT_TYPE: event_type,
+            CONTEXT_DOMAIN: domain,
+        }
         event = self.event_cache.get(context_row)
         try:
             described = describe_event(event)
         except Exception:
             _LOGGER.exception("Error with %s describe event for %s", domain, event_type)
-            return
+            return summary
         if name := described.get(LOGBOOK_ENTRY_NAME):
-            data[CONTEXT_NAME] = name
+            summary[CONTEXT_NAME] = name
         if message := described.get(LOGBOOK_ENTRY_MESSAGE):
-            data[CONTEXT_MESSAGE] = message
+            summary[CONTEXT_MESSAGE] = message
         # In 2022.12 and later drop `CONTEXT_MESSAGE` if `CONTEXT_SOURCE` is available
         if source := described.get(LOGBOOK_ENTRY_SOURCE):
-            data[CONTEXT_SOURCE] = source
-        if not (attr_entity_id := described.get(LOGBOOK_ENTRY_ENTITY_ID)):
-            return
-        data[CONTEXT_ENTITY_ID] = attr_entity_id
-        if self.include_entity_name:
-            data[CONTEXT_ENTITY_ID_NAME] = self.entity_name_cache.get(attr_entity_id)
+            summary[CONTEXT_SOURCE] = source
+        if attr_entity_id := described.get(LOGBOOK_ENTRY_ENTITY_ID):
+            summary[CONTEXT_ENTITY_ID] = attr_entity_id
+        return summary
 
 
 def _rows_match(row: Row | EventAsRow, other_row: Row | EventAsRow) -> bool:
@@ -12,6 +12,7 @@ from homeassistant.components.recorder.models import ulid_to_bytes_or_none
 from homeassistant.helpers.json import json_dumps
 
 from .all import all_stmt
+from .common import ROW_KIND_STATE, LogbookCursor, LogbookPage
 from .devices import devices_stmt
 from .entities import entities_stmt
 from .entities_and_devices import entities_devices_stmt
@@ -26,10 +27,22 @@ def statement_for_request(
     device_ids: list[str] | None = None,
     filters: Filters | None = None,
     context_id: str | None = None,
+    limit: int | None = None,
+    cursor: LogbookCursor | None = None,
 ) -> StatementLambdaElement:
-    """Generate the logbook statement for a logbook request."""
+    """Generate the logbook statement for a logbook request.
+
+    If limit is set, only the newest rows of the period which are before the
+    cursor are selected, ordered from newest to oldest.
+    """
     start_day = start_day_dt.timestamp()
     end_day = end_day_dt.timestamp()
+    page: LogbookPage | None = None
+    if limit is not None:
+        # Without a cursor the page starts at the end of the period
+        page = LogbookPage.from_cursor(
+            limit, cursor or LogbookCursor(end_day, ROW_KIND_STATE, 0)
+        )
     # No entities: logbook sends everything for the timeframe
     # limited by the context_id and the yaml configured filter
     if not entity_ids and not device_ids:
@@ -40,6 +53,7 @@ def statement_for_request(
             event_type_ids,
             filters,
             context_id_bin,
+            page,
         )
 
     # sqlalchemy caches object quoting, the
@@ -56,6 +70,7 @@ def statement_for_request(
             states_metadata_ids or [],
             [json_dumps(entity_id) for entity_id in entity_ids],
             [json_dumps(device_id) for device_id in device_ids],
+            page,
         )
 
     # entities: logbook sends everything for the timeframe for the entities
@@ -66,6 +81,7 @@ def statement_for_request(
             event_type_ids,
             states_metadata_ids or [],
             [json_dumps(entity_id) for entity_id in entity_ids],
+            page,
         )
 
     # devices: logbook sends everything for the timeframe for the devices
@@ -75,4 +91,5 @@ def statement_for_request(
         end_day,
         event_type_ids,
         [json_dumps(device_id) for device_id in device_ids],
+        page,
     )
@@ -13,7 +13,15 @@ from homeassistant.components.recorder.db_schema import (
 )
 from homeassistant.components.recorder.filters import Filters
 
-from .common import apply_states_filters, select_events_without_states, select_states
+from .common import (
+    LogbookPage,
+    apply_states_filters,
+    order_page,
+    select_events_page,
+    select_events_without_states,
+    select_states,
+    select_states_page,
+)
 
 
 def all_stmt(
@@ -22,8 +30,13 @@ def all_stmt(
     event_type_ids: tuple[int, ...],
     filters: Filters | None,
     context_id_bin: bytes | None = None,
+    page: LogbookPage | None = None,
 ) -> StatementLambdaElement:
     """Generate a logbook query for all entities."""
+    if page is not None:
+        return _all_page_stmt(
+            start_day, end_day, event_type_ids, filters, context_id_bin, page
+        )
     stmt = lambda_stmt(
         lambda: select_events_without_states(start_day, end_day, event_type_ids)
     )
@@ -47,6 +60,83 @@ def all_stmt(
     return stmt
 
 
+def _all_page_stmt(
+    start_day: float,
+    end_day: float,
+    event_type_ids: tuple[int, ...],
+    filters: Filters | None,
+    context_id_bin: bytes | None,
+    page: LogbookPage,
+) -> StatementLambdaElement:
+    """Generate a logbook query for a page of all entities."""
+    limit, cursor_ts, cursor_event_id, cursor_state_id = page
+    if context_id_bin is not None:
+        return lambda_stmt(
+            lambda: order_page(
+                select_events_page(
+                    select_events_without_states(
+                        start_day, end_day, event_type_ids
+                    ).where(Events.context_id_bin == context_id_bin),
+                    limit,
+                    cursor_ts,
+                    cursor_event_id,
+                ).union_all(
+                    select_states_page(
+                        _states_query_for_context_id(
+                            start_day, end_day, context_id_bin
+                        ),
+                        limit,
+                        cursor_ts,
+                        cursor_state_id,
+                    )
+                ),
+                limit,
+            )
+        )
+    if filters and filters.has_config:
+        return lambda_stmt(
+            lambda: order_page(
+                select_events_page(
+                    select_events_without_states(
+                        start_day, end_day, event_type_ids
+                    ).filter(filters.events_entity_filter()),
+                    limit,
+                    cursor_ts,
+                    cursor_event_id,
+                ).union_all(
+                    select_states_page(
+                        _states_query_for_all(start_day, end_day).where(
+                            filters.states_metadata_entity_filter()
+                        ),
+                        limit,
+                        cursor_ts,
+                        cursor_state_id,
+                    )
+                ),
+                limit,
+            ),
+            track_on=[filters],
+        )
+    return lambda_stmt(
+        lambda: order_page(
+            select_events_page(
+                select_events_without_states(start_day, end_day, event_type_ids),
+                limit,
+                cursor_ts,
+                cursor_event_id,
+            ).union_all(
+                select_states_page(
+                    _states_query_for_all(start_day, end_day),
+                    limit,
+                    cursor_ts,
+                    cursor_state_id,
+                )
+            ),
+            limit,
+        )
+    )
+
+
 def _states_query_for_all(start_day: float, end_day: float) -> Select:
     return apply_states_filters(_apply_all_hints(select_states()), start_day, end_day)
 
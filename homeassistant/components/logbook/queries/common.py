@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Final
+from typing import Final, NamedTuple
 
 import sqlalchemy
 from sqlalchemy import select
 from sqlalchemy.sql.elements import BooleanClauseList, ColumnElement
 from sqlalchemy.sql.expression import literal
-from sqlalchemy.sql.selectable import Select
+from sqlalchemy.sql.selectable import CompoundSelect, Select
 
 from homeassistant.components.recorder.db_schema import (
     EVENTS_CONTEXT_ID_BIN_INDEX,
@@ -107,6 +107,109 @@ CONTEXT_ONLY = literal(value="1", type_=sqlalchemy.String).label("context_only")
 NOT_CONTEXT_ONLY = literal(value=None, type_=sqlalchemy.String).label("context_only")
 
 
+# Rows of a page with the same time are ordered events first, then states
+ROW_KIND_STATE: Final = 0
+ROW_KIND_EVENT: Final = 1
+EVENT_ROW_KIND = literal(value=ROW_KIND_EVENT, type_=sqlalchemy.Integer).label(
+    "row_kind"
+)
+STATE_ROW_KIND = literal(value=ROW_KIND_STATE, type_=sqlalchemy.Integer).label(
+    "row_kind"
+)
+
+# Larger than any event_id or state_id
+MAX_ROW_ID: Final = 2**63 - 1
+
+
+class LogbookCursor(NamedTuple):
+    """Position after the oldest row of a page of logbook rows.
+
+    Pages are selected newest first, ordered by time_fired_ts, then by
+    row_kind, the table the row is from, and then by row_id, which is the
+    event_id or state_id of the row.
+    """
+
+    time_fired_ts: float
+    row_kind: int
+    row_id: int
+
+
+class LogbookPage(NamedTuple):
+    """The newest rows of a period which are before a cursor.
+
+    The rows at the time of the cursor are before it if their event_id or
+    state_id is below the one of their table.
+    """
+
+    limit: int
+    time_fired_ts: float
+    event_id: int
+    state_id: int
+
+    @classmethod
+    def from_cursor(cls, limit: int, cursor: LogbookCursor) -> LogbookPage:
+        """Return the page of rows before a cursor."""
+        if cursor.row_kind == ROW_KIND_EVENT:
+            # None of the states at the time of the cursor were on a page yet
+            return cls(limit, cursor.time_fired_ts, cursor.row_id, MAX_ROW_ID)
+        # All of the events at the time of the cursor were on a page already
+        return cls(limit, cursor.time_fired_ts, 0, cursor.row_id)
+
+
+def select_events_page(
+    sel: Select, limit: int, cursor_ts: float, cursor_event_id: int
+) -> Select:
+    """Select the newest rows of an events select which are before the cursor.
+
+    Each select of a page is ordered and limited on its own so the database
+    only reads the newest range of the time index of each table.
+    """
+    return select(
+        sel.where(
+            (Events.time_fired_ts < cursor_ts)
+            | (
+                (Events.time_fired_ts == cursor_ts)
+                & (Events.event_id < cursor_event_id)
+            )
+        )
+        .order_by(Events.time_fired_ts.desc(), Events.event_id.desc())
+        .limit(limit)
+        .subquery(),
+        EVENT_ROW_KIND,
+    )
+
+
+def select_states_page(
+    sel: Select, limit: int, cursor_ts: float, cursor_state_id: int
+) -> Select:
+    """Select the newest rows of a states select which are before the cursor."""
+    return select(
+        sel.where(
+            (States.last_updated_ts < cursor_ts)
+            | (
+                (States.last_updated_ts == cursor_ts)
+                & (States.state_id < cursor_state_id)
+            )
+        )
+        .order_by(States.last_updated_ts.desc(), States.state_id.desc())
+        .limit(limit)
+        .subquery(),
+        STATE_ROW_KIND,
+    )
+
+
+def order_page(page: Select | CompoundSelect, limit: int) -> Select:
+    """Order the rows of a page newest first and limit the page."""
+    rows = page.subquery()
+    return (
+        select(rows)
+        .order_by(
+            rows.c.time_fired_ts.desc(), rows.c.row_kind.desc(), rows.c.row_id.desc()
+        )
+        .limit(limit)
+    )
+
+
 def select_events_context_id_subquery(
     start_day: float,
     end_day: float,
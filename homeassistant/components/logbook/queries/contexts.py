@@ -0,0 +1,81 @@
+"""Context origin queries for logbook."""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+
+from sqlalchemy import func, lambda_stmt, select, union_all
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+from sqlalchemy.sql.selectable import CompoundSelect
+
+from homeassistant.components.recorder.db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    States,
+    StatesMeta,
+)
+
+from .common import (
+    apply_events_context_hints,
+    apply_states_context_hints,
+    select_events_context_only,
+    select_states_context_only,
+)
+
+
+def context_origins_stmt(context_ids_bin: Collection[bytes]) -> StatementLambdaElement:
+    """Generate a query for the oldest row of each of the given contexts.
+
+    The oldest row of a context is the origin of the context. The rows are
+    found with the context_id_bin indexes regardless of when they happened.
+    """
+    return lambda_stmt(lambda: _select_context_origins(context_ids_bin))
+
+
+def _select_context_origins(context_ids_bin: Collection[bytes]) -> CompoundSelect:
+    """Generate a select for the oldest row of each of the given contexts."""
+    context_times = union_all(
+        apply_events_context_hints(
+            select(
+                Events.context_id_bin.label("context_id_bin"),
+                Events.time_fired_ts.label("time_fired_ts"),
+            ).where(Events.context_id_bin.in_(context_ids_bin))
+        ),
+        apply_states_context_hints(
+            select(
+                States.context_id_bin.label("context_id_bin"),
+                States.last_updated_ts.label("time_fired_ts"),
+            ).where(States.context_id_bin.in_(context_ids_bin))
+        ),
+    ).subquery()
+    origins = (
+        select(
+            context_times.c.context_id_bin,
+            func.min(context_times.c.time_fired_ts).label("origin_ts"),
+        )
+        .group_by(context_times.c.context_id_bin)
+        .cte()
+    )
+    return apply_events_context_hints(
+        select_events_context_only()
+        .select_from(origins)
+        .join(
+            Events,
+            (Events.context_id_bin == origins.c.context_id_bin)
+            & (Events.time_fired_ts == origins.c.origin_ts),
+        )
+        .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
+        .outerjoin(EventData, (Events.data_id == EventData.data_id))
+    ).union_all(
+        apply_states_context_hints(
+            select_states_context_only()
+            .select_from(origins)
+            .join(
+                States,
+                (States.context_id_bin == origins.c.context_id_bin)
+                & (States.last_updated_ts == origins.c.origin_ts),
+            )
+            .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
+        )
+    )
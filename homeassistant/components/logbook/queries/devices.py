@@ -20,10 +20,13 @@ from homeassistant.components.recorder.db_schema import (
 )
 
 from .common import (
+    LogbookPage,
     apply_events_context_hints,
     apply_states_context_hints,
+    order_page,
     select_events_context_id_subquery,
     select_events_context_only,
+    select_events_page,
     select_events_without_states,
     select_states_context_only,
 )
@@ -80,8 +83,28 @@ def devices_stmt(
     end_day: float,
     event_type_ids: tuple[int, ...],
     json_quotable_device_ids: list[str],
+    page: LogbookPage | None = None,
 ) -> StatementLambdaElement:
-    """Generate a logbook query for multiple devices."""
+    """Generate a logbook query for multiple devices.
+
+    A page only selects the rows of the devices, the origins of their
+    contexts are looked up separately.
+    """
+    if page is not None:
+        limit, cursor_ts, cursor_event_id, _ = page
+        return lambda_stmt(
+            lambda: order_page(
+                select_events_page(
+                    select_events_without_states(
+                        start_day, end_day, event_type_ids
+                    ).where(apply_event_device_id_matchers(json_quotable_device_ids)),
+                    limit,
+                    cursor_ts,
+                    cursor_event_id,
+                ),
+                limit,
+            )
+        )
     return lambda_stmt(
         lambda: _apply_devices_context_union(
             select_events_without_states(start_day, end_day, event_type_ids).where(
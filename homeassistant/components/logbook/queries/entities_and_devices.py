@@ -18,12 +18,16 @@ from homeassistant.components.recorder.db_schema import (
 )
 
 from .common import (
+    LogbookPage,
     apply_events_context_hints,
     apply_states_context_hints,
+    order_page,
     select_events_context_id_subquery,
     select_events_context_only,
+    select_events_page,
     select_events_without_states,
     select_states_context_only,
+    select_states_page,
 )
 from .devices import apply_event_device_id_matchers
 from .entities import (
@@ -108,8 +112,41 @@ def entities_devices_stmt(
     states_metadata_ids: Collection[int],
     json_quoted_entity_ids: list[str],
     json_quoted_device_ids: list[str],
+    page: LogbookPage | None = None,
 ) -> StatementLambdaElement:
-    """Generate a logbook query for multiple entities."""
+    """Generate a logbook query for multiple entities.
+
+    A page only selects the rows of the entities and devices, the origins of
+    their contexts are looked up separately.
+    """
+    if page is not None:
+        limit, cursor_ts, cursor_event_id, cursor_state_id = page
+        return lambda_stmt(
+            lambda: order_page(
+                select_events_page(
+                    select_events_without_states(
+                        start_day, end_day, event_type_ids
+                    ).where(
+                        _apply_event_entity_id_device_id_matchers(
+                            json_quoted_entity_ids, json_quoted_device_ids
+                        )
+                    ),
+                    limit,
+                    cursor_ts,
+                    cursor_event_id,
+                ).union_all(
+                    select_states_page(
+                        states_select_for_entity_ids(
+                            start_day, end_day, states_metadata_ids
+                        ),
+                        limit,
+                        cursor_ts,
+                        cursor_state_id,
+                    )
+                ),
+                limit,
+            )
+        )
     return lambda_stmt(
         lambda: _apply_entities_devices_context_union(
             select_events_without_states(start_day, end_day, event_type_ids).where(
@@ -29,6 +29,7 @@ from .helpers import (
 )
 from .models import LogbookConfig, async_event_to_row
 from .processor import EventProcessor
+from .queries.common import ROW_KIND_EVENT, ROW_KIND_STATE, LogbookCursor
 
 MAX_PENDING_LOGBOOK_EVENTS = 2048
 EVENT_COALESCE_TIME = 0.35
@@ -36,6 +37,8 @@ EVENT_COALESCE_TIME = 0.35
 BIG_QUERY_HOURS = 25
 # how many hours to deliver in the first chunk when we split the query
 BIG_QUERY_RECENT_HOURS = 24
+# maximum number of rows which can be requested per page
+MAX_PAGE_SIZE = 10000
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -85,6 +88,7 @@ async def _async_send_historical_events(
     event_processor: EventProcessor,
     partial: bool,
     force_send: bool = False,
+    limit: int | None = None,
 ) -> dt | None:
     """Select historical data from the database and deliver it to the websocket.
 
@@ -94,11 +98,15 @@ async def _async_send_historical_events(
     they are not stuck at a loading screen and can start looking at
     the data right away.
 
+    If limit is set only the newest page of events is delivered, the message
+    contains the cursor to fetch older events with logbook/get_events.
+
     This function returns the time of the most recent event we sent to the
     websocket.
     """
     is_big_query = (
-        not event_processor.entity_ids
+        limit is None
+        and not event_processor.entity_ids
         and not event_processor.device_ids
         and ((end_time - start_time) > timedelta(hours=BIG_QUERY_HOURS))
     )
@@ -112,6 +120,7 @@ async def _async_send_historical_events(
             formatter,
             event_processor,
             partial,
+            limit,
         )
         # If there is no last_event_time, there are no historical
         # results, but we still send an empty message
@@ -167,6 +176,7 @@ async def _async_get_ws_stream_events(
     formatter: Callable[[int, Any], dict[str, Any]],
     event_processor: EventProcessor,
     partial: bool,
+    limit: int | None = None,
 ) -> tuple[bytes, dt | None]:
     """Async wrapper around _ws_formatted_get_events."""
     return await get_instance(hass).async_add_executor_job(
@@ -177,6 +187,7 @@ async def _async_get_ws_stream_events(
         formatter,
         event_processor,
         partial,
+        limit,
     )
 
 
@@ -198,13 +209,20 @@ def _ws_stream_get_events(
     formatter: Callable[[int, Any], dict[str, Any]],
     event_processor: EventProcessor,
     partial: bool,
+    limit: int | None,
 ) -> tuple[bytes, dt | None]:
     """Fetch events and convert them to json in the executor."""
-    events = event_processor.get_events(start_day, end_day)
+    cursor: LogbookCursor | None = None
+    if limit is None:
+        events = event_processor.get_events(start_day, end_day)
+    else:
+        events, cursor = event_processor.get_events_page(start_day, end_day, limit)
     last_time = None
     if events:
         last_time = dt_util.utc_from_timestamp(events[-1]["when"])
     message = _generate_stream_message(events, start_day, end_day)
+    if limit is not None:
+        message["cursor"] = cursor._asdict() if cursor else None
     if partial:
         # This is a hint to consumers of the api that
         # we are about to send a another block of historical
@@ -259,6 +277,7 @@ async def _async_events_consumer(
         vol.Optional("end_time"): str,
         vol.Optional("entity_ids"): [str],
         vol.Optional("device_ids"): [str],
+        vol.Optional("limit"): vol.All(int, vol.Range(min=1, max=MAX_PAGE_SIZE)),
     }
 )
 @websocket_api.async_response
@@ -321,6 +340,7 @@ async def ws_event_stream(
             messages.event_message,
             event_processor,
             partial=False,
+            limit=msg.get("limit"),
         )
         return
 
@@ -393,6 +413,7 @@ async def ws_event_stream(
         # we want to make sure the client is not still spinning
         # because it is waiting for the first message
         force_send=True,
+        limit=msg.get("limit"),
     )
 
     if msg_id not in connection.subscriptions:
@@ -443,11 +464,26 @@ def _ws_formatted_get_events(
     start_time: dt,
     end_time: dt,
     event_processor: EventProcessor,
+    limit: int | None = None,
+    cursor: LogbookCursor | None = None,
 ) -> bytes:
     """Fetch events and convert them to json in the executor."""
+    if limit is None:
+        return json_bytes(
+            messages.result_message(
+                msg_id, event_processor.get_events(start_time, end_time)
+            )
+        )
+    events, next_cursor = event_processor.get_events_page(
+        start_time, end_time, limit, cursor
+    )
     return json_bytes(
         messages.result_message(
-            msg_id, event_processor.get_events(start_time, end_time)
+            msg_id,
+            {
+                "events": events,
+                "cursor": next_cursor._asdict() if next_cursor else None,
+            },
         )
     )
 
@@ -460,6 +496,12 @@ def _ws_formatted_get_events(
         vol.Optional("entity_ids"): [str],
         vol.Optional("device_ids"): [str],
         vol.Optional("context_id"): str,
+        vol.Optional("limit"): vol.All(int, vol.Range(min=1, max=MAX_PAGE_SIZE)),
+        vol.Optional("cursor"): {
+            vol.Required("time_fired_ts"): vol.Coerce(float),
+            vol.Required("row_kind"): vol.In((ROW_KIND_STATE, ROW_KIND_EVENT)),
+            vol.Required("row_id"): int,
+        },
     }
 )
 @websocket_api.async_response
@@ -485,8 +527,21 @@ async def ws_get_events(
         connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
         return
 
+    limit: int | None = msg.get("limit")
+    empty_result: list | dict[str, Any] = (
+        [] if limit is None else {"events": [], "cursor": None}
+    )
+    cursor: LogbookCursor | None = None
+    if (cursor_data := msg.get("cursor")) is not None:
+        if limit is None:
+            connection.send_error(
+                msg["id"], "invalid_cursor", "A cursor requires a limit"
+            )
+            return
+        cursor = LogbookCursor(**cursor_data)
+
     if start_time > utc_now:
-        connection.send_result(msg["id"], [])
+        connection.send_result(msg["id"], empty_result)
         return
 
     device_ids = msg.get("device_ids")
@@ -496,7 +551,7 @@ async def ws_get_events(
         entity_ids = async_filter_entities(hass, entity_ids)
         if not entity_ids and not device_ids:
             # Everything has been filtered away
-            connection.send_result(msg["id"], [])
+            connection.send_result(msg["id"], empty_result)
             return
 
     event_types = async_determine_event_types(hass, entity_ids, device_ids)
@@ -518,5 +573,7 @@ async def ws_get_events(
             start_time,
             end_time,
             event_processor,
+            limit,
+            cursor,
         )
     )
@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.trace import async_remove_trace_sampler
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -39,10 +40,12 @@ from homeassistant.core import (
     SupportsResponse,
     callback,
 )
+from homeassistant.helpers import reference_graph
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import make_entity_service_schema
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.reference_graph import ReferenceType
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -88,19 +91,12 @@ def is_on(hass, entity_id):
 
 
 def _scripts_with_x(
-    hass: HomeAssistant, referenced_id: str, property_name: str
+    hass: HomeAssistant, referenced_id: str, reference_type: ReferenceType
 ) -> list[str]:
     """Return all scripts that reference the x."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component: EntityComponent[BaseScriptEntity] = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if referenced_id in getattr(script_entity, property_name)
-    ]
+    return reference_graph.async_get(hass).async_get_referencing(
+        DOMAIN, reference_type, referenced_id
+    )
 
 
 def _x_in_script(hass: HomeAssistant, entity_id: str, property_name: str) -> list[str]:
@@ -119,7 +115,7 @@ def _x_in_script(hass: HomeAssistant, entity_id: str, property_name: str) -> lis
 @callback
 def scripts_with_entity(hass: HomeAssistant, entity_id: str) -> list[str]:
     """Return all scripts that reference the entity."""
-    return _scripts_with_x(hass, entity_id, "referenced_entities")
+    return _scripts_with_x(hass, entity_id, ReferenceType.ENTITY)
 
 
 @callback
@@ -131,7 +127,7 @@ def entities_in_script(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def scripts_with_device(hass: HomeAssistant, device_id: str) -> list[str]:
     """Return all scripts that reference the device."""
-    return _scripts_with_x(hass, device_id, "referenced_devices")
+    return _scripts_with_x(hass, device_id, ReferenceType.DEVICE)
 
 
 @callback
@@ -143,7 +139,7 @@ def devices_in_script(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def scripts_with_area(hass: HomeAssistant, area_id: str) -> list[str]:
     """Return all scripts that reference the area."""
-    return _scripts_with_x(hass, area_id, "referenced_areas")
+    return _scripts_with_x(hass, area_id, ReferenceType.AREA)
 
 
 @callback
@@ -155,7 +151,7 @@ def areas_in_script(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def scripts_with_floor(hass: HomeAssistant, floor_id: str) -> list[str]:
     """Return all scripts that reference the floor."""
-    return _scripts_with_x(hass, floor_id, "referenced_floors")
+    return _scripts_with_x(hass, floor_id, ReferenceType.FLOOR)
 
 
 @callback
@@ -167,7 +163,7 @@ def floors_in_script(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def scripts_with_label(hass: HomeAssistant, label_id: str) -> list[str]:
     """Return all scripts that reference the label."""
-    return _scripts_with_x(hass, label_id, "referenced_labels")
+    return _scripts_with_x(hass, label_id, ReferenceType.LABEL)
 
 
 @callback
@@ -179,16 +175,7 @@ def labels_in_script(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def scripts_with_blueprint(hass: HomeAssistant, blueprint_path: str) -> list[str]:
     """Return all scripts that reference the blueprint."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component: EntityComponent[BaseScriptEntity] = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if script_entity.referenced_blueprint == blueprint_path
-    ]
+    return _scripts_with_x(hass, blueprint_path, ReferenceType.BLUEPRINT)
 
 
 @callback
@@ -442,6 +429,27 @@ class BaseScriptEntity(ToggleEntity, ABC):
     def referenced_entities(self) -> set[str]:
         """Return a set of referenced entities."""
 
+    async def async_internal_added_to_hass(self) -> None:
+        """Register the references of the script."""
+        await super().async_internal_added_to_hass()
+        blueprint = self.referenced_blueprint
+        reference_graph.async_get(self.hass).async_set_references(
+            self.entity_id,
+            {
+                ReferenceType.AREA: self.referenced_areas,
+                ReferenceType.BLUEPRINT: (blueprint,) if blueprint else (),
+                ReferenceType.DEVICE: self.referenced_devices,
+                ReferenceType.ENTITY: self.referenced_entities,
+                ReferenceType.FLOOR: self.referenced_floors,
+                ReferenceType.LABEL: self.referenced_labels,
+            },
+        )
+
+    async def async_internal_will_remove_from_hass(self) -> None:
+        """Remove the references of the script."""
+        await super().async_internal_will_remove_from_hass()
+        reference_graph.async_get(self.hass).async_remove_references(self.entity_id)
+
 
 class UnavailableScriptEntity(BaseScriptEntity):
     """A non-functional script entity with its state set to unavailable.
@@ -642,8 +650,10 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
             context,
             self._trace_config,
         ) as script_trace:
-            # Prepare tracing the execution of the script's sequence
-            script_trace.set_trace(trace_get())
+            # Prepare tracing the execution of the script's sequence, unless
+            # the trace policy skips tracing this run
+            if script_trace is not None:
+                script_trace.set_trace(trace_get())
             with trace_path("sequence"):
                 this = None
                 if state := self.hass.states.get(self.entity_id):
@@ -702,6 +712,7 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
 
         # remove service
         self.hass.services.async_remove(DOMAIN, self.unique_id)
+        async_remove_trace_sampler(self.hass, f"{DOMAIN}.{self.unique_id}")
 
 
 @websocket_api.websocket_command({"type": "script/config", "entity_id": str})
@@ -9,9 +9,12 @@ from typing import Any
 from homeassistant.components.trace import (
     CONF_STORED_TRACES,
     ActionTrace,
+    TracePolicy,
+    async_get_trace_sampler,
     async_store_trace,
 )
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.trace import trace_disable
 
 from .const import DOMAIN
 
@@ -30,10 +33,22 @@ def trace_script(
     blueprint_inputs: dict[str, Any],
     context: Context,
     trace_config: dict[str, Any],
-) -> Iterator[ScriptTrace]:
+) -> Iterator[ScriptTrace | None]:
     """Trace execution of a script."""
+    sampler = async_get_trace_sampler(hass, f"{DOMAIN}.{item_id}", trace_config)
+    if not sampler.start_run():
+        # Don't record anything for runs which are not going to be stored
+        trace_disable()
+        yield None
+        return
+
     trace = ScriptTrace(item_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    stored_traces = trace_config[CONF_STORED_TRACES]
+    # With the errors policy the trace is only stored when the run failed
+    store_on_error = sampler.policy is TracePolicy.ERRORS
+    if not store_on_error:
+        async_store_trace(hass, trace, stored_traces)
+        sampler.traced_runs += 1
 
     try:
         yield trace
@@ -44,3 +59,6 @@ def trace_script(
     finally:
         if item_id:
             trace.finished()
+        if store_on_error and trace.failed:
+            async_store_trace(hass, trace, stored_traces)
+            sampler.traced_runs += 1
@@ -12,12 +12,15 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from aiohttp import web
+from lru import LRU
 import numpy as np
 
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.singleton import singleton
 from homeassistant.util.decorator import Registry
+from homeassistant.util.hass_dict import HassKey
 
 from .const import (
     ATTR_STREAMS,
@@ -27,7 +30,7 @@ from .const import (
 )
 
 if TYPE_CHECKING:
-    from av import CodecContext, Packet
+    from av import CodecContext, Packet, VideoFrame
 
     from homeassistant.components.camera import DynamicStreamSettings
 
@@ -35,6 +38,13 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+DATA_KEYFRAME_DECODE_SEMAPHORE: HassKey[asyncio.Semaphore] = HassKey(
+    "stream_keyframe_decode_semaphore"
+)
+# Number of image sizes to keep for the last keyframe of a stream
+KEYFRAME_IMAGE_CACHE_SIZE = 8
+MAX_CONCURRENT_KEYFRAME_DECODES = 4
+
 PROVIDERS: Registry[str, type[StreamOutput]] = Registry()
 
 
@@ -416,6 +426,13 @@ TRANSFORM_IMAGE_FUNCTION = (
 )
 
 
+@callback
+@singleton(DATA_KEYFRAME_DECODE_SEMAPHORE)
+def _async_get_decode_semaphore(hass: HomeAssistant) -> asyncio.Semaphore:
+    """Return the semaphore limiting concurrent keyframe decodes."""
+    return asyncio.Semaphore(MAX_CONCURRENT_KEYFRAME_DECODES)
+
+
 class KeyFrameConverter:
     """Enables generating and getting an image from the last keyframe seen in the stream.
 
@@ -449,6 +466,9 @@ class KeyFrameConverter:
         self._turbojpeg = TurboJPEGSingleton.instance()
         self._lock = asyncio.Lock()
         self._codec_context: CodecContext | None = None
+        # The last decoded keyframe and the images generated from it
+        self._frame: VideoFrame | None = None
+        self._images: LRU[tuple[int, ...], bytes] = LRU(KEYFRAME_IMAGE_CACHE_SIZE)
         self._stream_settings = stream_settings
         self._dynamic_stream_settings = dynamic_stream_settings
 
@@ -484,6 +504,13 @@ class KeyFrameConverter:
         """Transform image to a given orientation."""
         return TRANSFORM_IMAGE_FUNCTION[orientation](image)
 
+    def _image_key(self, width: int | None, height: int | None) -> tuple[int, ...]:
+        """Return the key of the image of the keyframe for a size."""
+        orientation = self._dynamic_stream_settings.orientation
+        if width and height:
+            return (width, height, orientation)
+        return (orientation,)
+
     def _generate_image(self, width: int | None, height: int | None) -> None:
         """Generate the keyframe image.
 
@@ -492,8 +519,34 @@ class KeyFrameConverter:
         at a time per instance.
         """
 
-        if not (self._turbojpeg and self._packet and self._codec_context):
+        if not self._turbojpeg:
+            return
+        if self._packet and self._codec_context:
+            self._decode_packet()
+        if self._frame is None:
             return
+        orientation = self._dynamic_stream_settings.orientation
+        key = self._image_key(width, height)
+        if (image := self._images.get(key)) is None:
+            frame = self._frame
+            if width and height:
+                if orientation >= 5:
+                    frame = frame.reformat(width=height, height=width)
+                else:
+                    frame = frame.reformat(width=width, height=height)
+            bgr_array = self.transform_image(
+                frame.to_ndarray(format="bgr24"), orientation
+            )
+            image = self._images[key] = bytes(self._turbojpeg.encode(bgr_array))
+        self._image = image
+
+    def _decode_packet(self) -> None:
+        """Decode the stashed keyframe packet.
+
+        The images generated from the previous keyframe are dropped once a
+        newer keyframe has been decoded.
+        """
+        assert self._codec_context
         packet = self._packet
         self._packet = None
         for _ in range(2):  # Retry once if codec context needs to be flushed
@@ -513,17 +566,8 @@ class KeyFrameConverter:
             _LOGGER.debug("Unable to decode keyframe")
             return
         if frames:
-            frame = frames[0]
-            if width and height:
-                if self._dynamic_stream_settings.orientation >= 5:
-                    frame = frame.reformat(width=height, height=width)
-                else:
-                    frame = frame.reformat(width=width, height=height)
-            bgr_array = self.transform_image(
-                frame.to_ndarray(format="bgr24"),
-                self._dynamic_stream_settings.orientation,
-            )
-            self._image = bytes(self._turbojpeg.encode(bgr_array))
+            self._frame = frames[0]
+            self._images.clear()
 
     async def async_get_image(
         self,
@@ -538,5 +582,14 @@ class KeyFrameConverter:
             self._event.clear()
             await self._event.wait()
         async with self._lock:
-            await self._hass.async_add_executor_job(self._generate_image, width, height)
+            key = self._image_key(width, height)
+            # Images are reused until a newer keyframe arrives
+            if self._packet is None and (image := self._images.get(key)) is not None:
+                self._image = image
+                return image
+            # Limit the number of keyframes decoded at once across all streams
+            async with _async_get_decode_semaphore(self._hass):
+                await self._hass.async_add_executor_job(
+                    self._generate_image, width, height
+                )
         return self._image
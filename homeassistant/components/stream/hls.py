@@ -20,6 +20,7 @@ from .const import (
 from .core import (
     PROVIDERS,
     IdleTimer,
+    Part,
     Segment,
     StreamOutput,
     StreamSettings,
@@ -64,6 +65,10 @@ class HlsStreamOutput(StreamOutput):
             deque_maxlen=MAX_SEGMENTS,
         )
         self._target_duration = stream_settings.min_segment_duration
+        # The last rendered playlist and the state of the segments it shows
+        self.rendered_playlist: (
+            tuple[tuple[int, int, int, float, float], bytes] | None
+        ) = None
 
     @property
     def name(self) -> str:
@@ -74,6 +79,7 @@ class HlsStreamOutput(StreamOutput):
         """Handle cleanup."""
         super().cleanup()
         self._segments.clear()
+        self.rendered_playlist = None
 
     @property
     def target_duration(self) -> float:
@@ -232,6 +238,25 @@ class HlsPlaylistView(StreamView):
 
         return "\n".join(playlist) + "\n"
 
+    @classmethod
+    def render_encoded(cls, track: HlsStreamOutput) -> bytes:
+        """Render the HLS playlist, reusing it until a segment or part is added."""
+        segments = track.get_segments()
+        last_segment = segments[-1]
+        key = (
+            segments[0].sequence,
+            last_segment.sequence,
+            len(last_segment.parts),
+            last_segment.duration,
+            track.target_duration,
+        )
+        if (rendered := track.rendered_playlist) is None or rendered[0] != key:
+            rendered = track.rendered_playlist = (
+                key,
+                cls.render(track).encode("utf-8"),
+            )
+        return rendered[1]
+
     @staticmethod
     def bad_request(blocking: bool, target_duration: float) -> web.Response:
         """Return a HTTP Bad Request response."""
@@ -325,7 +350,7 @@ class HlsPlaylistView(StreamView):
                 return self.not_found(blocking_request, track.target_duration)
 
         response = web.Response(
-            body=self.render(track).encode("utf-8"),
+            body=self.render_encoded(track),
             headers={
                 "Content-Type": FORMAT_CONTENT_TYPE[HLS_PROVIDER],
             },
@@ -425,9 +450,21 @@ class HlsSegmentView(StreamView):
                 body=None,
                 status=HTTPStatus.NOT_FOUND,
             )
-        return web.Response(
-            body=segment.get_data(),
-            headers={
-                "Content-Type": "video/iso.segment",
-            },
-        )
+        return await _async_send_parts(request, segment.parts[:])
+
+
+async def _async_send_parts(
+    request: web.Request, parts: list[Part]
+) -> web.StreamResponse:
+    """Send the data of parts without joining them into a new buffer."""
+    response = web.StreamResponse(
+        headers={
+            "Content-Type": "video/iso.segment",
+        },
+    )
+    response.content_length = sum(len(part.data) for part in parts)
+    await response.prepare(request)
+    for part in parts:
+        await response.write(part.data)
+    await response.write_eof()
+    return response
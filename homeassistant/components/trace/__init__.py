@@ -19,13 +19,18 @@ from homeassistant.util.limited_size_dict import LimitedSizeDict
 
 from . import websocket_api
 from .const import (
+    CONF_SAMPLE_RATE,
     CONF_STORED_TRACES,
+    CONF_TRACE_POLICY,
     DATA_TRACE,
+    DATA_TRACE_SAMPLERS,
     DATA_TRACE_STORE,
     DATA_TRACES_RESTORED,
+    DEFAULT_SAMPLE_RATE,
     DEFAULT_STORED_TRACES,
+    TracePolicy,
 )
-from .models import ActionTrace, BaseTrace, RestoredTrace
+from .models import ActionTrace, BaseTrace, RestoredTrace, TraceSampler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,7 +40,11 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_TRACE_POLICY, default=TracePolicy.FULL): vol.Coerce(TracePolicy),
+    vol.Optional(CONF_SAMPLE_RATE, default=DEFAULT_SAMPLE_RATE): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
 }
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -135,6 +144,33 @@ async def async_list_traces(
     return traces
 
 
+@callback
+def async_get_trace_sampler(
+    hass: HomeAssistant, key: str, trace_config: ConfigType
+) -> TraceSampler:
+    """Return the sampler of a script or automation, updated to its config."""
+    samplers: dict[str, TraceSampler] = hass.data.setdefault(DATA_TRACE_SAMPLERS, {})
+    if (sampler := samplers.get(key)) is None:
+        sampler = samplers[key] = TraceSampler()
+    sampler.policy = trace_config[CONF_TRACE_POLICY]
+    sampler.sample_rate = trace_config[CONF_SAMPLE_RATE]
+    return sampler
+
+
+@callback
+def async_remove_trace_sampler(hass: HomeAssistant, key: str) -> None:
+    """Remove the sampler of a script or automation which is removed."""
+    hass.data.get(DATA_TRACE_SAMPLERS, {}).pop(key, None)
+
+
+@callback
+def async_get_trace_stats(hass: HomeAssistant, key: str) -> dict[str, Any] | None:
+    """Return the run counters of a script or automation."""
+    if (sampler := hass.data.get(DATA_TRACE_SAMPLERS, {}).get(key)) is None:
+        return None
+    return sampler.as_dict()
+
+
 def async_store_trace(
     hass: HomeAssistant, trace: ActionTrace, stored_traces: int
 ) -> None:
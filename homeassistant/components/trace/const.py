@@ -1,7 +1,22 @@
 """Shared constants for script and automation tracing and debugging."""
 
+from enum import StrEnum
+
+CONF_SAMPLE_RATE = "sample_rate"
 CONF_STORED_TRACES = "stored_traces"
+CONF_TRACE_POLICY = "policy"
 DATA_TRACE = "trace"
+DATA_TRACE_SAMPLERS = "trace_samplers"
 DATA_TRACE_STORE = "trace_store"
 DATA_TRACES_RESTORED = "trace_traces_restored"
+DEFAULT_SAMPLE_RATE = 10  # Trace 1 in 10 runs with the sampled policy
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+
+
+class TracePolicy(StrEnum):
+    """Which runs of a script or automation are traced."""
+
+    FULL = "full"
+    SAMPLED = "sampled"
+    ERRORS = "errors"
+    OFF = "off"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import abc
 from collections import deque
+from dataclasses import dataclass
 import datetime as dt
 from typing import Any
 
@@ -18,6 +19,36 @@ from homeassistant.helpers.trace import (
 import homeassistant.util.dt as dt_util
 import homeassistant.util.uuid as uuid_util
 
+from .const import DEFAULT_SAMPLE_RATE, TracePolicy
+
+
+@dataclass(slots=True)
+class TraceSampler:
+    """Decide which runs of a script or automation are traced and count them."""
+
+    policy: TracePolicy = TracePolicy.FULL
+    sample_rate: int = DEFAULT_SAMPLE_RATE
+    runs: int = 0
+    traced_runs: int = 0
+
+    def start_run(self) -> bool:
+        """Count a run and return if it should be traced."""
+        self.runs += 1
+        if self.policy is TracePolicy.OFF:
+            return False
+        if self.policy is TracePolicy.SAMPLED:
+            return (self.runs - 1) % self.sample_rate == 0
+        return True
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary version of the sampler."""
+        return {
+            "policy": self.policy,
+            "sample_rate": self.sample_rate,
+            "runs": self.runs,
+            "traced_runs": self.traced_runs,
+        }
+
 
 class BaseTrace(abc.ABC):
     """Base container for a script or automation trace."""
@@ -80,6 +111,11 @@ class ActionTrace(BaseTrace):
         """Set error."""
         self._error = ex
 
+    @property
+    def failed(self) -> bool:
+        """Return if the run ended with an error."""
+        return self._error is not None or self._script_execution == "error"
+
     def finished(self) -> None:
         """Set finish time."""
         self._timestamp_finish = dt_util.utcnow()
@@ -37,6 +37,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, websocket_trace_get)
     websocket_api.async_register_command(hass, websocket_trace_list)
     websocket_api.async_register_command(hass, websocket_trace_contexts)
+    websocket_api.async_register_command(hass, websocket_trace_stats)
     websocket_api.async_register_command(hass, websocket_breakpoint_clear)
     websocket_api.async_register_command(hass, websocket_breakpoint_list)
     websocket_api.async_register_command(hass, websocket_breakpoint_set)
@@ -125,6 +126,32 @@ async def websocket_trace_contexts(
     connection.send_result(msg["id"], contexts)
 
 
+@callback
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "trace/stats",
+        vol.Required("domain"): vol.In(TRACE_DOMAINS),
+        vol.Required("item_id"): str,
+    }
+)
+def websocket_trace_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the trace policy and run counters of a script or automation."""
+    key = f"{msg['domain']}.{msg['item_id']}"
+
+    if (stats := trace.async_get_trace_stats(hass, key)) is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "No runs have been recorded"
+        )
+        return
+
+    connection.send_result(msg["id"], stats)
+
+
 @callback
 @websocket_api.require_admin
 @websocket_api.websocket_command(
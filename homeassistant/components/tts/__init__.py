@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import array
 import asyncio
 from collections.abc import Mapping
 from datetime import datetime
@@ -15,9 +16,11 @@ import os
 import re
 import subprocess
 import tempfile
+import time
 from typing import Any, Final, TypedDict, final
+import wave
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import mutagen
 from mutagen.id3 import ID3, TextFrame as ID3Text
 import voluptuous as vol
@@ -39,7 +42,13 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import HassJob, HomeAssistant, ServiceCall, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HassJob,
+    HomeAssistant,
+    ServiceCall,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_component import EntityComponent
@@ -119,6 +128,9 @@ KEY_PATTERN = "{0}_{1}_{2}_{3}"
 
 SCHEMA_SERVICE_CLEAR_CACHE = vol.Schema({})
 
+# Maximum size of the voices kept in memory
+MEM_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
 
 class TTSCache(TypedDict):
     """Cached TTS file."""
@@ -223,18 +235,122 @@ async def async_convert_audio(
     to_sample_rate: int | None = None,
     to_sample_channels: int | None = None,
 ) -> bytes:
-    """Convert audio to a preferred format using ffmpeg."""
-    ffmpeg_manager = ffmpeg.get_ffmpeg_manager(hass)
-    return await hass.async_add_executor_job(
-        lambda: _convert_audio(
-            ffmpeg_manager.binary,
-            from_extension,
-            audio_bytes,
-            to_extension,
-            to_sample_rate=to_sample_rate,
-            to_sample_channels=to_sample_channels,
+    """Convert audio to a preferred format.
+
+    Channel mixing and upsampling by a whole factor of WAV audio is done
+    in-process, other conversions use ffmpeg.
+    """
+    start = time.monotonic()
+    converted: bytes | None = None
+    if from_extension == to_extension == "wav":
+        converted = await hass.async_add_executor_job(
+            _convert_wav, audio_bytes, to_sample_rate, to_sample_channels
         )
+    if converted is None:
+        ffmpeg_manager = ffmpeg.get_ffmpeg_manager(hass)
+        converted = await hass.async_add_executor_job(
+            lambda: _convert_audio(
+                ffmpeg_manager.binary,
+                from_extension,
+                audio_bytes,
+                to_extension,
+                to_sample_rate=to_sample_rate,
+                to_sample_channels=to_sample_channels,
+            )
+        )
+    _LOGGER.debug(
+        "Converted audio from %s to %s in %.3f seconds",
+        from_extension,
+        to_extension,
+        time.monotonic() - start,
     )
+    return converted
+
+
+def _convert_wav(
+    audio_bytes: bytes,
+    to_sample_rate: int | None = None,
+    to_sample_channels: int | None = None,
+) -> bytes | None:
+    """Mix and upsample by a whole factor 16-bit mono or stereo WAV audio.
+
+    Returns None if the audio can't be converted without ffmpeg, which
+    filters the audio when downsampling.
+    """
+    try:
+        with wave.open(io.BytesIO(audio_bytes), "rb") as wav_in:
+            from_sample_rate = wav_in.getframerate()
+            from_sample_channels = wav_in.getnchannels()
+            to_sample_rate = to_sample_rate or from_sample_rate
+            to_sample_channels = to_sample_channels or from_sample_channels
+            if (
+                wav_in.getsampwidth() != 2
+                or from_sample_channels not in (1, 2)
+                or to_sample_channels not in (1, 2)
+                or to_sample_rate % from_sample_rate
+            ):
+                return None
+            samples = array.array("h", wav_in.readframes(wav_in.getnframes()))
+    except (wave.Error, EOFError):
+        return None
+
+    # Mix to mono before and to stereo after upsampling,
+    # so the fewest channels are upsampled
+    channels = from_sample_channels
+    if channels > to_sample_channels:
+        samples = array.array(
+            "h",
+            [
+                (left + right) >> 1
+                for left, right in zip(samples[::2], samples[1::2], strict=True)
+            ],
+        )
+        channels = 1
+    if (factor := to_sample_rate // from_sample_rate) > 1:
+        samples = _upsample_pcm16(samples, channels, factor)
+    if channels < to_sample_channels:
+        stereo = array.array("h", bytes(4 * len(samples)))
+        stereo[::2] = samples
+        stereo[1::2] = samples
+        samples = stereo
+
+    with io.BytesIO() as wav_io:
+        with wave.open(wav_io, "wb") as wav_out:
+            wav_out.setframerate(to_sample_rate)
+            wav_out.setsampwidth(2)
+            wav_out.setnchannels(to_sample_channels)
+            wav_out.writeframes(samples.tobytes())
+
+        return wav_io.getvalue()
+
+
+def _upsample_pcm16(
+    samples: array.array[int], channels: int, factor: int
+) -> array.array[int]:
+    """Upsample interleaved 16-bit samples by a whole factor.
+
+    The samples in between the source samples are linearly interpolated,
+    each of them is computed for all frames at once.
+    """
+    resampled = array.array("h", bytes(2 * len(samples) * factor))
+    if not samples:
+        return resampled
+    stride = channels * factor
+    for channel in range(channels):
+        source = samples[channel::channels]
+        # The last sample is held
+        following = source[1:]
+        following.append(source[-1])
+        resampled[channel::stride] = source
+        for step in range(1, factor):
+            resampled[channel + step * channels :: stride] = array.array(
+                "h",
+                [
+                    sample + (next_sample - sample) * step // factor
+                    for sample, next_sample in zip(source, following, strict=True)
+                ],
+            )
+    return resampled
 
 
 def _convert_audio(
@@ -537,6 +653,8 @@ class SpeechManager:
         self.time_memory = time_memory
         self.file_cache: dict[str, str] = {}
         self.mem_cache: dict[str, TTSCache] = {}
+        # Timers removing the voices from memcache after the memory time
+        self._mem_cache_timers: dict[str, CALLBACK_TYPE] = {}
 
     def _init_cache(self) -> dict[str, str]:
         """Init cache folder and fetch files."""
@@ -557,6 +675,9 @@ class SpeechManager:
     async def async_clear_cache(self) -> None:
         """Read file cache and delete files."""
         self.mem_cache = {}
+        for cancel_timer in self._mem_cache_timers.values():
+            cancel_timer()
+        self._mem_cache_timers.clear()
 
         def remove_files() -> None:
             """Remove files from filesystem."""
@@ -643,7 +764,7 @@ class SpeechManager:
 
         # Is speech already in memory
         if cache_key in self.mem_cache:
-            filename = self.mem_cache[cache_key]["filename"]
+            filename = self._async_touch_memcache(cache_key)["filename"]
         # Is file store in file cache
         elif use_cache and cache_key in self.file_cache:
             filename = self.file_cache[cache_key]
@@ -681,8 +802,8 @@ class SpeechManager:
                     engine_instance, cache_key, message, use_cache, language, options
                 )
 
-        extension = os.path.splitext(self.mem_cache[cache_key]["filename"])[1][1:]
-        cached = self.mem_cache[cache_key]
+        cached = self._async_touch_memcache(cache_key)
+        extension = os.path.splitext(cached["filename"])[1][1:]
         if pending := cached.get("pending"):
             await pending
             cached = self.mem_cache[cache_key]
@@ -840,6 +961,8 @@ class SpeechManager:
         try:
             await self.hass.async_add_executor_job(save_speech)
             self.file_cache[cache_key] = filename
+            # The voice can be evicted from memory now
+            self._async_evict_from_memcache(cache_key)
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
 
@@ -881,8 +1004,12 @@ class SpeechManager:
         def async_remove_from_mem(_: datetime) -> None:
             """Cleanup memcache."""
             self.mem_cache.pop(cache_key, None)
+            self._mem_cache_timers.pop(cache_key, None)
 
-        async_call_later(
+        # A voice stored again gets the full memory time
+        if cancel_timer := self._mem_cache_timers.pop(cache_key, None):
+            cancel_timer()
+        self._mem_cache_timers[cache_key] = async_call_later(
             self.hass,
             self.time_memory,
             HassJob(
@@ -891,27 +1018,52 @@ class SpeechManager:
                 cancel_on_shutdown=True,
             ),
         )
+        self._async_evict_from_memcache(cache_key)
+
+    @callback
+    def _async_touch_memcache(self, cache_key: str) -> TTSCache:
+        """Mark a voice in memcache as most recently used and return it."""
+        cached = self.mem_cache[cache_key] = self.mem_cache.pop(cache_key)
+        return cached
+
+    @callback
+    def _async_evict_from_memcache(self, keep_key: str) -> None:
+        """Evict the least recently used voices while memcache is too large.
+
+        Voices are evicted before their memory time is over when many long
+        messages are generated at once. Only voices which are also in the file
+        cache are evicted, the others could not be read again.
+        """
+        mem_cache = self.mem_cache
+        size = sum(len(cached["voice"]) for cached in mem_cache.values())
+        for cache_key in list(mem_cache):
+            if size <= MEM_CACHE_MAX_BYTES:
+                break
+            cached = mem_cache[cache_key]
+            if (
+                cache_key == keep_key
+                or cached["pending"]
+                or cache_key not in self.file_cache
+            ):
+                continue
+            size -= len(cached["voice"])
+            del mem_cache[cache_key]
+            if cancel_timer := self._mem_cache_timers.pop(cache_key, None):
+                cancel_timer()
 
     async def async_read_tts(self, filename: str) -> tuple[str | None, bytes]:
         """Read a voice file and return binary.
 
         This method is a coroutine.
         """
-        if not (record := _RE_VOICE_FILE.match(filename.lower())) and not (
-            record := _RE_LEGACY_VOICE_FILE.match(filename.lower())
-        ):
-            raise HomeAssistantError("Wrong tts file format!")
-
-        cache_key = KEY_PATTERN.format(
-            record.group(1), record.group(2), record.group(3), record.group(4)
-        )
+        cache_key = _get_cache_key(filename)
 
         if cache_key not in self.mem_cache:
             if cache_key not in self.file_cache:
                 raise HomeAssistantError(f"{cache_key} not in cache!")
             await self._async_file_to_mem(cache_key)
 
-        cached = self.mem_cache[cache_key]
+        cached = self._async_touch_memcache(cache_key)
         if pending := cached.get("pending"):
             await pending
             cached = self.mem_cache[cache_key]
@@ -919,6 +1071,16 @@ class SpeechManager:
         content, _ = mimetypes.guess_type(filename)
         return content, cached["voice"]
 
+    @callback
+    def async_get_cache_file(self, filename: str) -> str | None:
+        """Return the path of a voice file which is only cached on disk."""
+        cache_key = _get_cache_key(filename)
+        if cache_key in self.mem_cache or not (
+            cached_filename := self.file_cache.get(cache_key)
+        ):
+            return None
+        return os.path.join(self.cache_dir, cached_filename)
+
     @staticmethod
     def write_tags(
         filename: str,
@@ -982,6 +1144,18 @@ def _init_tts_cache_dir(hass: HomeAssistant, cache_dir: str) -> str:
     return cache_dir
 
 
+def _get_cache_key(filename: str) -> str:
+    """Return the cache key of a voice file."""
+    if not (record := _RE_VOICE_FILE.match(filename.lower())) and not (
+        record := _RE_LEGACY_VOICE_FILE.match(filename.lower())
+    ):
+        raise HomeAssistantError("Wrong tts file format!")
+
+    return KEY_PATTERN.format(
+        record.group(1), record.group(2), record.group(3), record.group(4)
+    )
+
+
 def _get_cache_files(cache_dir: str) -> dict[str, str]:
     """Return a dict of given engine files."""
     cache = {}
@@ -1055,9 +1229,22 @@ class TextToSpeechView(HomeAssistantView):
         """Initialize a tts view."""
         self.tts = tts
 
-    async def get(self, request: web.Request, filename: str) -> web.Response:
+    async def get(self, request: web.Request, filename: str) -> web.StreamResponse:
         """Start a get request."""
         try:
+            if cache_file := self.tts.async_get_cache_file(filename):
+                # Stream voices only cached on disk instead of loading them
+                content, _ = mimetypes.guess_type(filename)
+                response = web.FileResponse(
+                    cache_file,
+                    headers={hdrs.CONTENT_TYPE: content or "application/octet-stream"},
+                )
+                try:
+                    await response.prepare(request)
+                except FileNotFoundError:
+                    pass
+                else:
+                    return response
             content, data = await self.tts.async_read_tts(filename)
         except HomeAssistantError as err:
             _LOGGER.error("Error on load tts: %s", err)
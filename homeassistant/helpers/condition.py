@@ -6,11 +6,14 @@ import asyncio
 from collections import deque
 from collections.abc import Callable, Container, Generator
 from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, time as dt_time, timedelta
 import functools as ft
+from operator import itemgetter
 import re
 import sys
 from typing import Any, Protocol, cast
+from weakref import WeakKeyDictionary
 
 import voluptuous as vol
 
@@ -64,6 +67,7 @@ from .template import Template, attach as template_attach, render_complex
 from .trace import (
     TraceElement,
     trace_append_element,
+    trace_disabled_cv,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -91,6 +95,19 @@ _PLATFORM_ALIASES = {
     "zone": None,
 }
 
+# Relative cost of evaluating the built-in conditions. Conditions combined with
+# and, or and not are evaluated cheapest first.
+_CONDITION_COSTS = {
+    "trigger": 1,
+    "state": 2,
+    "numeric_state": 3,
+    "time": 3,
+    "sun": 4,
+    "zone": 4,
+    "template": 10,
+}
+_DISABLED = "disabled"
+
 INPUT_ENTITY_ID = re.compile(
     r"^input_(?:select|text|number|boolean|datetime)\.(?!.+__)(?!_)[\da-z_]+(?<!_)$"
 )
@@ -118,6 +135,65 @@ class ConditionProtocol(Protocol):
 type ConditionCheckerType = Callable[[HomeAssistant, TemplateVarsType], bool | None]
 
 
+@dataclass(slots=True)
+class _CompiledCondition:
+    """Evaluation plan of a condition without side effects.
+
+    The checks of an and/or condition are flattened into a single list of
+    (cost, check) sorted by cost. Leaf conditions have a single check.
+    """
+
+    operator: str | None
+    cost: int
+    checks: list[tuple[int, ConditionCheckerType]]
+
+
+_COMPILED_CONDITIONS: WeakKeyDictionary[ConditionCheckerType, _CompiledCondition] = (
+    WeakKeyDictionary()
+)
+
+
+def _compile_conditions(
+    operator: str, checks: list[ConditionCheckerType]
+) -> _CompiledCondition | None:
+    """Compile the checks of an and, or or not condition.
+
+    Returns None if any of the checks is not known to be free of side effects,
+    in which case the checks must be evaluated in configuration order.
+    """
+    # A nested or is true if any of its checks is true, which is exactly
+    # what both or and not test for
+    flatten = "and" if operator == "and" else "or"
+    plan: list[tuple[int, ConditionCheckerType]] = []
+    for check in checks:
+        if (compiled := _COMPILED_CONDITIONS.get(check)) is None:
+            return None
+        if compiled.operator == _DISABLED:
+            continue
+        if compiled.operator == flatten:
+            plan.extend(compiled.checks)
+        else:
+            plan.append((compiled.cost, check))
+    plan.sort(key=itemgetter(0))
+    return _CompiledCondition(operator, sum(cost for cost, _ in plan), plan)
+
+
+def cost_ordered_checks(
+    checks: list[ConditionCheckerType],
+) -> list[tuple[int, ConditionCheckerType]]:
+    """Return the checks with their index, cheapest first.
+
+    The checks keep their configuration order if any of them is not known to be
+    free of side effects.
+    """
+    costs: list[int] = []
+    for check in checks:
+        if (compiled := _COMPILED_CONDITIONS.get(check)) is None:
+            return list(enumerate(checks))
+        costs.append(compiled.cost)
+    return sorted(enumerate(checks), key=lambda item: costs[item[0]])
+
+
 def condition_trace_append(variables: TemplateVarsType, path: str) -> TraceElement:
     """Append a TraceElement to trace[path]."""
     trace_element = TraceElement(variables, path)
@@ -150,8 +226,12 @@ def condition_trace_update_result(**kwargs: Any) -> None:
 
 
 @contextmanager
-def trace_condition(variables: TemplateVarsType) -> Generator[TraceElement]:
+def trace_condition(variables: TemplateVarsType) -> Generator[TraceElement | None]:
     """Trace condition evaluation."""
+    if trace_disabled_cv.get():
+        # The trace policy skips tracing this run
+        yield None
+        return
     should_pop = True
     trace_element = trace_stack_top(trace_stack_cv)
     if trace_element and trace_element.reuse_by_child:
@@ -176,6 +256,8 @@ def trace_condition_function(condition: ConditionCheckerType) -> ConditionChecke
     @ft.wraps(condition)
     def wrapper(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool | None:
         """Trace condition."""
+        if trace_disabled_cv.get():
+            return condition(hass, variables)
         with trace_condition(variables):
             result = condition(hass, variables)
             condition_trace_update_result(result=result)
@@ -245,6 +327,9 @@ async def async_from_config(
                 """Condition not enabled, will act as if it didn't exist."""
                 return None
 
+            _COMPILED_CONDITIONS[disabled_condition] = _CompiledCondition(
+                _DISABLED, 0, []
+            )
             return disabled_condition
 
     # Check for partials to properly determine if coroutine function
@@ -253,8 +338,20 @@ async def async_from_config(
         check_factory = check_factory.func
 
     if asyncio.iscoroutinefunction(check_factory):
-        return cast(ConditionCheckerType, await factory(hass, config))
-    return cast(ConditionCheckerType, factory(config))
+        checker = cast(ConditionCheckerType, await factory(hass, config))
+    else:
+        checker = cast(ConditionCheckerType, factory(config))
+
+    if (
+        platform is None
+        and (cost := _CONDITION_COSTS.get(config[CONF_CONDITION])) is not None
+    ):
+        if CONF_VALUE_TEMPLATE in config:
+            cost = _CONDITION_COSTS["template"]
+        _COMPILED_CONDITIONS[checker] = _CompiledCondition(
+            None, cost, [(cost, checker)]
+        )
+    return checker
 
 
 async def async_and_from_config(
@@ -262,12 +359,25 @@ async def async_and_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'AND'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    compiled = _compile_conditions("and", checks)
 
     @trace_condition_function
     def if_and_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
         """Test and condition."""
+        if compiled is not None and trace_disabled_cv.get():
+            has_errors = False
+            for _, check in compiled.checks:
+                try:
+                    if check(hass, variables) is False:
+                        return False
+                except ConditionError:
+                    has_errors = True
+            if not has_errors:
+                return True
+            # Evaluate the checks one by one to report the errors
+
         errors = []
         for index, check in enumerate(checks):
             try:
@@ -285,6 +395,8 @@ async def async_and_from_config(
 
         return True
 
+    if compiled is not None:
+        _COMPILED_CONDITIONS[if_and_condition] = compiled
     return if_and_condition
 
 
@@ -293,12 +405,25 @@ async def async_or_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'OR'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    compiled = _compile_conditions("or", checks)
 
     @trace_condition_function
     def if_or_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
         """Test or condition."""
+        if compiled is not None and trace_disabled_cv.get():
+            has_errors = False
+            for _, check in compiled.checks:
+                try:
+                    if check(hass, variables) is True:
+                        return True
+                except ConditionError:
+                    has_errors = True
+            if not has_errors:
+                return False
+            # Evaluate the checks one by one to report the errors
+
         errors = []
         for index, check in enumerate(checks):
             try:
@@ -316,6 +441,8 @@ async def async_or_from_config(
 
         return False
 
+    if compiled is not None:
+        _COMPILED_CONDITIONS[if_or_condition] = compiled
     return if_or_condition
 
 
@@ -324,12 +451,25 @@ async def async_not_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'NOT'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    compiled = _compile_conditions("not", checks)
 
     @trace_condition_function
     def if_not_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
         """Test not condition."""
+        if compiled is not None and trace_disabled_cv.get():
+            has_errors = False
+            for _, check in compiled.checks:
+                try:
+                    if check(hass, variables):
+                        return False
+                except ConditionError:
+                    has_errors = True
+            if not has_errors:
+                return True
+            # Evaluate the checks one by one to report the errors
+
         errors = []
         for index, check in enumerate(checks):
             try:
@@ -347,6 +487,8 @@ async def async_not_from_config(
 
         return True
 
+    if compiled is not None:
+        _COMPILED_CONDITIONS[if_not_condition] = compiled
     return if_not_condition
 
 
@@ -543,6 +685,12 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
     return if_numeric_state
 
 
+@ft.lru_cache(maxsize=1024)
+def _is_input_entity_id(value: str) -> bool:
+    """Return if a required state refers to the state of an input entity."""
+    return INPUT_ENTITY_ID.match(value) is not None
+
+
 def state(
     hass: HomeAssistant,
     entity: str | State | None,
@@ -586,10 +734,7 @@ def state(
     is_state = False
     for req_state_value in req_state:
         state_value = req_state_value
-        if (
-            isinstance(req_state_value, str)
-            and INPUT_ENTITY_ID.match(req_state_value) is not None
-        ):
+        if isinstance(req_state_value, str) and _is_input_entity_id(req_state_value):
             if not (state_entity := hass.states.get(req_state_value)):
                 raise ConditionErrorMessage(
                     "state", f"the 'state' entity {req_state_value} is unavailable"
@@ -5,9 +5,11 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import timedelta
 from functools import partial
 from logging import Logger, getLogger
+import time
 from typing import TYPE_CHECKING, Any, Protocol
 
 from homeassistant import config_entries
@@ -69,8 +71,13 @@ DATA_DOMAIN_ENTITIES: HassKey[dict[str, dict[str, Entity]]] = HassKey("domain_en
 DATA_DOMAIN_PLATFORM_ENTITIES: HassKey[dict[tuple[str, str], dict[str, Entity]]] = (
     HassKey("domain_platform_entities")
 )
+DATA_POLLING_PHASES: HassKey[dict[float, set[int]]] = HassKey("entity_platform_polling")
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
+# Fractional part of the golden ratio, used to spread the polling phases of
+# platforms sharing the same scan interval evenly over the interval.
+POLLING_PHASE_STEP = 0.6180339887498949
+
 _LOGGER = getLogger(__name__)
 
 
@@ -113,6 +120,38 @@ class EntityPlatformModule(Protocol):
         """Set up an integration platform from a config entry."""
 
 
+@dataclass(slots=True)
+class PollingStats:
+    """Polling statistics of an entity platform."""
+
+    updates: int = 0
+    overruns: int = 0
+    total_duration: float = 0.0
+    max_duration: float = 0.0
+    last_duration: float | None = None
+
+    @callback
+    def async_record(self, duration: float) -> None:
+        """Record the duration of a polling cycle."""
+        self.updates += 1
+        self.total_duration += duration
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+
+    @callback
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the statistics."""
+        return {
+            "updates": self.updates,
+            "overruns": self.overruns,
+            "average_duration": (
+                self.total_duration / self.updates if self.updates else None
+            ),
+            "max_duration": self.max_duration,
+            "last_duration": self.last_duration,
+        }
+
+
 class EntityPlatform:
     """Manage the entities for a single platform."""
 
@@ -149,9 +188,11 @@ class EntityPlatform:
         self._setup_complete = False
         # Method to cancel the state change listener
         self._async_polling_timer: asyncio.TimerHandle | None = None
+        self._polling_phase_slot: int | None = None
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
+        self.polling_stats = PollingStats()
 
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
@@ -663,10 +704,40 @@ class EntityPlatform:
             return
 
         self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
+            self.scan_interval_seconds - self._async_get_polling_phase(),
             self._async_handle_interval_callback,
         )
 
+    @callback
+    def _async_get_polling_phase(self) -> float:
+        """Return the offset of the first poll into the scan interval.
+
+        Platforms which share a scan interval are shifted against each other
+        so their polls don't all happen at the same time. The first platform
+        for an interval polls at the full interval.
+        """
+        interval = self.scan_interval_seconds
+        slots = self.hass.data.setdefault(DATA_POLLING_PHASES, {}).setdefault(
+            interval, set()
+        )
+        # Reuse the lowest slot released by a platform which stopped polling
+        slot = next(slot for slot in range(len(slots) + 1) if slot not in slots)
+        slots.add(slot)
+        self._polling_phase_slot = slot
+        return (slot * POLLING_PHASE_STEP) % 1 * interval
+
+    @callback
+    def _async_release_polling_phase(self) -> None:
+        """Release the polling phase slot of the platform."""
+        if (slot := self._polling_phase_slot) is None:
+            return
+        self._polling_phase_slot = None
+        phases = self.hass.data[DATA_POLLING_PHASES]
+        interval = self.scan_interval_seconds
+        phases[interval].discard(slot)
+        if not phases[interval]:
+            del phases[interval]
+
     @callback
     def _async_handle_interval_callback(self) -> None:
         """Update all the entity states in a single platform."""
@@ -942,6 +1013,7 @@ class EntityPlatform:
         if self._async_polling_timer is not None:
             self._async_polling_timer.cancel()
             self._async_polling_timer = None
+        self._async_release_polling_phase()
 
     @callback
     def async_prepare(self) -> None:
@@ -1028,6 +1100,7 @@ class EntityPlatform:
         if self._process_updates is None:
             self._process_updates = asyncio.Lock()
         if self._process_updates.locked():
+            self.polling_stats.overruns += 1
             self.logger.warning(
                 "Updating %s %s took longer than the scheduled update interval %s",
                 self.platform_name,
@@ -1037,25 +1110,29 @@ class EntityPlatform:
             return
 
         async with self._process_updates:
-            if self._update_in_sequence or len(self.entities) <= 1:
-                # If we know we will update sequentially, we want to avoid scheduling
-                # the coroutines as tasks that will wait on the semaphore lock.
-                for entity in list(self.entities.values()):
-                    # If the entity is removed from hass during the previous
-                    # entity being updated, we need to skip updating the
-                    # entity.
-                    if entity.should_poll and entity.hass:
-                        await entity.async_update_ha_state(True)
-                return
+            start = time.monotonic()
+            await self._async_update_polling_entities()
+            self.polling_stats.async_record(time.monotonic() - start)
+
+    async def _async_update_polling_entities(self) -> None:
+        """Update the polling entities."""
+        if self._update_in_sequence or len(self.entities) <= 1:
+            # If we know we will update sequentially, we want to avoid scheduling
+            # the coroutines as tasks that will wait on the semaphore lock.
+            for entity in list(self.entities.values()):
+                # If the entity is removed from hass during the previous
+                # entity being updated, we need to skip updating the
+                # entity.
+                if entity.should_poll and entity.hass:
+                    await entity.async_update_ha_state(True)
+            return
 
-            if tasks := [
-                create_eager_task(
-                    entity.async_update_ha_state(True), loop=self.hass.loop
-                )
-                for entity in self.entities.values()
-                if entity.should_poll
-            ]:
-                await asyncio.gather(*tasks)
+        if tasks := [
+            create_eager_task(entity.async_update_ha_state(True), loop=self.hass.loop)
+            for entity in self.entities.values()
+            if entity.should_poll
+        ]:
+            await asyncio.gather(*tasks)
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
@@ -1071,6 +1148,22 @@ def async_get_current_platform() -> EntityPlatform:
     return platform
 
 
+@callback
+def async_get_polling_report(
+    hass: HomeAssistant, integration_name: str, config_entry_id: str
+) -> dict[str, dict[str, Any]]:
+    """Return polling statistics of a config entry's platforms, keyed by domain."""
+    return {
+        platform.domain: platform.polling_stats.as_dict()
+        for platform in hass.data.get(DATA_ENTITY_PLATFORM, {}).get(
+            integration_name, []
+        )
+        if platform.config_entry
+        and platform.config_entry.entry_id == config_entry_id
+        and (platform.polling_stats.updates or platform.polling_stats.overruns)
+    }
+
+
 @callback
 def async_get_platforms(
     hass: HomeAssistant, integration_name: str
@@ -527,8 +527,19 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
     - device_id -> dict[key, True]
     - area_id -> dict[key, True]
     - label -> dict[key, True]
+
+    The fields in _indexed_fields are indexed as well and can be queried
+    with get_entries_matching.
     """
 
+    _indexed_fields = (
+        "domain",
+        "platform",
+        "disabled_by",
+        "hidden_by",
+        "entity_category",
+    )
+
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
@@ -538,6 +549,8 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         self._device_id_index: RegistryIndexType = defaultdict(dict)
         self._area_id_index: RegistryIndexType = defaultdict(dict)
         self._labels_index: RegistryIndexType = defaultdict(dict)
+        self._display_json: tuple[str, bytes] | None = None
+        self._display_json_version: int | None = None
 
     def _index_entry(self, key: str, entry: RegistryEntry) -> None:
         """Index an entry."""
@@ -571,6 +584,25 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
             for label in labels:
                 self._unindex_entry_value(key, label, self._labels_index)
 
+    def get_display_json(self) -> tuple[str, bytes]:
+        """Return the version and the joined display JSON of the enabled entries.
+
+        The joined JSON is kept as long as the version of the items is unchanged.
+        """
+        if self._display_json is None or self._display_json_version != self.version:
+            self._display_json_version = self.version
+            self._display_json = (
+                str(self.version),
+                b",".join(
+                    [
+                        entry.display_json_repr
+                        for entry in self.data.values()
+                        if not entry.disabled_by and entry.display_json_repr is not None
+                    ]
+                ),
+            )
+        return self._display_json
+
     def get_device_ids(self) -> KeysView[str]:
         """Return device ids."""
         return self._device_id_index.keys()
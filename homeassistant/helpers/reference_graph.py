@@ -0,0 +1,106 @@
+"""Track which automations, scripts, scenes and groups reference what.
+
+Entities which reference other items, like an automation which references
+entities, devices and areas in its triggers and actions, register their
+references when they are added to Home Assistant and remove them when they
+are removed. This allows finding all entities of a domain which reference an
+item without iterating over all of them.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from enum import StrEnum
+from typing import Literal
+
+from homeassistant.core import HomeAssistant, callback, split_entity_id
+from homeassistant.util.hass_dict import HassKey
+
+from .singleton import singleton
+
+DATA_REFERENCE_GRAPH: HassKey[ReferenceGraph] = HassKey("reference_graph")
+
+
+class ReferenceType(StrEnum):
+    """Type of a referenced item."""
+
+    AREA = "area"
+    BLUEPRINT = "blueprint"
+    DEVICE = "device"
+    ENTITY = "entity"
+    FLOOR = "floor"
+    LABEL = "label"
+
+
+class ReferenceGraph:
+    """Reverse index of references, maintained incrementally.
+
+    Maintains two indexes:
+    - referencing entity_id -> reference type -> referenced ids
+    - (domain, reference type, referenced id) -> dict[referencing entity_id, True]
+    """
+
+    def __init__(self) -> None:
+        """Initialize the reference graph."""
+        self._references: dict[str, dict[ReferenceType, frozenset[str]]] = {}
+        self._referenced_by: defaultdict[
+            tuple[str, ReferenceType, str], dict[str, Literal[True]]
+        ] = defaultdict(dict)
+
+    @callback
+    def async_set_references(
+        self,
+        entity_id: str,
+        references: Mapping[ReferenceType, Iterable[str]],
+    ) -> None:
+        """Set the items referenced by an entity, replacing earlier references."""
+        self.async_remove_references(entity_id)
+        domain = split_entity_id(entity_id)[0]
+        referenced_by = self._referenced_by
+        stored: dict[ReferenceType, frozenset[str]] = {}
+        for reference_type, referenced_ids in references.items():
+            stored[reference_type] = frozenset(referenced_ids)
+            for referenced_id in stored[reference_type]:
+                referenced_by[(domain, reference_type, referenced_id)][entity_id] = True
+        self._references[entity_id] = stored
+
+    @callback
+    def async_remove_references(self, entity_id: str) -> None:
+        """Remove all references of an entity."""
+        if (stored := self._references.pop(entity_id, None)) is None:
+            return
+        domain = split_entity_id(entity_id)[0]
+        referenced_by = self._referenced_by
+        for reference_type, referenced_ids in stored.items():
+            for referenced_id in referenced_ids:
+                key = (domain, reference_type, referenced_id)
+                entities = referenced_by[key]
+                del entities[entity_id]
+                if not entities:
+                    del referenced_by[key]
+
+    @callback
+    def async_get_referencing(
+        self, domain: str, reference_type: ReferenceType, referenced_id: str
+    ) -> list[str]:
+        """Return entity ids of a domain which reference an item."""
+        return list(
+            self._referenced_by.get((domain, reference_type, referenced_id), ())
+        )
+
+    @callback
+    def async_get_references(
+        self, entity_id: str, reference_type: ReferenceType
+    ) -> list[str]:
+        """Return the items of a type referenced by an entity."""
+        if (stored := self._references.get(entity_id)) is None:
+            return []
+        return list(stored.get(reference_type, ()))
+
+
+@callback
+@singleton(DATA_REFERENCE_GRAPH)
+def async_get(hass: HomeAssistant) -> ReferenceGraph:
+    """Get the reference graph."""
+    return ReferenceGraph()
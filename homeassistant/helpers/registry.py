@@ -5,6 +5,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections import UserDict, defaultdict
 from collections.abc import Mapping, Sequence, ValuesView
+from itertools import count
+import time
 from typing import TYPE_CHECKING, Any, Literal
 
 from homeassistant.core import CoreState, HomeAssistant, callback
@@ -17,11 +19,33 @@ SAVE_DELAY_LONG = 180
 
 type RegistryIndexType = defaultdict[str, dict[str, Literal[True]]]
 
+# Shared by all registry item containers so a version is never reused, even
+# when a registry replaces its container. Starting from the current time keeps
+# versions handed out to clients unique across restarts.
+_VERSIONS = count(time.time_ns())
+
 
 class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
-    """Base class for registry items."""
+    """Base class for registry items.
+
+    Subclasses can list entry attributes in _indexed_fields to maintain an
+    index value -> dict[key, True] for each of them, including None values.
+    The indexes are used by get_entries_matching.
+
+    The version attribute changes whenever an item is added, replaced or
+    removed, which allows caching data derived from the items.
+    """
 
     data: dict[str, _DataT]
+    _indexed_fields: tuple[str, ...] = ()
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        self.version = next(_VERSIONS)
+        self._field_indexes: dict[str, defaultdict[Any, dict[str, Literal[True]]]] = {
+            field: defaultdict(dict) for field in self._indexed_fields
+        }
 
     def values(self) -> ValuesView[_DataT]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -40,8 +64,48 @@ class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
         data = self.data
         if key in data:
             self._unindex_entry(key, entry)
+            self._unindex_fields(key, data[key])
         data[key] = entry
         self._index_entry(key, entry)
+        self._index_fields(key, entry)
+        self.version = next(_VERSIONS)
+
+    def _index_fields(self, key: str, entry: _DataT) -> None:
+        """Index an entry by the declared fields."""
+        for field, index in self._field_indexes.items():
+            index[getattr(entry, field)][key] = True
+
+    def _unindex_fields(self, key: str, entry: _DataT) -> None:
+        """Unindex an entry from the declared field indexes."""
+        for field, index in self._field_indexes.items():
+            value = getattr(entry, field)
+            entries = index[value]
+            del entries[key]
+            if not entries:
+                del index[value]
+
+    def get_entries_matching(self, **criteria: Any) -> list[_DataT]:
+        """Return entries where each of the given indexed fields has the given value.
+
+        The smallest matching index is iterated and checked against the other
+        indexes, the registry itself is never scanned.
+        """
+        field_indexes = self._field_indexes
+        try:
+            matches = sorted(
+                (
+                    field_indexes[field].get(value, {})
+                    for field, value in criteria.items()
+                ),
+                key=len,
+            )
+        except KeyError as err:
+            raise ValueError(f"Field {err} is not indexed") from err
+        if not matches:
+            return list(self.data.values())
+        data = self.data
+        smallest, *others = matches
+        return [data[key] for key in smallest if all(key in other for other in others)]
 
     def _unindex_entry_value(
         self, key: str, value: str, index: RegistryIndexType
@@ -60,7 +124,9 @@ class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         self._unindex_entry(key)
+        self._unindex_fields(key, self.data[key])
         super().__delitem__(key)
+        self.version = next(_VERSIONS)
 
 
 class BaseRegistry[_StoreDataT: Mapping[str, Any] | Sequence[Any]](ABC):
@@ -95,6 +95,7 @@ from .trace import (
     async_trace_path,
     script_execution_set,
     trace_append_element,
+    trace_disabled_cv,
     trace_id_get,
     trace_path,
     trace_path_get,
@@ -190,8 +191,13 @@ async def trace_action(
     script_run: _ScriptRun,
     stop: asyncio.Future[None],
     variables: dict[str, Any],
-) -> AsyncGenerator[TraceElement]:
+) -> AsyncGenerator[TraceElement | None]:
     """Trace action execution."""
+    if trace_disabled_cv.get():
+        # The trace policy skips tracing this run
+        yield None
+        return
+
     path = trace_path_get()
     trace_element = action_trace_append(variables, path)
     trace_stack_push(trace_stack_cv, trace_element)
@@ -529,7 +535,8 @@ class _ScriptRun:
                         ex, continue_on_error, self._log_exceptions or log_exceptions
                     )
                 finally:
-                    trace_element.update_variables(self._variables)
+                    if trace_element is not None:
+                        trace_element.update_variables(self._variables)
 
     def _finish(self) -> None:
         self._script._runs.remove(self)  # noqa: SLF001
@@ -78,6 +78,10 @@ SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]]
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
+DATA_TARGET_CACHE: HassKey[_TargetCache] = HassKey("service_target_cache")
+
+# Maximum number of distinct device/area/floor/label targets to cache
+TARGET_CACHE_SIZE = 256
 
 
 @cache
@@ -304,6 +308,20 @@ class SelectedEntities:
         )
 
 
+type _TargetKey = tuple[frozenset[str], frozenset[str], frozenset[str], frozenset[str]]
+
+
+@dataclasses.dataclass(slots=True)
+class _TargetCache:
+    """Cache of resolved device, area, floor and label targets."""
+
+    # Versions of the registry items the cached targets were resolved from
+    versions: tuple[int, ...] = ()
+    targets: dict[_TargetKey, SelectedEntities] = dataclasses.field(
+        default_factory=dict
+    )
+
+
 @bind_hass
 def call_from_config(
     hass: HomeAssistant,
@@ -505,7 +523,7 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
 
 
 @bind_hass
-def async_extract_referenced_entity_ids(  # noqa: C901
+def async_extract_referenced_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
 ) -> SelectedEntities:
     """Extract referenced entity IDs from a service call."""
@@ -529,15 +547,60 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     ):
         return selected
 
+    resolved = _async_resolve_registry_targets(hass, selector)
+    selected.indirectly_referenced.update(resolved.indirectly_referenced)
+    selected.missing_devices.update(resolved.missing_devices)
+    selected.missing_areas.update(resolved.missing_areas)
+    selected.missing_floors.update(resolved.missing_floors)
+    selected.missing_labels.update(resolved.missing_labels)
+    selected.referenced_devices.update(resolved.referenced_devices)
+    selected.referenced_areas.update(resolved.referenced_areas)
+    return selected
+
+
+@callback
+def _async_resolve_registry_targets(
+    hass: HomeAssistant, selector: ServiceTargetSelector
+) -> SelectedEntities:
+    """Resolve the device, area, floor and label ids of a target selector.
+
+    The result only depends on the registries and is cached until any of
+    them changes. It must not be modified.
+    """
     entities = entity_registry.async_get(hass).entities
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
+    floor_reg = floor_registry.async_get(hass)
+    label_reg = label_registry.async_get(hass)
+
+    cache = hass.data.get(DATA_TARGET_CACHE)
+    if cache is None:
+        cache = hass.data[DATA_TARGET_CACHE] = _TargetCache()
+    versions = (
+        entities.version,
+        dev_reg.devices.version,
+        area_reg.areas.version,
+        floor_reg.floors.version,
+        label_reg.labels.version,
+    )
+    if cache.versions != versions:
+        cache.versions = versions
+        cache.targets.clear()
+    key = (
+        frozenset(selector.device_ids),
+        frozenset(selector.area_ids),
+        frozenset(selector.floor_ids),
+        frozenset(selector.label_ids),
+    )
+    if (selected := cache.targets.get(key)) is not None:
+        return selected
+    if len(cache.targets) >= TARGET_CACHE_SIZE:
+        cache.targets.clear()
+    selected = cache.targets[key] = SelectedEntities()
 
-    if selector.floor_ids:
-        floor_reg = floor_registry.async_get(hass)
-        for floor_id in selector.floor_ids:
-            if floor_id not in floor_reg.floors:
-                selected.missing_floors.add(floor_id)
+    for floor_id in selector.floor_ids:
+        if floor_id not in floor_reg.floors:
+            selected.missing_floors.add(floor_id)
 
     for area_id in selector.area_ids:
         if area_id not in area_reg.areas:
@@ -548,7 +611,6 @@ def async_extract_referenced_entity_ids(  # noqa: C901
             selected.missing_devices.add(device_id)
 
     if selector.label_ids:
-        label_reg = label_registry.async_get(hass)
         for label_id in selector.label_ids:
             if label_id not in label_reg.labels:
                 selected.missing_labels.add(label_id)
@@ -1156,10 +1218,7 @@ def verify_domain_control(
 
             authorized = False
 
-            for entity in reg.entities.values():
-                if entity.platform != domain:
-                    continue
-
+            for entity in reg.entities.get_entries_matching(platform=domain):
                 if user.permissions.check_entity(entity.entity_id, POLICY_CONTROL):
                     authorized = True
                     break
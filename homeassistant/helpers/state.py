@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Hashable, Iterable
 import logging
 from types import ModuleType
 from typing import Any
 
 from homeassistant.components.sun import STATE_ABOVE_HORIZON, STATE_BELOW_HORIZON
 from homeassistant.const import (
+    ATTR_ENTITY_ID,
     STATE_CLOSED,
     STATE_HOME,
     STATE_LOCKED,
@@ -21,12 +22,80 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     STATE_UNLOCKED,
 )
-from homeassistant.core import Context, HomeAssistant, State
+from homeassistant.core import Context, HomeAssistant, State, callback
 from homeassistant.loader import IntegrationNotFound, async_get_integration, bind_hass
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _freeze(value: Any) -> Hashable:
+    """Return a hashable representation of service data."""
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(val)) for key, val in value.items())
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(val) for val in value))
+    hash(value)
+    return value
+
+
+class ReproduceStateBatch:
+    """Collect the service calls needed to reproduce states.
+
+    Service calls with the same service and the same service data apart from
+    the entity id are merged into a single call targeting all their entities,
+    which allows a scene with many entities set to the same state to be
+    reproduced with a few service calls.
+    """
+
+    __slots__ = ("hass", "context", "_calls")
+
+    def __init__(self, hass: HomeAssistant, context: Context | None) -> None:
+        """Initialize the batch."""
+        self.hass = hass
+        self.context = context
+        self._calls: dict[Hashable, tuple[str, str, dict[str, Any], list[str]]] = {}
+
+    @callback
+    def async_add(
+        self, domain: str, service: str, service_data: dict[str, Any]
+    ) -> None:
+        """Add a service call for the entity in the service data."""
+        data = service_data.copy()
+        entity_id: str = data.pop(ATTR_ENTITY_ID)
+        key: Hashable
+        try:
+            key = (domain, service, _freeze(data))
+        except TypeError:
+            # Service data which can't be compared is never merged
+            key = object()
+        if (call := self._calls.get(key)) is None:
+            self._calls[key] = (domain, service, data, [entity_id])
+        else:
+            call[3].append(entity_id)
+
+    async def async_call(self) -> None:
+        """Make the collected service calls."""
+        calls = list(self._calls.values())
+        self._calls.clear()
+        await asyncio.gather(
+            *(
+                self.hass.services.async_call(
+                    domain,
+                    service,
+                    {
+                        **data,
+                        ATTR_ENTITY_ID: (
+                            entity_ids[0] if len(entity_ids) == 1 else entity_ids
+                        ),
+                    },
+                    context=self.context,
+                    blocking=True,
+                )
+                for domain, service, data, entity_ids in calls
+            )
+        )
+
+
 @bind_hass
 async def async_reproduce_state(
     hass: HomeAssistant,
@@ -44,7 +113,10 @@ async def async_reproduce_state(
     for state in states:
         to_call[state.domain].append(state)
 
+    durations: dict[str, float] = {}
+
     async def worker(domain: str, states_by_domain: list[State]) -> None:
+        start = hass.loop.time()
         try:
             integration = await async_get_integration(hass, domain)
         except IntegrationNotFound:
@@ -64,12 +136,14 @@ async def async_reproduce_state(
         await platform.async_reproduce_states(
             hass, states_by_domain, context=context, reproduce_options=reproduce_options
         )
+        durations[domain] = hass.loop.time() - start
 
     if to_call:
         # run all domains in parallel
         await asyncio.gather(
             *(worker(domain, data) for domain, data in to_call.items())
         )
+        _LOGGER.debug("Reproduced states, duration per domain: %s", durations)
 
 
 def state_as_number(state: State) -> float:
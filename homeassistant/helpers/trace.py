@@ -116,6 +116,8 @@ variables_cv: ContextVar[Any | None] = ContextVar("variables_cv", default=None)
 trace_id_cv: ContextVar[tuple[str, str] | None] = ContextVar(
     "trace_id_cv", default=None
 )
+# Set when the trace policy skips tracing the current run
+trace_disabled_cv: ContextVar[bool] = ContextVar("trace_disabled_cv", default=False)
 # Reason for stopped script execution
 script_execution_cv: ContextVar[StopReason | None] = ContextVar(
     "script_execution_cv", default=None
@@ -201,12 +203,28 @@ def trace_get(clear: bool = True) -> dict[str, deque[TraceElement]] | None:
 def trace_clear() -> None:
     """Clear the trace."""
     trace_cv.set({})
+    trace_disabled_cv.set(False)
     trace_stack_cv.set(None)
     trace_path_stack_cv.set(None)
     variables_cv.set(None)
     script_execution_cv.set(StopReason())
 
 
+def trace_disable() -> None:
+    """Disable tracing for the current run.
+
+    Trace elements, including variable snapshots, are not recorded until the
+    trace is cleared again.
+    """
+    trace_cv.set(None)
+    trace_disabled_cv.set(True)
+    trace_stack_cv.set(None)
+    trace_path_stack_cv.set(None)
+    variables_cv.set(None)
+    trace_id_cv.set(None)
+    script_execution_cv.set(StopReason())
+
+
 def trace_set_child_id(child_key: str, child_run_id: str) -> None:
     """Set child trace_id of TraceElement at the top of the stack."""
     if node := trace_stack_top(trace_stack_cv):
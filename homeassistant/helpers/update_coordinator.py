@@ -5,8 +5,10 @@ from __future__ import annotations
 from abc import abstractmethod
 import asyncio
 from collections.abc import Awaitable, Callable, Coroutine, Generator
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
+import math
 from random import randint
 from time import monotonic
 from typing import Any, Generic, Protocol
@@ -25,6 +27,7 @@ from homeassistant.exceptions import (
     ConfigEntryNotReady,
 )
 from homeassistant.util.dt import utcnow
+from homeassistant.util.hass_dict import HassKey
 
 from . import entity, event
 from .debounce import Debouncer
@@ -32,6 +35,10 @@ from .debounce import Debouncer
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
 
+DATA_COORDINATOR_GROUPS: HassKey[dict[str, CoordinatorGroup]] = HassKey(
+    "update_coordinator_groups"
+)
+
 _DataT = TypeVar("_DataT", default=dict[str, Any])
 _DataUpdateCoordinatorT = TypeVar(
     "_DataUpdateCoordinatorT",
@@ -54,6 +61,223 @@ class BaseDataUpdateCoordinatorProtocol(Protocol):
         """Listen for data updates."""
 
 
+@dataclass(slots=True)
+class CoordinatorRefreshStats:
+    """Refresh statistics of a coordinator in a group."""
+
+    refreshes: int = 0
+    failures: int = 0
+    skipped: int = 0
+    total_latency: float = 0.0
+    last_latency: float | None = None
+    last_refresh: float | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the statistics."""
+        return {
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "average_latency": (
+                self.total_latency / self.refreshes if self.refreshes else None
+            ),
+            "last_latency": self.last_latency,
+        }
+
+
+class CoordinatorGroup:
+    """Coordinate refreshes of coordinators which share an endpoint.
+
+    Scheduled refreshes of the coordinators in a group are aligned to a shared
+    refresh cycle, the shortest update interval in the group, so they are
+    started together. No more than max_concurrent updates run at the same
+    time and a scheduled refresh is skipped if the coordinator was refreshed
+    less than min_refresh_interval ago.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: str,
+        *,
+        max_concurrent: int = 1,
+        min_refresh_interval: timedelta | None = None,
+    ) -> None:
+        """Initialize the coordinator group."""
+        self.hass = hass
+        self.key = key
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._min_refresh_interval_seconds = (
+            min_refresh_interval.total_seconds() if min_refresh_interval else None
+        )
+        # All cycles of the group are aligned to the time it was created
+        self._cycle_start = hass.loop.time()
+        self._scheduled: dict[
+            DataUpdateCoordinator[Any], tuple[float, CALLBACK_TYPE]
+        ] = {}
+        self._cycle_timer: asyncio.TimerHandle | None = None
+        self._stats: dict[DataUpdateCoordinator[Any], CoordinatorRefreshStats] = {}
+
+    @callback
+    def async_add(self, coordinator: DataUpdateCoordinator[Any]) -> None:
+        """Add a coordinator to the group."""
+        self._stats.setdefault(coordinator, CoordinatorRefreshStats())
+
+    @callback
+    def async_remove(self, coordinator: DataUpdateCoordinator[Any]) -> None:
+        """Remove a coordinator from the group, dropping the group when empty."""
+        self.async_discard_refresh(coordinator)
+        self._stats.pop(coordinator, None)
+        if self._stats:
+            return
+        groups = self.hass.data.get(DATA_COORDINATOR_GROUPS, {})
+        if groups.get(self.key) is self:
+            del groups[self.key]
+
+    @callback
+    def async_schedule_refresh(
+        self,
+        coordinator: DataUpdateCoordinator[Any],
+        update_interval: float,
+        refresh: CALLBACK_TYPE,
+    ) -> None:
+        """Schedule a refresh of a coordinator in the cycle nearest its interval."""
+        # A coordinator which has been shut down is no longer a member
+        if coordinator not in self._stats:
+            return
+        now = self.hass.loop.time()
+        cycle = min(
+            (
+                interval.total_seconds()
+                for member in self._stats
+                if (interval := member.update_interval) is not None
+            ),
+            default=update_interval,
+        )
+        elapsed = now - self._cycle_start
+        # The nearest cycle to the coordinator's own schedule, but never a
+        # cycle which has already started
+        cycle_number = max(
+            round((elapsed + update_interval) / cycle), math.floor(elapsed / cycle) + 1
+        )
+        self._scheduled[coordinator] = (
+            self._cycle_start + cycle_number * cycle,
+            refresh,
+        )
+        self._async_schedule_cycle()
+
+    @callback
+    def async_discard_refresh(self, coordinator: DataUpdateCoordinator[Any]) -> None:
+        """Discard a pending refresh of a coordinator."""
+        if self._scheduled.pop(coordinator, None) is not None:
+            self._async_schedule_cycle()
+
+    @callback
+    def _async_schedule_cycle(self) -> None:
+        """Schedule the timer for the next cycle with pending refreshes."""
+        if not self._scheduled:
+            if self._cycle_timer is not None:
+                self._cycle_timer.cancel()
+                self._cycle_timer = None
+            return
+        when = min(when for when, _ in self._scheduled.values())
+        if self._cycle_timer is not None:
+            if self._cycle_timer.when() == when:
+                return
+            self._cycle_timer.cancel()
+        self._cycle_timer = self.hass.loop.call_at(when, self._async_run_cycle, when)
+
+    @callback
+    def _async_run_cycle(self, cycle_time: float) -> None:
+        """Start refreshing the coordinators which are due in this cycle."""
+        self._cycle_timer = None
+        due = [
+            (coordinator, refresh)
+            for coordinator, (when, refresh) in self._scheduled.items()
+            if when <= cycle_time
+        ]
+        for coordinator, _ in due:
+            del self._scheduled[coordinator]
+        self._async_schedule_cycle()
+
+        now = monotonic()
+        for coordinator, refresh in due:
+            if (stats := self._stats.get(coordinator)) is None:
+                continue
+            if (
+                self._min_refresh_interval_seconds is not None
+                and stats.last_refresh is not None
+                and now - stats.last_refresh < self._min_refresh_interval_seconds
+            ):
+                stats.skipped += 1
+                coordinator.async_schedule_refresh()
+                continue
+            refresh()
+
+    async def async_fetch[_T](
+        self,
+        coordinator: DataUpdateCoordinator[Any],
+        fetch: Callable[[], Awaitable[_T]],
+    ) -> _T:
+        """Fetch data for a coordinator honoring the group concurrency limit."""
+        if (stats := self._stats.get(coordinator)) is None:
+            # Explicit refreshes after shutdown are not tracked
+            async with self._semaphore:
+                return await fetch()
+        async with self._semaphore:
+            start = monotonic()
+            stats.last_refresh = start
+            try:
+                return await fetch()
+            except Exception:
+                stats.failures += 1
+                raise
+            finally:
+                latency = monotonic() - start
+                stats.refreshes += 1
+                stats.total_latency += latency
+                stats.last_latency = latency
+
+    @callback
+    def async_get_stats(self) -> list[dict[str, Any]]:
+        """Return refresh statistics of the coordinators in the group."""
+        return [
+            {
+                "name": coordinator.name,
+                "config_entry_id": (
+                    coordinator.config_entry.entry_id
+                    if coordinator.config_entry
+                    else None
+                ),
+                **stats.as_dict(),
+            }
+            for coordinator, stats in self._stats.items()
+        ]
+
+
+@callback
+def async_get_coordinator_group(
+    hass: HomeAssistant,
+    key: str,
+    *,
+    max_concurrent: int = 1,
+    min_refresh_interval: timedelta | None = None,
+) -> CoordinatorGroup:
+    """Get or create the coordinator group for a key, e.g. a host or account.
+
+    The limits are set by the first caller for a key.
+    """
+    groups = hass.data.setdefault(DATA_COORDINATOR_GROUPS, {})
+    if (group := groups.get(key)) is None:
+        group = groups[key] = CoordinatorGroup(
+            hass,
+            key,
+            max_concurrent=max_concurrent,
+            min_refresh_interval=min_refresh_interval,
+        )
+    return group
+
+
 class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     """Class to manage fetching data from single endpoint.
 
@@ -72,6 +296,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         update_method: Callable[[], Awaitable[_DataT]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        group: CoordinatorGroup | None = None,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -83,6 +308,9 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._shutdown_requested = False
         self.config_entry = config_entries.current_entry.get()
         self.always_update = always_update
+        self.group = group
+        if group is not None:
+            group.async_add(self)
 
         # It's None before the first successful update.
         # Components should call async_config_entry_first_refresh
@@ -170,6 +398,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._async_unsub_refresh()
         self._async_unsub_shutdown()
         self._debounced_refresh.async_shutdown()
+        if self.group is not None:
+            self.group.async_remove(self)
 
     @callback
     def _unschedule_refresh(self) -> None:
@@ -188,6 +418,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._unsub_refresh:
             self._unsub_refresh()
             self._unsub_refresh = None
+        if self.group is not None:
+            self.group.async_discard_refresh(self)
 
     def _async_unsub_shutdown(self) -> None:
         """Cancel any scheduled call."""
@@ -206,6 +438,12 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._update_interval = value
         self._update_interval_seconds = value.total_seconds() if value else None
 
+    @callback
+    def async_schedule_refresh(self) -> None:
+        """Schedule the next refresh if there are listeners."""
+        if self._listeners and not self.hass.is_stopping:
+            self._schedule_refresh()
+
     @callback
     def _schedule_refresh(self) -> None:
         """Schedule a refresh."""
@@ -219,6 +457,14 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         # than the debouncer cooldown, this would cause the debounce to never be called
         self._async_unsub_refresh()
 
+        if self.group is not None:
+            self.group.async_schedule_refresh(
+                self,
+                self._update_interval_seconds,
+                self.__wrap_handle_refresh_interval,
+            )
+            return
+
         # We use loop.call_at because DataUpdateCoordinator does
         # not need an exact update interval which also avoids
         # calling dt_util.utcnow() on every update.
@@ -309,7 +555,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         previous_data = self.data
 
         try:
-            self.data = await self._async_update_data()
+            if self.group is None:
+                self.data = await self._async_update_data()
+            else:
+                self.data = await self.group.async_fetch(self, self._async_update_data)
 
         except (TimeoutError, requests.exceptions.Timeout) as err:
             self.last_exception = err
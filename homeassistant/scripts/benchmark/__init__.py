@@ -7,18 +7,28 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+import gzip
 import json
 import logging
+import pathlib
+import tempfile
 from timeit import default_timer as timer
+import tracemalloc
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import (
+    condition,
+    config_validation as cv,
+    entity_registry as er,
+)
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -312,6 +322,302 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def entity_registry_query(hass):
+    """Query a registry of 20k entities by indexed fields 10k times."""
+    entities = er.EntityRegistryItems()
+    domains = ["light", "sensor", "switch", "binary_sensor"]
+    platforms = [f"integration_{idx}" for idx in range(50)]
+    for idx in range(20000):
+        entry = er.RegistryEntry(
+            entity_id=f"{domains[idx % 4]}.entity_{idx}",
+            unique_id=str(idx),
+            platform=platforms[idx % 50],
+            disabled_by=er.RegistryEntryDisabler.USER if idx % 10 == 0 else None,
+        )
+        entities[entry.entity_id] = entry
+
+    start = timer()
+
+    for idx in range(10**4):
+        entities.get_entries_matching(
+            platform=platforms[idx % 50], domain="sensor", disabled_by=None
+        )
+
+    return timer() - start
+
+
+@benchmark
+async def condition_tree(hass):
+    """Evaluate a large and/or condition tree 10k times without tracing."""
+    for idx in range(100):
+        hass.states.async_set(f"sensor.sensor_{idx}", idx)
+        hass.states.async_set(f"binary_sensor.sensor_{idx}", "off")
+
+    config = cv.CONDITION_SCHEMA(
+        {
+            "condition": "and",
+            "conditions": [
+                {
+                    "condition": "or",
+                    "conditions": [
+                        {
+                            "condition": "template",
+                            "value_template": (
+                                f"{{{{ states('sensor.sensor_{idx}') | int > 50 }}}}"
+                            ),
+                        },
+                        {
+                            "condition": "state",
+                            "entity_id": f"binary_sensor.sensor_{idx}",
+                            "state": "off",
+                        },
+                    ],
+                }
+                for idx in range(100)
+            ],
+        }
+    )
+    check = await condition.async_from_config(hass, config)
+
+    start = timer()
+
+    for _ in range(10**4):
+        check(hass, None)
+
+    return timer() - start
+
+
+@benchmark
+async def logbook_humanify(hass):
+    """Humanify 100k logbook rows of automations turning on lights."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.logbook import models, processor
+
+    row = collections.namedtuple(
+        "Row",
+        [
+            "event_type",
+            "event_data",
+            "entity_id",
+            "state",
+            "icon",
+            "context_id_bin",
+            "context_user_id_bin",
+            "context_parent_id_bin",
+            "time_fired_ts",
+            "row_id",
+            "context_only",
+        ],
+    )
+
+    def describe_event(event):
+        """Describe an automation triggered event."""
+        return {
+            "name": event.data["name"],
+            "message": "triggered",
+            "entity_id": event.data["entity_id"],
+        }
+
+    for idx in range(100):
+        hass.states.async_set(f"light.light_{idx}", "on", {"friendly_name": f"{idx}"})
+        hass.states.async_set(f"automation.automation_{idx}", "on")
+
+    rows = []
+    for context_idx in range(1000):
+        context_id_bin = context_idx.to_bytes(16)
+        automation_id = f"automation.automation_{context_idx % 100}"
+        rows.append(
+            row(
+                "automation_triggered",
+                json.dumps({"name": automation_id, "entity_id": automation_id}),
+                None,
+                None,
+                None,
+                context_id_bin,
+                None,
+                None,
+                context_idx * 100,
+                context_idx * 100,
+                None,
+            )
+        )
+        rows.extend(
+            row(
+                None,
+                None,
+                f"light.light_{idx}",
+                "on",
+                None,
+                context_id_bin,
+                None,
+                None,
+                context_idx * 100 + idx,
+                context_idx * 100 + idx,
+                None,
+            )
+            for idx in range(1, 100)
+        )
+
+    config = models.LogbookConfig(
+        {"automation_triggered": ("automation", describe_event)}
+    )
+    logbook_run = processor.LogbookRun(
+        context_lookup={None: None},
+        external_events=config.external_events,
+        event_cache=processor.EventCache({}),
+        entity_name_cache=processor.EntityNameCache(hass),
+        include_entity_name=True,
+        format_time=processor._row_time_fired_timestamp,  # noqa: SLF001
+    )
+    context_augmenter = processor.ContextAugmenter(logbook_run)
+
+    start = timer()
+
+    # The entity registry is only used for sensors
+    for _ in processor._humanify(  # noqa: SLF001
+        hass, rows, None, logbook_run, context_augmenter
+    ):
+        pass
+
+    return timer() - start
+
+
+@benchmark
+async def static_files(hass):
+    """Request 50 frontend sized assets 10k times, revalidating half of them."""
+    # pylint: disable-next=import-outside-toplevel
+    from aiohttp import ClientSession, web
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.http.const import KEY_HASS
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.http.static import CachingStaticResource
+
+    def create_assets(directory):
+        """Create the assets with gzip siblings."""
+        for idx in range(50):
+            content = f"console.log({idx});".encode() * 20000
+            (directory / f"{idx}.js").write_bytes(content)
+            (directory / f"{idx}.js.gz").write_bytes(gzip.compress(content))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        directory = pathlib.Path(tmp_dir)
+        await hass.async_add_executor_job(create_assets, directory)
+
+        app = web.Application()
+        app[KEY_HASS] = hass
+        app.router.register_resource(CachingStaticResource("/static", str(directory)))
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+
+        etags = {}
+        async with ClientSession(auto_decompress=False) as session:
+            start = timer()
+            for count in range(10000):
+                url = f"http://127.0.0.1:{port}/static/{count % 50}.js"
+                headers = {"Accept-Encoding": "gzip"}
+                if count % 2 and url in etags:
+                    headers["If-None-Match"] = etags[url]
+                async with session.get(url, headers=headers) as resp:
+                    await resp.read()
+                    etags[url] = resp.headers["ETag"]
+            runtime = timer() - start
+
+        await runner.cleanup()
+
+    print(f"{10000 / runtime:.0f} requests/s")
+    return runtime
+
+
+@benchmark
+async def hls_segments(hass):
+    """Serve a 2 MB HLS segment of 20 parts 1000 times."""
+    # pylint: disable-next=import-outside-toplevel
+    from aiohttp import ClientSession, web
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.stream import hls
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.stream.core import Part, Segment
+
+    segment = Segment(
+        sequence=0,
+        init=b"",
+        stream_id=0,
+        start_time=dt_util.utcnow(),
+        _stream_outputs=(),
+        parts=[
+            Part(duration=0.2, has_keyframe=not idx, data=bytes(100 * 1024))
+            for idx in range(20)
+        ],
+    )
+
+    async def joined(request):
+        """Serve the segment joined into a single buffer."""
+        return web.Response(body=segment.get_data())
+
+    async def parts(request):
+        """Serve the segment part by part."""
+        return await hls._async_send_parts(request, segment.parts)  # noqa: SLF001
+
+    app = web.Application()
+    app.router.add_get("/joined.m4s", joined)
+    app.router.add_get("/parts.m4s", parts)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    async with ClientSession() as session:
+        for path in ("joined.m4s", "parts.m4s"):
+            tracemalloc.start()
+            start = timer()
+            for _ in range(1000):
+                async with session.get(f"http://127.0.0.1:{port}/{path}") as resp:
+                    async for _ in resp.content.iter_any():
+                        pass
+            runtime = timer() - start
+            allocated = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{path}: {runtime:.3f}s, peak allocation {allocated} bytes")
+
+    await runner.cleanup()
+    return runtime
+
+
+@benchmark
+async def assist_pipeline_audio(hass):
+    """Stream one hour of 16 kHz audio through gain, chunking and buffering."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.assist_pipeline import pipeline
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.assist_pipeline.ring_buffer import RingBuffer
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.assist_pipeline.vad import AudioBuffer, chunk_samples
+
+    # Satellites send audio in chunks which are not a multiple of 10 ms
+    chunk = bytes(range(256)) * 4
+    bytes_per_chunk = pipeline.AUDIO_PROCESSOR_BYTES
+    leftover_chunk_buffer = AudioBuffer(bytes_per_chunk)
+    ring_buffer = RingBuffer(16000 * 2)
+
+    start = timer()
+    for _ in range((3600 * 16000 * 2) // len(chunk)):
+        audio = pipeline._multiply_volume(chunk, 2.0)  # noqa: SLF001
+        for chunk_10ms in chunk_samples(audio, bytes_per_chunk, leftover_chunk_buffer):
+            ring_buffer.put(chunk_10ms)
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -390,6 +390,41 @@ async def test_cannot_retrieve_expired_access_token(hass: HomeAssistant) -> None
     assert manager.async_validate_access_token(access_token) is None
 
 
+async def test_validated_access_token_cache(hass: HomeAssistant) -> None:
+    """Test validated access tokens skip verification until revoked or expired."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+    assert manager.async_validate_access_token(access_token) is refresh_token
+
+    with patch(
+        "homeassistant.auth.jwt_wrapper.verify_and_decode",
+        side_effect=AssertionError,
+    ):
+        assert manager.async_validate_access_token(access_token) is refresh_token
+
+        user.is_active = False
+        with pytest.raises(AssertionError):
+            manager.async_validate_access_token(access_token)
+
+    user.is_active = True
+    assert manager.async_validate_access_token(access_token) is refresh_token
+
+    with freeze_time(
+        dt_util.utcnow()
+        + auth_const.ACCESS_TOKEN_EXPIRATION
+        + timedelta(seconds=auth.ACCESS_TOKEN_LEEWAY + 1)
+    ):
+        assert manager.async_validate_access_token(access_token) is None
+
+    access_token = manager.async_create_access_token(refresh_token)
+    assert manager.async_validate_access_token(access_token) is refresh_token
+
+    manager.async_remove_refresh_token(refresh_token)
+    assert manager.async_validate_access_token(access_token) is None
+
+
 async def test_generating_system_user(hass: HomeAssistant) -> None:
     """Test that we can add a system user."""
     events = []
@@ -1,5 +1,6 @@
 """Websocket tests for Voice Assistant integration."""
 
+import array
 from collections.abc import AsyncGenerator
 from typing import Any
 from unittest.mock import ANY, patch
@@ -16,6 +17,7 @@ from homeassistant.components.assist_pipeline.pipeline import (
     PipelineData,
     PipelineStorageCollection,
     PipelineStore,
+    _multiply_volume,
     async_create_default_pipeline,
     async_get_pipeline,
     async_get_pipelines,
@@ -655,3 +657,22 @@ async def test_migrate_after_load(hass: HomeAssistant) -> None:
 
     assert pipeline_updated.stt_engine == "stt.test"
     assert pipeline_updated.tts_engine == "tts.test"
+
+
+def test_multiply_volume_clamps() -> None:
+    """Test volume multiplication clamps to signed 16-bit samples."""
+    samples = array.array("h", [100, -100, 20000, -20000]).tobytes()
+    assert array.array("h", _multiply_volume(samples, 2.0)).tolist() == [
+        200,
+        -200,
+        32767,
+        -32768,
+    ]
+    samples = array.array("h", [-32768, -101, 0, 101, 32767]).tobytes()
+    assert array.array("h", _multiply_volume(samples, 0.5)).tolist() == [
+        -16384,
+        -50,
+        0,
+        50,
+        16383,
+    ]
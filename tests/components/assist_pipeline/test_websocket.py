@@ -419,6 +419,48 @@ async def test_audio_pipeline_no_wake_word_entity(
         assert msg["error"] == snapshot
 
 
+async def test_pipeline_measure_latency(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    init_components,
+) -> None:
+    """Test the processing time is added to stage end events when requested."""
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {
+            "type": "assist_pipeline/run",
+            "start_stage": "intent",
+            "end_stage": "tts",
+            "input": {"text": "Are the lights on?"},
+            "measure_latency": True,
+        }
+    )
+
+    # result
+    msg = await client.receive_json()
+    assert msg["success"]
+
+    events = {}
+    while "run-end" not in events:
+        msg = await client.receive_json()
+        events[msg["event"]["type"]] = msg["event"]["data"]
+
+    assert list(events) == [
+        "run-start",
+        "intent-start",
+        "intent-end",
+        "tts-start",
+        "tts-end",
+        "run-end",
+    ]
+    for event_type, data in events.items():
+        if event_type.endswith("-start"):
+            assert "processing_time" not in data
+        else:
+            assert data["processing_time"] >= 0
+
+
 async def test_intent_timeout(
     hass: HomeAssistant,
     hass_ws_client: WebSocketGenerator,
@@ -1,18 +1,23 @@
 """The tests for the camera component."""
 
+import asyncio
 from collections.abc import Generator
 from http import HTTPStatus
 import io
 from types import ModuleType
+from typing import Any
 from unittest.mock import AsyncMock, Mock, PropertyMock, mock_open, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components import camera
 from homeassistant.components.camera.const import (
+    DATA_CAMERA_PREFS,
     DOMAIN,
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
+    PREF_SNAPSHOT_MAX_AGE,
 )
 from homeassistant.components.websocket_api import TYPE_RESULT
 from homeassistant.config import async_process_ha_core_config
@@ -244,6 +249,111 @@ async def test_get_image_fails(hass: HomeAssistant) -> None:
         await camera.async_get_image(hass, "camera.demo_camera")
 
 
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_shares_fetches(hass: HomeAssistant) -> None:
+    """Test concurrent requests share a fetch and recent snapshots are reused."""
+    fetched = asyncio.Event()
+
+    async def _camera_image(*args: Any, **kwargs: Any) -> bytes:
+        await fetched.wait()
+        return b"Test"
+
+    demo_camera = hass.data[DOMAIN].get_entity("camera.demo_camera")
+    with (
+        patch(
+            "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+            side_effect=_camera_image,
+        ) as mock_camera_image,
+        patch(
+            "homeassistant.components.camera.scale_jpeg_camera_image",
+            return_value=b"Scaled",
+        ) as mock_scale,
+    ):
+        tasks = [
+            hass.async_create_task(camera.async_get_image(hass, "camera.demo_camera"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        fetched.set()
+        images = await asyncio.gather(*tasks)
+        assert [image.content for image in images] == [b"Test"] * 3
+        assert mock_camera_image.call_count == 1
+
+        # Snapshots are not reused by default, sizes are fetched from the camera
+        image = await camera.async_get_image(
+            hass, "camera.demo_camera", width=640, height=480
+        )
+        assert image.content == b"Scaled"
+        assert mock_camera_image.call_count == 2
+        assert mock_camera_image.call_args.kwargs == {"width": 640, "height": 480}
+
+        await hass.data[DATA_CAMERA_PREFS].async_update(
+            "camera.demo_camera", snapshot_max_age=10
+        )
+        assert demo_camera.snapshot_max_age == 10
+        mock_scale.reset_mock()
+        # The source snapshot fetched first is recent enough
+        await camera.async_get_image(hass, "camera.demo_camera")
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert mock_camera_image.call_count == 2
+
+        # Other sizes are scaled from the source snapshot once
+        for _ in range(2):
+            image = await camera.async_get_image(
+                hass, "camera.demo_camera", width=640, height=480
+            )
+            assert image.content == b"Scaled"
+        assert mock_camera_image.call_count == 2
+        assert mock_scale.call_count == 1
+
+    assert demo_camera.snapshot_cache.stats.as_dict() == {
+        "requests": 8,
+        "hits": 4,
+        "shared_fetches": 2,
+        "fetches": 2,
+        "scales": 1,
+        "hit_rate": 6 / 8,
+    }
+
+
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_snapshot_max_age_expires(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the source snapshot is fetched again once it is too old."""
+    await hass.data[DATA_CAMERA_PREFS].async_update(
+        "camera.demo_camera", snapshot_max_age=10
+    )
+    with (
+        patch(
+            "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+            return_value=b"Test",
+        ) as mock_camera_image,
+        patch(
+            "homeassistant.components.camera.scale_jpeg_camera_image",
+            return_value=b"Scaled",
+        ) as mock_scale,
+    ):
+        await camera.async_get_image(hass, "camera.demo_camera", width=640, height=480)
+        assert mock_camera_image.call_args.kwargs == {"width": None, "height": None}
+        freezer.tick(5)
+        await camera.async_get_image(hass, "camera.demo_camera", width=640, height=480)
+        assert mock_camera_image.call_count == 1
+        assert mock_scale.call_count == 1
+
+        freezer.tick(5)
+        await camera.async_get_image(hass, "camera.demo_camera", width=640, height=480)
+        assert mock_camera_image.call_count == 2
+        assert mock_scale.call_count == 2
+
+        # Restore the default of the camera
+        await hass.data[DATA_CAMERA_PREFS].async_update(
+            "camera.demo_camera", snapshot_max_age=None
+        )
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert mock_camera_image.call_count == 3
+
+
 @pytest.mark.usefixtures("mock_camera")
 async def test_snapshot_service(hass: HomeAssistant) -> None:
     """Test snapshot service."""
@@ -403,6 +513,47 @@ async def test_websocket_update_preload_prefs(
     assert msg["result"][PREF_PRELOAD_STREAM] is True
 
 
+@pytest.mark.usefixtures("mock_camera")
+async def test_websocket_update_snapshot_max_age_prefs(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test updating the snapshot max age preference."""
+    client = await hass_ws_client(hass)
+    await client.send_json(
+        {"id": 7, "type": "camera/get_prefs", "entity_id": "camera.demo_camera"}
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert msg["result"][PREF_SNAPSHOT_MAX_AGE] is None
+
+    await client.send_json(
+        {
+            "id": 8,
+            "type": "camera/update_prefs",
+            "entity_id": "camera.demo_camera",
+            "snapshot_max_age": 5,
+        }
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert msg["result"][PREF_SNAPSHOT_MAX_AGE] == 5
+    demo_camera = hass.data[DOMAIN].get_entity("camera.demo_camera")
+    assert demo_camera.snapshot_max_age == 5
+
+    await client.send_json(
+        {
+            "id": 9,
+            "type": "camera/update_prefs",
+            "entity_id": "camera.demo_camera",
+            "snapshot_max_age": None,
+        }
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert msg["result"][PREF_SNAPSHOT_MAX_AGE] is None
+    assert demo_camera.snapshot_max_age == 0
+
+
 @pytest.mark.usefixtures("mock_camera")
 async def test_websocket_update_orientation_prefs(
     hass: HomeAssistant,
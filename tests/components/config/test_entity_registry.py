@@ -226,6 +226,7 @@ async def test_list_entities_for_display(
     msg = await client.receive_json()
 
     assert msg["result"] == {
+        "version": ANY,
         "entity_categories": {"0": "config", "1": "diagnostic"},
         "entities": [
             {
@@ -309,6 +310,7 @@ async def test_list_entities_for_display(
     msg = await client.receive_json()
 
     assert msg["result"] == {
+        "version": ANY,
         "entity_categories": {"0": "config", "1": "diagnostic"},
         "entities": [
             {
@@ -323,6 +325,36 @@ async def test_list_entities_for_display(
     }
 
 
+async def test_list_entities_for_display_not_modified(
+    hass: HomeAssistant,
+    client: MockHAClientWebSocket,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test list entries for display with the version of the client."""
+    entity_registry.async_get_or_create("light", "hue", "1234")
+
+    await client.send_json_auto_id({"type": "config/entity_registry/list_for_display"})
+    msg = await client.receive_json()
+    version = msg["result"]["version"]
+    assert version == str(entity_registry.entities.version)
+    assert len(msg["result"]["entities"]) == 1
+
+    await client.send_json_auto_id(
+        {"type": "config/entity_registry/list_for_display", "version": version}
+    )
+    msg = await client.receive_json()
+    assert msg["result"] == {"version": version, "not_modified": True}
+
+    entity_registry.async_get_or_create("light", "hue", "5678")
+
+    await client.send_json_auto_id(
+        {"type": "config/entity_registry/list_for_display", "version": version}
+    )
+    msg = await client.receive_json()
+    assert msg["result"]["version"] != version
+    assert len(msg["result"]["entities"]) == 2
+
+
 async def test_get_entity(hass: HomeAssistant, client: MockHAClientWebSocket) -> None:
     """Test get entry."""
     mock_registry(
@@ -1033,6 +1033,84 @@ async def test_no_states_matched_default_error(
         )
 
 
+@pytest.mark.usefixtures("init_components")
+async def test_slot_lists_updated_incrementally(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test only the names of changed entities are rebuilt."""
+    area_registry.async_create("kitchen")
+    kitchen_light = entity_registry.async_get_or_create("light", "demo", "1234")
+    kitchen_light = entity_registry.async_update_entity(
+        kitchen_light.entity_id, name="kitchen light"
+    )
+    hass.states.async_set(
+        kitchen_light.entity_id,
+        "on",
+        attributes={ATTR_FRIENDLY_NAME: kitchen_light.name},
+    )
+
+    async def get_slot_lists() -> dict[str, Any]:
+        with patch(
+            "homeassistant.components.conversation.default_agent.DefaultAgent._recognize",
+            return_value=None,
+        ) as mock_recognize_all:
+            await conversation.async_converse(
+                hass, "turn on the kitchen light", None, Context(), None
+            )
+        return {
+            key: sorted(value.text_in.text for value in slot_list.values)
+            for key, slot_list in mock_recognize_all.call_args[0][2].items()
+        }
+
+    with patch.object(
+        default_agent.DefaultAgent,
+        "_make_entity_names",
+        autospec=True,
+        side_effect=default_agent.DefaultAgent._make_entity_names,
+    ) as mock_make_entity_names:
+        assert await get_slot_lists() == {
+            "area": ["kitchen"],
+            "name": ["kitchen light"],
+            "floor": [],
+        }
+        assert mock_make_entity_names.call_count == 1
+
+        entity_registry.async_update_entity(
+            kitchen_light.entity_id, aliases={"ceiling light"}
+        )
+        hass.states.async_set(
+            "light.hallway", "off", attributes={ATTR_FRIENDLY_NAME: "hallway light"}
+        )
+        hass.states.async_set("light.unrelated", "off")
+        hass.states.async_set("light.unrelated", "on")
+        area_registry.async_create("hallway")
+        await hass.async_block_till_done()
+
+        assert await get_slot_lists() == {
+            "area": ["hallway", "kitchen"],
+            "name": ["ceiling light", "hallway light", "kitchen light", "unrelated"],
+            "floor": [],
+        }
+        # Only the changed and added entities are rebuilt
+        assert mock_make_entity_names.call_count == 4
+
+        hass.states.async_remove("light.hallway")
+        await hass.async_block_till_done()
+
+        agent = default_agent.async_get_default_agent(hass)
+        unrelated_names = agent._entity_names["light.unrelated"]
+        assert (await get_slot_lists())["name"] == [
+            "ceiling light",
+            "kitchen light",
+            "unrelated",
+        ]
+        assert mock_make_entity_names.call_count == 4
+        # The slot values of unchanged entities are reused
+        assert agent._entity_names["light.unrelated"] is unrelated_names
+
+
 @pytest.mark.usefixtures("init_components")
 async def test_empty_aliases(
     hass: HomeAssistant,
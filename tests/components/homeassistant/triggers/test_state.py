@@ -1771,3 +1771,73 @@ async def test_variables_priority(
     await hass.async_block_till_done()
     assert len(service_calls) == 2
     assert service_calls[1].data["some"] == "test.entity_2 - 0:00:10"
+
+
+async def test_triggers_share_patterns(
+    hass: HomeAssistant, service_calls: list[ServiceCall]
+) -> None:
+    """Test state triggers with the same pattern share one decision table."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "to": ["world", "planet"],
+                    },
+                    "action": {"service": "test.automation", "data": {"id": 1}},
+                },
+                {
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "to": "world",
+                    },
+                    "action": {"service": "test.automation", "data": {"id": 2}},
+                },
+                {
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": ["test.entity", "test.other"],
+                        "to": ["world", "planet"],
+                    },
+                    "action": {"service": "test.automation", "data": {"id": 3}},
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    multiplexer = state_trigger.async_get_multiplexer(hass)
+    entity_triggers = multiplexer._entities["test.entity"]
+    assert len(entity_triggers.listeners) == 3
+    assert len(entity_triggers.patterns) == 2
+    assert len(multiplexer._entities["test.other"].patterns) == 1
+
+    with patch.object(
+        state_trigger._StatePattern,
+        "async_match",
+        autospec=True,
+        side_effect=state_trigger._StatePattern.async_match,
+    ) as mock_match:
+        hass.states.async_set("test.entity", "world")
+        await hass.async_block_till_done()
+
+    assert mock_match.call_count == 2
+    assert sorted(call.data["id"] for call in service_calls) == [1, 2, 3]
+
+    service_calls.clear()
+    hass.states.async_set("test.entity", "planet")
+    await hass.async_block_till_done()
+    assert sorted(call.data["id"] for call in service_calls) == [1, 3]
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    assert multiplexer._entities == {}
@@ -1,5 +1,6 @@
 """The tests for http static files."""
 
+import gzip
 from http import HTTPStatus
 from pathlib import Path
 
@@ -81,3 +82,127 @@ async def test_async_register_static_paths(
     assert resp.status == HTTPStatus.OK
     resp = await client.get("/something_else/__init__.py")
     assert resp.status == HTTPStatus.OK
+
+
+async def test_precompressed_and_not_modified(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test pre-compressed siblings are served and ETags are revalidated."""
+    content = b"console.log('hello');" * 100
+    (tmp_path / "app.js").write_bytes(content)
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(content))
+    (tmp_path / "plain.js").write_bytes(content)
+
+    app = hass.http.app
+    resource = CachingStaticResource("/assets", str(tmp_path))
+    app.router.register_resource(resource)
+    app[KEY_ALLOW_CONFIGURED_CORS](resource)
+
+    resp = await mock_http_client.get(
+        "/assets/app.js", headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    assert resp.headers["Content-Type"] == "text/javascript"
+    assert await resp.read() == content
+    etag = resp.headers["ETag"]
+
+    resp = await mock_http_client.get(
+        "/assets/app.js",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": etag},
+    )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+    assert resp.headers["ETag"] == etag
+
+    # The uncompressed file has its own ETag
+    resp = await mock_http_client.get(
+        "/assets/app.js",
+        headers={"Accept-Encoding": "identity", "If-None-Match": etag},
+    )
+    assert resp.status == HTTPStatus.OK
+    assert "Content-Encoding" not in resp.headers
+    assert resp.headers["ETag"] != etag
+    assert await resp.read() == content
+
+    resp = await mock_http_client.get(
+        "/assets/plain.js", headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert "Content-Encoding" not in resp.headers
+    assert "Vary" not in resp.headers
+    assert await resp.read() == content
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "content_encoding"),
+    [
+        ("gzip, deflate", "gzip"),
+        ("GZIP;q=0.5", "gzip"),
+        ("*", "gzip"),
+        ("gzip;q=0", None),
+        ("*, gzip;q=0", None),
+        ("x-gzip", None),
+        ("identity", None),
+    ],
+)
+async def test_precompressed_accept_encoding(
+    hass: HomeAssistant,
+    mock_http_client: TestClient,
+    tmp_path: Path,
+    accept_encoding: str,
+    content_encoding: str | None,
+) -> None:
+    """Test pre-compressed siblings are only served when accepted."""
+    content = b"console.log('hello');" * 100
+    (tmp_path / "app.js").write_bytes(content)
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(content))
+
+    app = hass.http.app
+    resource = CachingStaticResource("/assets", str(tmp_path))
+    app.router.register_resource(resource)
+    app[KEY_ALLOW_CONFIGURED_CORS](resource)
+
+    resp = await mock_http_client.get(
+        "/assets/app.js",
+        headers={"Accept-Encoding": accept_encoding},
+        auto_decompress=False,
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers.get("Content-Encoding") == content_encoding
+    body = await resp.read()
+    assert (gzip.decompress(body) if content_encoding else body) == content
+
+
+async def test_precompressed_sibling_changed(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test the siblings of a file are looked up again when it changes."""
+    content = b"console.log('hello');" * 100
+    path = tmp_path / "app.js"
+    path.write_bytes(content)
+
+    app = hass.http.app
+    resource = CachingStaticResource("/assets", str(tmp_path))
+    app.router.register_resource(resource)
+    app[KEY_ALLOW_CONFIGURED_CORS](resource)
+
+    resp = await mock_http_client.get(
+        "/assets/app.js", headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert "Content-Encoding" not in resp.headers
+    etag = resp.headers["ETag"]
+
+    content = b"console.log('hello again');" * 100
+    path.write_bytes(content)
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(content))
+
+    resp = await mock_http_client.get(
+        "/assets/app.js",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": etag},
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert resp.headers["ETag"] != etag
+    assert await resp.read() == content
@@ -281,6 +281,65 @@ def test_process_custom_logbook_entries(hass_) -> None:
     assert_entry(entries[0], name=name, message=message, entity_id=entity_id)
 
 
+def test_context_described_once(hass_: HomeAssistant) -> None:
+    """Test the context of rows sharing a context is only described once."""
+    describe_event = Mock(
+        return_value={"name": "Motion", "entity_id": "automation.motion"}
+    )
+    hass_.data[logbook.DOMAIN].external_events["test_event"] = (
+        "automation",
+        describe_event,
+    )
+    hass_.states.async_set("automation.motion", STATE_ON, {ATTR_FRIENDLY_NAME: "Hall"})
+    context = ha.Context()
+    rows = [MockRow("test_event", {}, context)]
+    for idx in range(3):
+        row = MockRow(PSEUDO_EVENT_STATE_CHANGED, {}, context)
+        row.entity_id = f"light.light_{idx}"
+        row.state = STATE_ON
+        row.icon = None
+        rows.append(row)
+
+    entries = mock_humanify(hass_, rows)
+
+    assert describe_event.call_count == 2
+    assert [entry["entity_id"] for entry in entries[1:]] == [
+        "light.light_0",
+        "light.light_1",
+        "light.light_2",
+    ]
+    for entry in entries[1:]:
+        assert entry["context_event_type"] == "test_event"
+        assert entry["context_domain"] == "automation"
+        assert entry["context_name"] == "Motion"
+        assert entry["context_entity_id"] == "automation.motion"
+        assert entry["context_entity_id_name"] == "Hall"
+
+
+def test_context_summaries_scoped_to_run(hass_: HomeAssistant) -> None:
+    """Test context summaries are not shared between logbook runs."""
+    describe_event = Mock(return_value={"name": "Motion"})
+    hass_.data[logbook.DOMAIN].external_events["test_event"] = (
+        "automation",
+        describe_event,
+    )
+    context = ha.Context()
+    context_row = MockRow("test_event", {}, context)
+    row = MockRow(PSEUDO_EVENT_STATE_CHANGED, {}, context)
+    row.entity_id = "light.kitchen"
+    row.state = STATE_ON
+    row.icon = None
+
+    assert mock_humanify(hass_, [context_row, row])[1]["context_name"] == "Motion"
+    assert describe_event.call_count == 2
+
+    describe_event.return_value = {"name": "Renamed motion"}
+    assert (
+        mock_humanify(hass_, [context_row, row])[1]["context_name"] == "Renamed motion"
+    )
+    assert describe_event.call_count == 4
+
+
 def assert_entry(
     entry, when=None, name=None, message=None, domain=None, entity_id=None
 ):
@@ -6,6 +6,7 @@ from datetime import timedelta
 from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant import core
@@ -296,6 +297,296 @@ async def test_get_events(
     assert isinstance(results[0]["when"], float)
 
 
+async def test_get_events_paginated(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events with a limit returns pages of older events."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    for idx in range(5):
+        hass.states.async_set("light.kitchen", STATE_ON if idx % 2 else STATE_OFF)
+        await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "entity_ids": ["light.kitchen"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    all_events = response["result"]
+    assert len(all_events) == 4
+
+    pages = []
+    cursor = None
+    for msg_id in range(2, 10):
+        request = {
+            "id": msg_id,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "entity_ids": ["light.kitchen"],
+            "limit": 3,
+        }
+        if cursor is not None:
+            request["cursor"] = cursor
+        await client.send_json(request)
+        response = await client.receive_json()
+        assert response["success"]
+        pages.insert(0, response["result"]["events"])
+        if (cursor := response["result"]["cursor"]) is None:
+            break
+
+    assert len(pages) > 1
+    assert [event for page in pages for event in page] == all_events
+
+    await client.send_json(
+        {
+            "id": 20,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "entity_ids": ["light.kitchen"],
+            "cursor": {"time_fired_ts": 1.0, "row_kind": 0, "row_id": 1},
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_cursor"
+
+
+async def test_get_events_paginated_same_time(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test logbook get_events pages through events that share a timestamp."""
+    start = dt_util.utcnow() - timedelta(seconds=1)
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    entity_ids = [f"light.light_{idx}" for idx in range(5)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, STATE_OFF)
+    await hass.async_block_till_done()
+    freezer.tick(1)
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, STATE_ON)
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    events = []
+    cursor = None
+    for msg_id in range(1, 10):
+        request = {
+            "id": msg_id,
+            "type": "logbook/get_events",
+            "start_time": start.isoformat(),
+            "entity_ids": entity_ids,
+            "limit": 2,
+        }
+        if cursor is not None:
+            request["cursor"] = cursor
+        await client.send_json(request)
+        response = await client.receive_json()
+        assert response["success"]
+        events = response["result"]["events"] + events
+        if (cursor := response["result"]["cursor"]) is None:
+            break
+
+    assert len({event["when"] for event in events}) == 1
+    assert sorted(event["entity_id"] for event in events) == entity_ids
+
+
+async def test_get_events_paginated_event_and_state_same_time(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test logbook get_events pages through an event and a state at the same time."""
+    start = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    await hass.async_block_till_done()
+    freezer.tick(1)
+    logbook.async_log_entry(hass, "Kitchen", "was cleaned", entity_id="light.kitchen")
+    hass.states.async_set("light.kitchen", STATE_ON)
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    pages = []
+    cursor = None
+    for msg_id in range(1, 10):
+        request = {
+            "id": msg_id,
+            "type": "logbook/get_events",
+            "start_time": start.isoformat(),
+            "entity_ids": ["light.kitchen"],
+            "limit": 1,
+        }
+        if cursor is not None:
+            request["cursor"] = cursor
+        await client.send_json(request)
+        response = await client.receive_json()
+        assert response["success"]
+        pages.append(response["result"]["events"])
+        if (cursor := response["result"]["cursor"]) is None:
+            break
+
+    # Rows at the same time are paged events first, then states
+    assert [[event.get("message") for event in page] for page in pages[:2]] == [
+        ["was cleaned"],
+        [None],
+    ]
+    assert pages[1][0]["state"] == STATE_ON
+    assert pages[0][0]["when"] == pages[1][0]["when"]
+    assert not any(page for page in pages[2:])
+
+
+async def test_get_events_paginated_parent_context_before_period(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test a page links a parent context which started before the period."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation", "script")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    context = core.Context(
+        id="01GTDGKBCH00GW0X476W5TVAAA",
+        user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    child_context = core.Context(
+        id="01GTDGKBCH00GW0X476W5TVDDD",
+        parent_id="01GTDGKBCH00GW0X476W5TVAAA",
+        user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    start_time = dt_util.utcnow()
+    with freeze_time(start_time - timedelta(minutes=5)):
+        hass.states.async_set("light.switch", STATE_OFF)
+        hass.bus.async_fire(
+            EVENT_AUTOMATION_TRIGGERED,
+            {ATTR_NAME: "Mock automation", ATTR_ENTITY_ID: "automation.alarm"},
+            context=context,
+        )
+        await async_wait_recording_done(hass)
+
+    hass.states.async_set("light.switch", STATE_ON, context=child_context)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {
+            "type": "logbook/get_events",
+            "start_time": start_time.isoformat(),
+            "limit": 10,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    json_dict = response["result"]["events"]
+
+    assert len(json_dict) == 1
+    assert json_dict[0]["entity_id"] == "light.switch"
+    assert json_dict[0]["context_event_type"] == "automation_triggered"
+    assert json_dict[0]["context_entity_id"] == "automation.alarm"
+    assert json_dict[0]["context_user_id"] == "b400facee45711eaa9308bfd3d19e474"
+
+
+async def test_get_events_paginated_automation_run_before_period(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test a page links an automation run triggered before the period."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    assert await async_setup_component(
+        hass, "input_boolean", {"input_boolean": {"test": None}}
+    )
+    assert await async_setup_component(
+        hass,
+        "automation",
+        {
+            "automation": {
+                "alias": "Mock automation",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": [
+                    {
+                        "wait_for_trigger": {
+                            "platform": "event",
+                            "event_type": "continue_event",
+                        }
+                    },
+                    {
+                        "service": "input_boolean.turn_on",
+                        "target": {"entity_id": "input_boolean.test"},
+                    },
+                ],
+            }
+        },
+    )
+    await async_recorder_block_till_done(hass)
+
+    start_time = dt_util.utcnow()
+    with freeze_time(start_time - timedelta(minutes=5)):
+        hass.bus.async_fire("test_event")
+        await async_wait_recording_done(hass)
+
+    hass.bus.async_fire("continue_event")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {
+            "type": "logbook/get_events",
+            "start_time": start_time.isoformat(),
+            "limit": 10,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    json_dict = response["result"]["events"]
+
+    assert len(json_dict) == 1
+    assert json_dict[0]["entity_id"] == "input_boolean.test"
+    assert json_dict[0]["state"] == "on"
+    assert json_dict[0]["context_event_type"] == "automation_triggered"
+    assert json_dict[0]["context_entity_id"] == "automation.mock_automation"
+    assert json_dict[0]["context_name"] == "Mock automation"
+
+
 async def test_get_events_entities_filtered_away(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -17,6 +17,7 @@ from homeassistant.components.stream.const import (
     NUM_PLAYLIST_SEGMENTS,
 )
 from homeassistant.components.stream.core import Orientation, Part
+from homeassistant.components.stream.hls import HlsPlaylistView
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -383,6 +384,51 @@ async def test_hls_playlist_view(
     await stream.stop()
 
 
+async def test_hls_playlist_and_segment_reuse(
+    hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
+) -> None:
+    """Test the playlist is rendered once per change and segments are sent by part."""
+    stream = create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+    for i in range(2):
+        segment = Segment(sequence=i, duration=SEGMENT_DURATION)
+        hls.put(segment)
+    await hass.async_block_till_done()
+
+    hls_client = await hls_stream(stream)
+
+    with patch.object(
+        HlsPlaylistView, "render", wraps=HlsPlaylistView.render
+    ) as mock_render:
+        for _ in range(2):
+            resp = await hls_client.get("/playlist.m3u8")
+            assert resp.status == HTTPStatus.OK
+        assert mock_render.call_count == 1
+
+        segment = Segment(sequence=2, duration=SEGMENT_DURATION)
+        hls.put(segment)
+        await hass.async_block_till_done()
+        resp = await hls_client.get("/playlist.m3u8")
+        assert resp.status == HTTPStatus.OK
+        assert await resp.text() == make_playlist(
+            sequence=0, segments=[make_segment(0), make_segment(1), make_segment(2)]
+        )
+        assert mock_render.call_count == 2
+
+    segment.parts = [
+        Part(duration=SEGMENT_DURATION / 2, has_keyframe=True, data=b"first"),
+        Part(duration=SEGMENT_DURATION / 2, has_keyframe=False, data=b"second"),
+    ]
+    resp = await hls_client.get("/segment/2.m4s")
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["Content-Length"] == str(len(b"firstsecond"))
+    assert await resp.read() == segment.get_data() == b"firstsecond"
+
+    stream_worker_sync.resume()
+    await stream.stop()
+
+
 async def test_hls_max_segments(
     hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
 ) -> None:
@@ -20,7 +20,7 @@ import logging
 import math
 from pathlib import Path
 import threading
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import av
 import numpy as np
@@ -1018,6 +1018,73 @@ async def test_get_image(hass: HomeAssistant, h264_video, filename) -> None:
     await stream.stop()
 
 
+async def test_get_image_reused_until_next_keyframe(hass: HomeAssistant) -> None:
+    """Test images are generated once per keyframe and size."""
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton"
+    ) as mock_turbo_jpeg_singleton:
+        turbo_jpeg = mock_turbo_jpeg_singleton.instance.return_value = mock_turbo_jpeg()
+        converter = KeyFrameConverter(hass, None, dynamic_stream_settings())
+
+    frame = Mock()
+    frame.reformat.return_value = frame
+    frame.to_ndarray.return_value = np.zeros((6, 8, 3))
+    converter._codec_context = Mock()
+    converter._codec_context.decode.return_value = [frame]
+
+    assert await converter.async_get_image() is None
+
+    converter.stash_keyframe_packet(Mock())
+    assert await converter.async_get_image() == EMPTY_8_6_JPEG
+    assert await converter.async_get_image() == EMPTY_8_6_JPEG
+    assert converter._codec_context.decode.call_count == 1
+    assert turbo_jpeg.encode.call_count == 1
+
+    # Other sizes are generated from the decoded keyframe
+    assert await converter.async_get_image(width=4, height=3) == EMPTY_8_6_JPEG
+    assert await converter.async_get_image(width=4, height=3) == EMPTY_8_6_JPEG
+    assert converter._codec_context.decode.call_count == 1
+    assert turbo_jpeg.encode.call_count == 2
+    frame.reformat.assert_called_once_with(width=4, height=3)
+
+    converter.stash_keyframe_packet(Mock())
+    assert await converter.async_get_image() == EMPTY_8_6_JPEG
+    assert converter._codec_context.decode.call_count == 2
+    assert turbo_jpeg.encode.call_count == 3
+
+
+async def test_get_image_decode_failure_after_success(hass: HomeAssistant) -> None:
+    """Test the image of the last decoded keyframe is kept if a decode fails."""
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton"
+    ) as mock_turbo_jpeg_singleton:
+        turbo_jpeg = mock_turbo_jpeg_singleton.instance.return_value = mock_turbo_jpeg()
+        converter = KeyFrameConverter(hass, None, dynamic_stream_settings())
+
+    frame = Mock()
+    frame.reformat.return_value = frame
+    frame.to_ndarray.return_value = np.zeros((6, 8, 3))
+    converter._codec_context = Mock()
+    converter._codec_context.decode.return_value = [frame]
+
+    converter.stash_keyframe_packet(Mock())
+    assert await converter.async_get_image() == EMPTY_8_6_JPEG
+    assert turbo_jpeg.encode.call_count == 1
+
+    converter._codec_context.decode.side_effect = EOFError
+    converter.stash_keyframe_packet(Mock())
+    assert await converter.async_get_image() == EMPTY_8_6_JPEG
+    assert converter._codec_context.decode.call_count == 3
+    assert converter._codec_context.open.call_count == 2
+    assert turbo_jpeg.encode.call_count == 1
+
+    # Other sizes are still generated from the last decoded keyframe
+    assert await converter.async_get_image(width=4, height=3) == EMPTY_8_6_JPEG
+    assert converter._codec_context.decode.call_count == 3
+    assert turbo_jpeg.encode.call_count == 2
+    frame.reformat.assert_called_once_with(width=4, height=3)
+
+
 async def test_worker_disable_ll_hls(hass: HomeAssistant) -> None:
     """Test that the worker disables ll-hls for hls inputs."""
     stream_settings = StreamSettings(
@@ -43,7 +43,13 @@ async def _setup_automation_or_script(
 ):
     """Set up automations or scripts from automation config."""
     if domain == "script":
-        configs = {config["id"]: {"sequence": config["action"]} for config in configs}
+        configs = {
+            config["id"]: {
+                "sequence": config["action"],
+                **({"trace": config["trace"]} if "trace" in config else {}),
+            }
+            for config in configs
+        }
 
     if script_config:
         if domain == "automation":
@@ -592,6 +598,120 @@ async def test_trace_overflow(
     assert len(_find_traces(response["result"], domain, "sun")) == 1
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_policy(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain: str
+) -> None:
+    """Test the trace policy decides which runs are traced."""
+    sampled_config = {
+        "id": "sampled",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+        "trace": {"policy": "sampled", "sample_rate": 3},
+    }
+    off_config = {
+        "id": "off",
+        "trigger": {"platform": "event", "event_type": "test_event2"},
+        "action": {"event": "another_event"},
+        "trace": {"policy": "off"},
+    }
+    await _setup_automation_or_script(hass, domain, [sampled_config, off_config])
+
+    client = await hass_ws_client()
+
+    for _ in range(4):
+        await _run_automation_or_script(hass, domain, sampled_config, "test_event")
+        await _run_automation_or_script(hass, domain, off_config, "test_event2")
+        await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(_find_traces(response["result"], domain, "sampled")) == 2
+    assert len(_find_traces(response["result"], domain, "off")) == 0
+
+    await client.send_json(
+        {"id": 2, "type": "trace/stats", "domain": domain, "item_id": "sampled"}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "policy": "sampled",
+        "sample_rate": 3,
+        "runs": 4,
+        "traced_runs": 2,
+    }
+
+    await client.send_json(
+        {"id": 3, "type": "trace/stats", "domain": domain, "item_id": "off"}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["runs"] == 4
+    assert response["result"]["traced_runs"] == 0
+
+    await client.send_json(
+        {"id": 4, "type": "trace/stats", "domain": domain, "item_id": "unknown"}
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
+
+    # The counters are dropped with the removed scripts or automations
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={domain: [] if domain == "automation" else {}},
+    ):
+        await hass.services.async_call(domain, "reload", blocking=True)
+
+    await client.send_json(
+        {"id": 5, "type": "trace/stats", "domain": domain, "item_id": "sampled"}
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
+
+
+async def test_trace_policy_errors(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test only failed runs are stored with the errors trace policy."""
+    config = {
+        "id": "errors",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {
+            "if": {
+                "condition": "template",
+                "value_template": "{{ trigger.event.data.fail }}",
+            },
+            "then": {"stop": "Failed", "error": True},
+        },
+        "trace": {"policy": "errors"},
+    }
+    await _setup_automation_or_script(hass, "automation", [config])
+
+    client = await hass_ws_client()
+
+    for fail in (False, True, False):
+        hass.bus.async_fire("test_event", {"fail": fail})
+        await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": "automation"})
+    response = await client.receive_json()
+    assert response["success"]
+    traces = _find_traces(response["result"], "automation", "errors")
+    assert len(traces) == 1
+    assert traces[0]["script_execution"] == "error"
+
+    await client.send_json(
+        {"id": 2, "type": "trace/stats", "domain": "automation", "item_id": "errors"}
+    )
+    response = await client.receive_json()
+    assert response["result"]["runs"] == 3
+    assert response["result"]["traced_runs"] == 1
+
+
 @pytest.mark.parametrize(
     ("domain", "num_restored_moon_traces"), [("automation", 3), ("script", 1)]
 )
@@ -1,10 +1,13 @@
 """The tests for the TTS component."""
 
+import array
 import asyncio
 from http import HTTPStatus
+import io
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
+import wave
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
@@ -38,7 +41,7 @@ from .common import (
     retrieve_media,
 )
 
-from tests.common import async_mock_service, mock_restore_cache
+from tests.common import async_fire_time_changed, async_mock_service, mock_restore_cache
 from tests.typing import ClientSessionGenerator, WebSocketGenerator
 
 ORIG_WRITE_TAGS = tts.SpeechManager.write_tags
@@ -1493,6 +1496,69 @@ async def test_legacy_fetching_in_async(
     )
 
 
+async def test_mem_cache_size_bounded(hass: HomeAssistant) -> None:
+    """Test the least recently used voices cached on disk are evicted."""
+    calls: list[str] = []
+
+    class ProviderCounting(MockProvider):
+        """Provider that counts generated messages."""
+
+        def get_tts_audio(
+            self, message: str, language: str, options: dict[str, Any]
+        ) -> tts.TtsAudioType:
+            calls.append(message)
+            return ("mp3", b"x" * 100)
+
+    await mock_setup(hass, ProviderCounting(DEFAULT_LANG))
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+
+    with patch("homeassistant.components.tts.MEM_CACHE_MAX_BYTES", 250):
+        for message in ("one", "two", "one", "three"):
+            await manager.async_get_tts_audio("test", message, cache=True)
+            await hass.async_block_till_done()
+        assert calls == ["one", "two", "three"]
+        assert len(manager.mem_cache) == 2
+
+        # "two" was the least recently used voice, it is read from disk again
+        await manager.async_get_tts_audio("test", "two", cache=True)
+        assert calls == ["one", "two", "three"]
+        assert len(manager.mem_cache) == 2
+
+        # Voices which are not cached on disk are kept
+        for message in ("four", "five", "six"):
+            await manager.async_get_tts_audio("test", message, cache=False)
+            await hass.async_block_till_done()
+        assert len(manager.mem_cache) == 3
+        for message in ("four", "five", "six"):
+            await manager.async_get_tts_audio("test", message, cache=False)
+        assert calls == ["one", "two", "three", "four", "five", "six"]
+
+
+async def test_mem_cache_timer_replaced(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a voice stored again in memory is kept for the full memory time."""
+    await mock_setup(hass, MockProvider(DEFAULT_LANG))
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+    time_memory = manager.time_memory
+
+    manager._async_store_to_memcache("key", "key.mp3", b"voice")
+    freezer.tick(time_memory - 1)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    manager._async_store_to_memcache("key", "key.mp3", b"voice")
+
+    freezer.tick(2)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert "key" in manager.mem_cache
+
+    freezer.tick(time_memory)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert "key" not in manager.mem_cache
+
+
 async def test_fetching_in_async(
     hass: HomeAssistant, hass_client: ClientSessionGenerator
 ) -> None:
@@ -1750,6 +1816,62 @@ async def test_async_convert_audio_error(hass: HomeAssistant) -> None:
         await tts.async_convert_audio(hass, "wav", bytes(0), "mp3")
 
 
+async def test_async_convert_wav_in_process(hass: HomeAssistant) -> None:
+    """Test WAV audio is mixed and upsampled without ffmpeg."""
+    samples = array.array("h", [0, 600, 300, 900, 600, 1200])
+    with io.BytesIO() as wav_io:
+        with wave.open(wav_io, "wb") as wav_file:
+            wav_file.setframerate(16000)
+            wav_file.setsampwidth(2)
+            wav_file.setnchannels(2)
+            wav_file.writeframes(samples.tobytes())
+
+        wav_bytes = wav_io.getvalue()
+
+    with patch("homeassistant.components.tts.ffmpeg.get_ffmpeg_manager") as mock_ffmpeg:
+        converted = await tts.async_convert_audio(
+            hass, "wav", wav_bytes, "wav", to_sample_rate=48000, to_sample_channels=1
+        )
+
+    mock_ffmpeg.assert_not_called()
+    with wave.open(io.BytesIO(converted), "rb") as wav_file:
+        assert wav_file.getframerate() == 48000
+        assert wav_file.getsampwidth() == 2
+        assert wav_file.getnchannels() == 1
+        converted_samples = array.array("h", wav_file.readframes(wav_file.getnframes()))
+
+    # Mixed to 300, 600 and 900 and interpolated, the last sample is held
+    assert converted_samples.tolist() == [300, 400, 500, 600, 700, 800, 900, 900, 900]
+
+
+@pytest.mark.parametrize("to_sample_rate", [8000, 22050])
+async def test_async_convert_wav_resampled_with_ffmpeg(
+    hass: HomeAssistant, to_sample_rate: int
+) -> None:
+    """Test WAV audio is resampled by ffmpeg unless upsampled by a whole factor."""
+    with io.BytesIO() as wav_io:
+        with wave.open(wav_io, "wb") as wav_file:
+            wav_file.setframerate(16000)
+            wav_file.setsampwidth(2)
+            wav_file.setnchannels(1)
+            wav_file.writeframes(bytes(16000 * 2))
+
+        wav_bytes = wav_io.getvalue()
+
+    with (
+        patch("homeassistant.components.tts.ffmpeg.get_ffmpeg_manager"),
+        patch(
+            "homeassistant.components.tts._convert_audio", return_value=b"converted"
+        ) as mock_convert,
+    ):
+        converted = await tts.async_convert_audio(
+            hass, "wav", wav_bytes, "wav", to_sample_rate=to_sample_rate
+        )
+
+    assert converted == b"converted"
+    assert mock_convert.call_args.kwargs["to_sample_rate"] == to_sample_rate
+
+
 async def test_ttsentity_subclass_properties(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -1,5 +1,6 @@
 """Test the condition helper."""
 
+import contextvars
 from datetime import datetime, timedelta
 from typing import Any
 from unittest.mock import AsyncMock, patch
@@ -276,6 +277,57 @@ async def test_and_condition_with_template(hass: HomeAssistant) -> None:
     assert test(hass)
 
 
+async def test_untraced_conditions_evaluated_by_cost(hass: HomeAssistant) -> None:
+    """Test cheap conditions are evaluated first when tracing is disabled."""
+    config = {
+        "condition": "and",
+        "conditions": [
+            {
+                "condition": "template",
+                "value_template": '{{ states.sensor.temperature.state == "100" }}',
+            },
+            {
+                "condition": "and",
+                "conditions": [
+                    {
+                        "condition": "state",
+                        "entity_id": "sensor.temperature",
+                        "state": "100",
+                    },
+                    {"condition": "state", "entity_id": "sensor.x", "state": "on"},
+                ],
+            },
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    # Disable tracing in a copy of the context to not leak into other tests
+    context = contextvars.copy_context()
+    context.run(trace.trace_disable)
+
+    hass.states.async_set("sensor.x", "on")
+    with patch.object(
+        condition, "async_template", wraps=condition.async_template
+    ) as mock_template:
+        hass.states.async_set("sensor.temperature", 120)
+        assert not context.run(test, hass)
+        assert mock_template.call_count == 0
+
+        hass.states.async_set("sensor.temperature", 100)
+        assert context.run(test, hass)
+        assert mock_template.call_count == 1
+
+        # Errors are reported as if the conditions were evaluated in order
+        hass.states.async_remove("sensor.x")
+        with pytest.raises(ConditionError, match=r"In 'and' \(item 2 of 2\)") as err:
+            context.run(test, hass)
+        assert "unknown entity sensor.x" in str(err.value)
+
+    assert context.run(trace.trace_get, False) is None
+
+
 async def test_and_condition_shorthand(hass: HomeAssistant) -> None:
     """Test the 'and' condition shorthand."""
     config = {
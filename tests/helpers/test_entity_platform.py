@@ -163,6 +163,91 @@ async def test_polling_updates_entities_with_exception(hass: HomeAssistant) -> N
     assert len(update_err) == 1
 
 
+async def test_polling_phase_spread(hass: HomeAssistant) -> None:
+    """Test platforms sharing a scan interval are shifted against each other."""
+    platforms = [
+        MockEntityPlatform(
+            hass, platform_name=f"platform_{idx}", scan_interval=timedelta(seconds=30)
+        )
+        for idx in range(3)
+    ]
+
+    with patch.object(hass.loop, "call_later") as mock_call_later:
+        for platform in platforms:
+            await platform.async_add_entities([MockEntity(should_poll=True)])
+
+    delays = [
+        args[0]
+        for args, _ in mock_call_later.call_args_list
+        if args[1].__name__ == "_async_handle_interval_callback"
+    ]
+    assert delays[0] == 30.0
+    assert len(set(delays)) == 3
+    assert all(0 < delay <= 30.0 for delay in delays)
+
+    # A platform which resets releases its slot for the next platform
+    await platforms[1].async_reset()
+    assert hass.data[entity_platform.DATA_POLLING_PHASES][30.0] == {0, 2}
+    platform = MockEntityPlatform(
+        hass, platform_name="platform_3", scan_interval=timedelta(seconds=30)
+    )
+    with patch.object(hass.loop, "call_later") as mock_call_later:
+        await platform.async_add_entities([MockEntity(should_poll=True)])
+    assert [
+        args[0]
+        for args, _ in mock_call_later.call_args_list
+        if args[1].__name__ == "_async_handle_interval_callback"
+    ] == [delays[1]]
+    assert hass.data[entity_platform.DATA_POLLING_PHASES][30.0] == {0, 1, 2}
+
+    for platform in (platforms[0], platforms[2], platform):
+        await platform.async_reset()
+    assert hass.data[entity_platform.DATA_POLLING_PHASES] == {}
+
+
+async def test_polling_stats(hass: HomeAssistant) -> None:
+    """Test polling durations and overruns are recorded."""
+    config_entry = MockConfigEntry(domain="test")
+    config_entry.add_to_hass(hass)
+    platform = MockEntityPlatform(hass, platform_name="test")
+    platform.config_entry = config_entry
+    ent = MockEntity(should_poll=True)
+    ent.async_update = AsyncMock()
+    await platform.async_add_entities([ent])
+
+    assert (
+        entity_platform.async_get_polling_report(hass, "test", config_entry.entry_id)
+        == {}
+    )
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=15))
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert platform.polling_stats.updates == 1
+    assert platform.polling_stats.overruns == 0
+
+    update_started = asyncio.Event()
+    finish_update = asyncio.Event()
+
+    async def _slow_update() -> None:
+        update_started.set()
+        await finish_update.wait()
+
+    ent.async_update = _slow_update
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
+    await update_started.wait()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=45))
+    await hass.async_block_till_done()
+    finish_update.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    report = entity_platform.async_get_polling_report(
+        hass, "test", config_entry.entry_id
+    )
+    assert report["test_domain"]["updates"] == 2
+    assert report["test_domain"]["overruns"] == 1
+    assert report["test_domain"]["average_duration"] is not None
+
+
 async def test_update_state_adds_entities(hass: HomeAssistant) -> None:
     """Test if updating poll entities cause an entity to be added works."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
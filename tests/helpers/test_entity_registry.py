@@ -1863,6 +1863,69 @@ async def test_removing_labels(entity_registry: er.EntityRegistry) -> None:
     assert not entry_cleared_label2.labels
 
 
+async def test_entries_matching(entity_registry: er.EntityRegistry) -> None:
+    """Test getting entity entries matching indexed fields."""
+    hue_light = entity_registry.async_get_or_create("light", "hue", "123")
+    hue_sensor = entity_registry.async_get_or_create(
+        "sensor", "hue", "456", entity_category=EntityCategory.DIAGNOSTIC
+    )
+    zha_light = entity_registry.async_get_or_create(
+        "light", "zha", "789", disabled_by=er.RegistryEntryDisabler.USER
+    )
+    entities = entity_registry.entities
+
+    assert entities.get_entries_matching(platform="hue") == [hue_light, hue_sensor]
+    assert entities.get_entries_matching(domain="light") == [hue_light, zha_light]
+    assert entities.get_entries_matching(domain="light", disabled_by=None) == [
+        hue_light
+    ]
+    assert entities.get_entries_matching(entity_category=EntityCategory.DIAGNOSTIC) == [
+        hue_sensor
+    ]
+    assert entities.get_entries_matching(platform="mqtt") == []
+    assert entities.get_entries_matching() == [hue_light, hue_sensor, zha_light]
+
+    # Indexes follow updates and removals
+    zha_light = entity_registry.async_update_entity(
+        zha_light.entity_id, disabled_by=None
+    )
+    assert entities.get_entries_matching(domain="light", disabled_by=None) == [
+        hue_light,
+        zha_light,
+    ]
+    entity_registry.async_remove(hue_light.entity_id)
+    assert entities.get_entries_matching(domain="light") == [zha_light]
+
+    with pytest.raises(ValueError, match="is not indexed"):
+        entities.get_entries_matching(area_id="kitchen")
+
+
+async def test_display_json_order(entity_registry: er.EntityRegistry) -> None:
+    """Test the display JSON keeps the order of the registry across updates."""
+    entries = [
+        entity_registry.async_get_or_create("light", "hue", unique_id)
+        for unique_id in ("123", "456", "789")
+    ]
+    entity_registry.async_get_or_create(
+        "light", "hue", "000", disabled_by=er.RegistryEntryDisabler.USER
+    )
+    entities = entity_registry.entities
+    _, display_json = entities.get_display_json()
+    assert display_json == b",".join(entry.display_json_repr for entry in entries)
+
+    entity_registry.async_update_entity(
+        entries[0].entity_id, disabled_by=er.RegistryEntryDisabler.USER
+    )
+    entries[0] = entity_registry.async_update_entity(
+        entries[0].entity_id, disabled_by=None
+    )
+    _, updated_display_json = entities.get_display_json()
+    assert updated_display_json == b",".join(
+        entry.display_json_repr for entry in entries
+    )
+    assert updated_display_json == display_json
+
+
 async def test_entries_for_label(entity_registry: er.EntityRegistry) -> None:
     """Test getting entity entries by label."""
     entity_registry.async_get_or_create(
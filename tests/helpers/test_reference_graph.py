@@ -0,0 +1,56 @@
+"""Tests for the reference graph helper."""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import reference_graph
+from homeassistant.helpers.reference_graph import ReferenceType
+
+
+async def test_set_and_remove_references(hass: HomeAssistant) -> None:
+    """Test references are indexed per domain and can be replaced and removed."""
+    graph = reference_graph.async_get(hass)
+    assert reference_graph.async_get(hass) is graph
+
+    graph.async_set_references(
+        "automation.one",
+        {
+            ReferenceType.ENTITY: ["light.kitchen", "light.hallway"],
+            ReferenceType.AREA: ["kitchen"],
+        },
+    )
+    graph.async_set_references(
+        "automation.two", {ReferenceType.ENTITY: ["light.kitchen"]}
+    )
+    graph.async_set_references("script.one", {ReferenceType.ENTITY: ["light.kitchen"]})
+
+    assert sorted(
+        graph.async_get_referencing("automation", ReferenceType.ENTITY, "light.kitchen")
+    ) == ["automation.one", "automation.two"]
+    assert graph.async_get_referencing(
+        "script", ReferenceType.ENTITY, "light.kitchen"
+    ) == ["script.one"]
+    assert graph.async_get_referencing("automation", ReferenceType.AREA, "kitchen") == [
+        "automation.one"
+    ]
+    assert graph.async_get_referencing("automation", ReferenceType.DEVICE, "abc") == []
+    assert graph.async_get_references("automation.one", ReferenceType.AREA) == [
+        "kitchen"
+    ]
+
+    # Setting references again replaces the earlier ones
+    graph.async_set_references("automation.one", {ReferenceType.AREA: ["hallway"]})
+    assert graph.async_get_referencing(
+        "automation", ReferenceType.ENTITY, "light.kitchen"
+    ) == ["automation.two"]
+    assert (
+        graph.async_get_referencing("automation", ReferenceType.ENTITY, "light.hallway")
+        == []
+    )
+    assert graph.async_get_references("automation.one", ReferenceType.ENTITY) == []
+
+    graph.async_remove_references("automation.two")
+    graph.async_remove_references("automation.unknown")
+    assert (
+        graph.async_get_referencing("automation", ReferenceType.ENTITY, "light.kitchen")
+        == []
+    )
+    assert graph.async_get_references("automation.two", ReferenceType.ENTITY) == []
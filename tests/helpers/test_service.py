@@ -749,6 +749,32 @@ async def test_extract_entity_ids_from_floor(hass: HomeAssistant) -> None:
     )
 
 
+async def test_extract_entity_ids_cache_invalidated(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test resolved targets are cached until the registries change."""
+    area = area_registry.async_create("Kitchen")
+    entity_registry.async_get_or_create(
+        "light", "hue", "1234", suggested_object_id="ceiling"
+    )
+    call = ServiceCall("light", "turn_on", {"area_id": area.id})
+
+    assert await service.async_extract_entity_ids(hass, call) == set()
+
+    entity_registry.async_update_entity("light.ceiling", area_id=area.id)
+    assert await service.async_extract_entity_ids(hass, call) == {"light.ceiling"}
+
+    # Modifying the returned selection does not modify the cached targets
+    referenced = service.async_extract_referenced_entity_ids(hass, call)
+    referenced.indirectly_referenced.add("light.other")
+    assert await service.async_extract_entity_ids(hass, call) == {"light.ceiling"}
+
+    area_registry.async_delete(area.id)
+    assert await service.async_extract_entity_ids(hass, call) == set()
+
+
 @pytest.mark.usefixtures("label_mock")
 async def test_extract_entity_ids_from_labels(hass: HomeAssistant) -> None:
     """Test extract_entity_ids method with labels."""
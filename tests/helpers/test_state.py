@@ -138,6 +138,35 @@ async def test_reproduce_bad_state(hass: HomeAssistant) -> None:
     assert hass.states.get("light.test").state == "off"
 
 
+async def test_reproduce_merges_service_calls(hass: HomeAssistant) -> None:
+    """Test entities reproduced with the same service data share a service call."""
+    calls = async_mock_service(hass, "light", SERVICE_TURN_ON)
+
+    for entity_id in ("light.one", "light.two", "light.three"):
+        hass.states.async_set(entity_id, "off")
+
+    await state.async_reproduce_state(
+        hass,
+        [
+            State("light.one", "on", {"brightness": 100, "hs_color": [30, 50]}),
+            State("light.two", "on", {"brightness": 200}),
+            State("light.three", "on", {"brightness": 100, "hs_color": [30, 50]}),
+        ],
+    )
+
+    assert len(calls) == 2
+    assert sorted(
+        (call.data for call in calls), key=lambda data: data["brightness"]
+    ) == [
+        {
+            "entity_id": ["light.one", "light.three"],
+            "brightness": 100,
+            "hs_color": [30, 50],
+        },
+        {"entity_id": "light.two", "brightness": 200},
+    ]
+
+
 async def test_as_number_states(hass: HomeAssistant) -> None:
     """Test state_as_number with states."""
     zero_states = (
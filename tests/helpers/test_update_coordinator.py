@@ -1,5 +1,6 @@
 """Tests for the update coordinator."""
 
+import asyncio
 from datetime import datetime, timedelta
 import logging
 from unittest.mock import AsyncMock, Mock, patch
@@ -747,3 +748,157 @@ async def test_timestamp_date_update_coordinator(hass: HomeAssistant) -> None:
     unsub()
     await crd.async_refresh()
     assert len(last_update_success_times) == 1
+
+
+async def test_coordinator_group_aligns_refreshes(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test coordinators in a group are refreshed in a shared cycle, one at a time."""
+    group = update_coordinator.async_get_coordinator_group(hass, "hub.local")
+    assert update_coordinator.async_get_coordinator_group(hass, "hub.local") is group
+
+    running = 0
+    max_running = 0
+
+    def make_coordinator(
+        update_interval: timedelta,
+    ) -> update_coordinator.DataUpdateCoordinator[int]:
+        calls = 0
+
+        async def refresh() -> int:
+            nonlocal calls, running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0)
+            running -= 1
+            calls += 1
+            return calls
+
+        # Integrations often use the same name for all their coordinators
+        return update_coordinator.DataUpdateCoordinator[int](
+            hass,
+            _LOGGER,
+            name="hub",
+            update_method=refresh,
+            update_interval=update_interval,
+            group=group,
+        )
+
+    entry = MockConfigEntry()
+    token = config_entries.current_entry.set(entry)
+    try:
+        coordinators = [
+            make_coordinator(timedelta(seconds=30)),
+            make_coordinator(timedelta(seconds=30)),
+            make_coordinator(timedelta(seconds=45)),
+        ]
+    finally:
+        config_entries.current_entry.reset(token)
+    for coordinator in coordinators:
+        coordinator.async_add_listener(Mock())
+
+    freezer.tick(timedelta(seconds=30))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert [coordinator.data for coordinator in coordinators] == [1, 1, None]
+    assert max_running == 1
+
+    # The 45 second coordinator is aligned to the cycle at 60 seconds
+    freezer.tick(timedelta(seconds=15))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert [coordinator.data for coordinator in coordinators] == [1, 1, None]
+
+    freezer.tick(timedelta(seconds=15))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert [coordinator.data for coordinator in coordinators] == [2, 2, 1]
+    assert max_running == 1
+
+    stats = group.async_get_stats()
+    assert len(stats) == 3
+    assert stats[0]["name"] == "hub"
+    assert stats[0]["config_entry_id"] == entry.entry_id
+    assert stats[0]["refreshes"] == 2
+    assert stats[0]["failures"] == 0
+    assert stats[0]["average_latency"] is not None
+    assert stats[2]["refreshes"] == 1
+
+    await coordinators[0].async_shutdown()
+    assert len(group.async_get_stats()) == 2
+
+    # The group is dropped once all its coordinators are shut down
+    for coordinator in coordinators[1:]:
+        await coordinator.async_shutdown()
+    assert "hub.local" not in hass.data[update_coordinator.DATA_COORDINATOR_GROUPS]
+    assert (
+        update_coordinator.async_get_coordinator_group(hass, "hub.local") is not group
+    )
+
+
+async def test_coordinator_group_skips_recent_refresh(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a scheduled refresh is skipped if the coordinator refreshed recently."""
+    group = update_coordinator.async_get_coordinator_group(
+        hass, "cloud account", min_refresh_interval=timedelta(minutes=1)
+    )
+    update_method = AsyncMock(side_effect=[1, 2, update_coordinator.UpdateFailed])
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        name="test",
+        update_method=update_method,
+        update_interval=DEFAULT_UPDATE_INTERVAL,
+        group=group,
+    )
+    crd.async_add_listener(Mock())
+    await crd.async_refresh()
+    assert crd.data == 1
+
+    freezer.tick(DEFAULT_UPDATE_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert crd.data == 1
+    assert group.async_get_stats()[0]["skipped"] == 1
+
+    # Explicit refreshes are not rate limited
+    await crd.async_refresh()
+    await crd.async_refresh()
+    assert crd.data == 2
+    assert group.async_get_stats()[0]["failures"] == 1
+    assert group.async_get_stats()[0]["refreshes"] == 3
+
+
+async def test_coordinator_group_not_rejoined_after_shutdown(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a coordinator which was shut down does not rejoin its group."""
+    group = update_coordinator.async_get_coordinator_group(hass, "hub.local")
+    update_method = AsyncMock(return_value=1)
+    crds = [
+        update_coordinator.DataUpdateCoordinator[int](
+            hass,
+            _LOGGER,
+            name=name,
+            update_method=update_method,
+            update_interval=DEFAULT_UPDATE_INTERVAL,
+            group=group,
+        )
+        for name in ("first", "second")
+    ]
+    for crd in crds:
+        crd.async_add_listener(Mock())
+
+    await crds[0].async_shutdown()
+    crds[0]._schedule_refresh()
+    await crds[0].async_refresh()
+    assert [stats["name"] for stats in group.async_get_stats()] == ["second"]
+
+    freezer.tick(DEFAULT_UPDATE_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert [stats["name"] for stats in group.async_get_stats()] == ["second"]
+    assert group.async_get_stats()[0]["refreshes"] == 1